@@ -38,16 +38,44 @@ if ($api_key !== MOLTBOOK_LOCAL_AGENT_BLOG_API_KEY) {
     exit;
 }
 
-$input = file_get_contents('php://input');
-write_logs("Received payload size: " . strlen($input) . " bytes");
+$content_type = $_SERVER['CONTENT_TYPE'] ?? '';
 
-$data = json_decode($input, true);
+if (stripos($content_type, 'multipart/form-data') === 0) {
+    $data = $_POST;
+    $upload = $_FILES['image'] ?? null;
 
-if (!$data) {
-    write_logs("JSON Decode Error: " . json_last_error_msg());
-    http_response_code(400);
-    echo json_encode(['success' => false, 'error' => 'Invalid JSON: ' . json_last_error_msg()]);
-    exit;
+    if (!$upload || $upload['error'] !== UPLOAD_ERR_OK) {
+        write_logs("Upload Error: " . ($upload['error'] ?? 'no image file'));
+        http_response_code(400);
+        echo json_encode(['success' => false, 'error' => 'Missing or failed image upload']);
+        exit;
+    }
+
+    write_logs("Received multipart payload with image of " . $upload['size'] . " bytes");
+
+    $allowed_mime_types = ['image/png', 'image/jpeg', 'image/webp'];
+    $finfo = new finfo(FILEINFO_MIME_TYPE);
+    $mime_type = $finfo->file($upload['tmp_name']);
+
+    if (!in_array($mime_type, $allowed_mime_types, true)) {
+        http_response_code(400);
+        echo json_encode(['success' => false, 'error' => 'Invalid image type (png, jpeg or webp only)']);
+        exit;
+    }
+
+    $data['image_data'] = 'data:' . $mime_type . ';base64,' . base64_encode(file_get_contents($upload['tmp_name']));
+} else {
+    $input = file_get_contents('php://input');
+    write_logs("Received payload size: " . strlen($input) . " bytes");
+
+    $data = json_decode($input, true);
+
+    if (!$data) {
+        write_logs("JSON Decode Error: " . json_last_error_msg());
+        http_response_code(400);
+        echo json_encode(['success' => false, 'error' => 'Invalid JSON: ' . json_last_error_msg()]);
+        exit;
+    }
 }
 
 $required_fields = ['title', 'excerpt', 'content', 'image_data'];
@@ -54,6 +54,10 @@ function showNotification(success, text) {
         <div class="notification-text">${marked.parse(text)}</div>
     `;
 
+  presentNotification(notif, success);
+}
+
+function presentNotification(notif, success) {
   document.body.appendChild(notif);
 
   playSound(success ? 800 : 400, 0.3);
@@ -90,9 +94,42 @@ socket.on("agent_event", (event) => {
     case "action_result":
       handleActionResult(event.data);
       break;
+    case "new_mail":
+      handleNewMail(event.data);
+      break;
   }
 });
 
+function handleNewMail(data) {
+  const notif = document.createElement("div");
+  notif.className = "notification success";
+
+  const icon = document.createElement("div");
+  icon.className = "notification-icon";
+  icon.textContent = "📩";
+
+  const text = document.createElement("div");
+  text.className = "notification-text";
+  const title = document.createElement("strong");
+  title.textContent = `New mail (${data.unread} unread)`;
+  text.appendChild(title);
+
+  const list = document.createElement("ul");
+  for (const m of data.messages) {
+    const item = document.createElement("li");
+    const sender = document.createElement("strong");
+    sender.textContent = m.from || "Unknown";
+    item.appendChild(sender);
+    item.appendChild(document.createTextNode(`: ${m.subject || "(No Subject)"}`));
+    list.appendChild(item);
+  }
+  text.appendChild(list);
+
+  notif.appendChild(icon);
+  notif.appendChild(text);
+  presentNotification(notif, true);
+}
+
 function handleScreenUpdate(data) {
   screenDisplay.innerHTML =
     marked.parse(data.screen_content) + '<span class="cursor"></span>';
@@ -14,12 +14,28 @@ from src.providers.ollama_provider import OllamaProvider
 from src.providers.gemini_provider import GeminiProvider
 from src.providers.openrouter_provider import OpenRouterProvider
 from src.settings import settings
+from src.tests.blog_publish_tests import BlogPublishTestSuite
+from src.tests.database_tests import DatabaseTestSuite
 from src.tests.global_tests import GlobalTestSuite
+from src.tests.image_cache_tests import ImageCacheTestSuite
+from src.tests.image_queue_tests import ImageQueueTestSuite
+from src.tests.imap_session_tests import ImapSessionTestSuite
+from src.tests.mail_mirror_tests import MailMirrorTestSuite
+from src.tests.mail_watcher_tests import MailWatcherTestSuite
 from src.tests.memory_tests import MemoryTestSuite
+from src.tests.ollama_gateway_tests import OllamaGatewayTestSuite
+from src.tests.ollama_proxy_tests import OllamaProxyTestSuite
 from src.tests.moltbook_tests import MoltbookLiveTester
 from src.tests.plan_tests import PlanTestSuite
+from src.tests.progression_tests import ProgressionTestSuite
+from src.tests.prompt_cache_tests import PromptCacheTestSuite
+from src.tests.research_index_tests import ResearchIndexTestSuite
 from src.tests.research_tests import ResearchTestSuite
+from src.tests.screen_prefetcher_tests import ScreenPrefetcherTestSuite
+from src.tests.sd_provider_tests import SDProviderTestSuite
+from src.tests.smtp_sender_tests import SmtpSenderTestSuite
 from src.tests.social_tests import SocialTestSuite
+from src.tests.ttl_cache_tests import TTLCacheTestSuite
 from src.utils import log
 from src.utils.email_reporter import EmailReporter
 import sys
@@ -43,6 +59,9 @@ def bootstrap(test_mode: bool = False):
         test_mode=test_mode,
     )
 
+    if not test_mode:
+        dispatcher.email_handler.sync_in_background()
+
     progression_system = ProgressionSystem(settings.DB_PATH)
 
     dispatcher.set_progression_system(progression_system)
@@ -97,6 +116,22 @@ def run_unit_tests():
     print("=" * 80)
 
     test_suites = [
+        ("Blog Publish", BlogPublishTestSuite()),
+        ("Database", DatabaseTestSuite()),
+        ("Image Cache", ImageCacheTestSuite()),
+        ("Image Queue", ImageQueueTestSuite()),
+        ("IMAP Session", ImapSessionTestSuite()),
+        ("Mail Mirror", MailMirrorTestSuite()),
+        ("Mail Watcher", MailWatcherTestSuite()),
+        ("Ollama Proxy", OllamaProxyTestSuite()),
+        ("Ollama Gateway", OllamaGatewayTestSuite()),
+        ("SMTP Sender", SmtpSenderTestSuite()),
+        ("Screen Prefetcher", ScreenPrefetcherTestSuite()),
+        ("SD Provider", SDProviderTestSuite()),
+        ("TTL Cache", TTLCacheTestSuite()),
+        ("Progression", ProgressionTestSuite()),
+        ("Prompt Cache", PromptCacheTestSuite()),
+        ("Research Index", ResearchIndexTestSuite()),
         ("Research", ResearchTestSuite()),
         ("Memory", MemoryTestSuite()),
         ("Global Actions", GlobalTestSuite()),
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+import time
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+app = FastAPI(title="Mock Ollama Backend", version="1.0.0")
+
+BACKEND_NAME = os.environ.get("MOCK_OLLAMA_NAME", "mock-ollama")
+LOADED_MODELS = [
+    m.strip()
+    for m in os.environ.get("MOCK_OLLAMA_MODELS", "qwen3:8b").split(",")
+    if m.strip()
+]
+TOKEN_DELAY = float(os.environ.get("MOCK_OLLAMA_TOKEN_DELAY", "0.05"))
+TOKENS_PER_REPLY = int(os.environ.get("MOCK_OLLAMA_TOKENS", "20"))
+
+state = {"in_flight": 0, "served": 0}
+
+
+@app.get("/api/ps")
+def list_running_models():
+    return {"models": [{"name": m, "model": m} for m in LOADED_MODELS]}
+
+
+@app.get("/api/tags")
+def list_models():
+    return {"models": [{"name": m, "model": m} for m in LOADED_MODELS]}
+
+
+@app.get("/mock/stats")
+def mock_stats():
+    return {"name": BACKEND_NAME, **state}
+
+
+def final_chunk(model: str, started_at: float, is_chat: bool) -> dict:
+    eval_duration = int(TOKENS_PER_REPLY * TOKEN_DELAY * 1e9)
+    chunk = {
+        "model": model,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "done": True,
+        "total_duration": int((time.perf_counter() - started_at) * 1e9),
+        "prompt_eval_count": 10,
+        "eval_count": TOKENS_PER_REPLY,
+        "eval_duration": eval_duration,
+    }
+    if is_chat:
+        chunk["message"] = {"role": "assistant", "content": ""}
+    else:
+        chunk["response"] = ""
+    return chunk
+
+
+async def generate_reply(payload: dict, is_chat: bool):
+    model = payload.get("model", LOADED_MODELS[0] if LOADED_MODELS else "mock")
+    started_at = time.perf_counter()
+    state["in_flight"] += 1
+    try:
+        for i in range(TOKENS_PER_REPLY):
+            await asyncio.sleep(TOKEN_DELAY)
+            token = f"[{BACKEND_NAME}:{i}] "
+            chunk = {"model": model, "done": False}
+            if is_chat:
+                chunk["message"] = {"role": "assistant", "content": token}
+            else:
+                chunk["response"] = token
+            yield json.dumps(chunk) + "\n"
+        yield json.dumps(final_chunk(model, started_at, is_chat)) + "\n"
+    finally:
+        state["in_flight"] -= 1
+        state["served"] += 1
+
+
+async def handle_inference(request: Request, is_chat: bool):
+    payload = await request.json()
+    if payload.get("stream", True):
+        return StreamingResponse(
+            generate_reply(payload, is_chat), media_type="application/x-ndjson"
+        )
+
+    content = ""
+    final = {}
+    async for line in generate_reply(payload, is_chat):
+        chunk = json.loads(line)
+        if chunk.get("done"):
+            final = chunk
+        else:
+            content += (chunk.get("message") or {}).get("content", "") or chunk.get(
+                "response", ""
+            )
+    if is_chat:
+        final["message"] = {"role": "assistant", "content": content}
+    else:
+        final["response"] = content
+    return JSONResponse(final)
+
+
+@app.post("/api/chat")
+async def chat(request: Request):
+    return await handle_inference(request, is_chat=True)
+
+
+@app.post("/api/generate")
+async def generate(request: Request):
+    return await handle_inference(request, is_chat=False)
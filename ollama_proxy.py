@@ -1,14 +1,24 @@
+import asyncio
 import httpx
 import os
 import json
+import random
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from src.providers.sd_provider import SDProvider
+from src.managers.image_job_queue import ImageJobQueue, ImageQueueFullError
+from src.managers.proxy_metrics import ProxyMetrics
+from src.utils.image_cache import get_image_cache
+from src.managers.ollama_gateway import (
+    BackendPool,
+    FairRequestQueue,
+    GatewayQueueFullError,
+)
 from src.utils import log
 from src.settings import settings
 
@@ -17,9 +27,72 @@ load_dotenv()
 app = FastAPI(title="Moltbook Ollama Gateway")
 
 OLLAMA_PROXY_API_KEY = os.environ.get("OLLAMA_PROXY_API_KEY")
+OLLAMA_PROXY_API_KEYS = {
+    key for key in [OLLAMA_PROXY_API_KEY, *settings.OLLAMA_PROXY_API_KEYS] if key
+}
 OLLAMA_URL = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+INFERENCE_PATHS = ("api/chat", "api/generate")
 
 sd_generator = SDProvider()
+image_jobs = ImageJobQueue(
+    sd_generator.generate_image, timings_provider=lambda: sd_generator.last_timings
+)
+proxy_metrics = ProxyMetrics(window=settings.OLLAMA_PROXY_METRICS_WINDOW)
+ollama_client: Optional[httpx.AsyncClient] = None
+backend_pool = BackendPool(
+    settings.OLLAMA_BACKENDS or [OLLAMA_URL],
+    affinity_max_extra=settings.OLLAMA_AFFINITY_MAX_EXTRA,
+)
+request_queue = FairRequestQueue(
+    max_concurrent=settings.OLLAMA_GATEWAY_MAX_CONCURRENT,
+    max_per_key=settings.OLLAMA_GATEWAY_MAX_PER_KEY,
+    max_queued_per_key=settings.OLLAMA_GATEWAY_MAX_QUEUED_PER_KEY,
+)
+health_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def open_ollama_client():
+    global ollama_client
+    ollama_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=10.0,
+            read=None,
+            write=None,
+            pool=None,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.OLLAMA_PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OLLAMA_PROXY_MAX_CONNECTIONS,
+        ),
+    )
+
+
+async def monitor_backends():
+    while True:
+        await backend_pool.check_health(ollama_client)
+        await asyncio.sleep(settings.OLLAMA_BACKEND_HEALTH_INTERVAL)
+
+
+@app.on_event("startup")
+async def start_backend_monitor():
+    global health_task
+    health_task = asyncio.create_task(monitor_backends())
+
+
+@app.on_event("shutdown")
+async def close_ollama_client():
+    if health_task is not None:
+        health_task.cancel()
+    if ollama_client is not None:
+        await ollama_client.aclose()
+
+
+@app.on_event("startup")
+async def preload_image_model():
+    if settings.SD_PRELOAD_ON_STARTUP:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] 🔥 Preloading SD Turbo...")
+        asyncio.get_running_loop().run_in_executor(None, sd_generator.preload)
 
 
 class ImageGenerationRequest(BaseModel):
@@ -32,120 +105,261 @@ class ImageGenerationRequest(BaseModel):
     seed: Optional[int] = None
 
 
+# Starlette skips background tasks when the client disconnects, so release
+# the gateway slot and backend count here however the response ends.
+class ReleasingStreamingResponse(StreamingResponse):
+    def __init__(self, content, on_close: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+
 async def verify_api_key(request: Request):
     api_key = request.headers.get("X-API-Key")
-    if not OLLAMA_PROXY_API_KEY or api_key != OLLAMA_PROXY_API_KEY:
+    if not OLLAMA_PROXY_API_KEYS or api_key not in OLLAMA_PROXY_API_KEYS:
         raise HTTPException(status_code=403, detail="Unauthorized access")
 
 
+def submit_image_job(payload: ImageGenerationRequest) -> dict:
+    try:
+        return image_jobs.submit(payload.model_dump())
+    except ImageQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+async def wait_for_image_job(job_id: str, timeout: float) -> bool:
+    future = image_jobs.get_future(job_id)
+    if future is None:
+        raise HTTPException(status_code=404, detail=f"Unknown image job: {job_id}")
+    try:
+        await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+    except asyncio.TimeoutError:
+        return False
+    except Exception:
+        pass
+    return True
+
+
 @app.post("/api/generate-image")
 async def generate_image(payload: ImageGenerationRequest, _=Depends(verify_api_key)):
-    try:
+    print(
+        f"[{datetime.now().strftime('%H:%M:%S')}] 🎨 Generating image: {payload.prompt[:50]}..."
+    )
+
+    job = submit_image_job(payload)
+    await wait_for_image_job(job["job_id"], timeout=None)
+    result = image_jobs.describe(job["job_id"])
+
+    if result["status"] != "done":
         print(
-            f"[{datetime.now().strftime('%H:%M:%S')}] 🎨 Generating image: {payload.prompt[:50]}..."
+            f"[{datetime.now().strftime('%H:%M:%S')}] ❌ Image generation error: {result.get('error')}"
         )
-
-        data_uri = sd_generator.generate_image(
-            prompt=payload.prompt,
-            negative_prompt=payload.negative_prompt,
-            width=payload.width,
-            height=payload.height,
-            num_inference_steps=payload.num_inference_steps,
-            guidance_scale=payload.guidance_scale,
-            seed=payload.seed,
+        raise HTTPException(
+            status_code=500, detail=result.get("error") or "Image generation failed"
         )
 
-        if data_uri is None:
-            raise HTTPException(status_code=500, detail="Image generation failed")
+    print(
+        f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Image generated successfully "
+        f"(timings: {result.get('timings')})"
+    )
 
-        print(
-            f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Image generated successfully"
-        )
+    return JSONResponse(
+        {
+            "success": True,
+            "data_uri": result["data_uri"],
+            "format": "png",
+            "size": f"{payload.width}x{payload.height}",
+            "job_id": job["job_id"],
+            "coalesced": job["coalesced"],
+            "timings": result.get("timings", {}),
+        }
+    )
 
-        return JSONResponse(
-            {
-                "success": True,
-                "data_uri": data_uri,
-                "format": "png",
-                "size": f"{payload.width}x{payload.height}",
-            }
+
+@app.post("/api/image-jobs")
+async def submit_image(payload: ImageGenerationRequest, _=Depends(verify_api_key)):
+    job = submit_image_job(payload)
+    print(
+        f"[{datetime.now().strftime('%H:%M:%S')}] 📥 Image job {job['job_id']} {job['status']} "
+        f"(coalesced: {job['coalesced']}): {payload.prompt[:50]}..."
+    )
+    return JSONResponse(job, status_code=202)
+
+
+@app.get("/api/image-jobs/{job_id}")
+async def poll_image(job_id: str, wait: float = 0, _=Depends(verify_api_key)):
+    if wait > 0:
+        await wait_for_image_job(
+            job_id, timeout=min(wait, settings.IMAGE_JOB_MAX_WAIT_SECONDS)
         )
 
-    except Exception as e:
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] ❌ Image generation error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = image_jobs.describe(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Unknown image job: {job_id}")
+    return JSONResponse(result)
+
+
+@app.get("/api/image-stats")
+async def image_stats(_=Depends(verify_api_key)):
+    cache = get_image_cache()
+    return JSONResponse(
+        {
+            **sd_generator.get_stats(),
+            "queue": image_jobs.get_metrics(),
+            "cache": cache.get_stats() if cache is not None else None,
+        }
+    )
+
+
+@app.get("/api/proxy-metrics")
+async def proxy_stats(_=Depends(verify_api_key)):
+    return JSONResponse(proxy_metrics.get_stats())
+
+
+@app.get("/api/gateway-stats")
+async def gateway_stats(_=Depends(verify_api_key)):
+    return JSONResponse(
+        {"backends": backend_pool.get_stats(), "queue": request_queue.get_stats()}
+    )
+
+
+def truncate_for_log(content: bytes) -> str:
+    text = content[: settings.OLLAMA_PROXY_LOG_MAX_BYTES].decode("utf-8", "replace")
+    if len(content) > settings.OLLAMA_PROXY_LOG_MAX_BYTES:
+        text += f"... [{len(content) - settings.OLLAMA_PROXY_LOG_MAX_BYTES} more bytes]"
+    return text
 
 
 @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
 async def proxy_ollama(path: str, request: Request, _=Depends(verify_api_key)):
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(
-            connect=10.0,
-            read=None,
-            write=None,
-            pool=None,
-        )
-    ) as client:
-        url = f"{OLLAMA_URL}/{path}"
-        body = await request.body()
-        if path == "api/chat" or path == "api/generate":
-            try:
-                data = json.loads(body)
-                if "options" not in data:
-                    data["options"] = {}
-
-                data["options"]["num_ctx"] = settings.NUM_CTX_OLLAMA
-
-                body = json.dumps(data).encode("utf-8")
-                log.success(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] 🧠 Context window forced to {settings.NUM_CTX_OLLAMA} for {path}"
-                )
-            except Exception as e:
-                log.error(f"Failed to inject context options: {e}")
+    body = await request.body()
+    model = None
+    is_inference = path in INFERENCE_PATHS
+    if is_inference:
+        try:
+            data = json.loads(body)
+            model = data.get("model")
+            if "options" not in data:
+                data["options"] = {}
+
+            data["options"]["num_ctx"] = settings.NUM_CTX_OLLAMA
+
+            body = json.dumps(data).encode("utf-8")
             log.success(
-                f"[{datetime.now().strftime('%H:%M:%S')}] ⚡ Proxying {path} for external agent..."
+                f"[{datetime.now().strftime('%H:%M:%S')}] 🧠 Context window forced to {settings.NUM_CTX_OLLAMA} for {path}"
             )
-        headers = {
-            k: v
-            for k, v in request.headers.items()
-            if k.lower() not in ["host", "content-length"]
-        }
+        except Exception as e:
+            log.error(f"Failed to inject context options: {e}")
+        log.success(
+            f"[{datetime.now().strftime('%H:%M:%S')}] ⚡ Proxying {path} for external agent..."
+        )
+    headers = {
+        k: v
+        for k, v in request.headers.items()
+        if k.lower() not in ["host", "content-length"]
+    }
+    should_log = random.random() < settings.OLLAMA_PROXY_LOG_SAMPLE_RATE
+    if should_log:
+        log.info(f"REQUEST BODY: {truncate_for_log(body)}")
+
+    client_key = request.headers.get("X-API-Key", "")
+    if is_inference:
+        try:
+            await request_queue.acquire(client_key)
+        except GatewayQueueFullError as e:
+            raise HTTPException(status_code=429, detail=str(e))
+
+    timer = proxy_metrics.start(path, model)
+    backend = None
+
+    def release(failed: bool = False):
+        if backend is not None:
+            backend_pool.release(backend)
+        if is_inference:
+            request_queue.release(client_key)
+        return proxy_metrics.record(timer, failed=failed)
+
+    tried = set()
+    while True:
+        backend = backend_pool.choose(model, exclude=tried)
+        if backend is None:
+            release(failed=True)
+            raise HTTPException(status_code=503, detail="Ollama service is unreachable")
+
+        backend_pool.acquire(backend, model if is_inference else None)
+        timer.backend = backend.url
         try:
-            log.info(f"REQUEST BODY: {body}")
-            ollama_request = client.build_request(
+            ollama_request = ollama_client.build_request(
                 method=request.method,
-                url=url,
+                url=f"{backend.url}/{path}",
                 content=body,
                 params=request.query_params,
                 headers=headers,
             )
-            ollama_resp = await client.send(ollama_request, stream=True)
-
-            async def stream_and_log():
-                full_response = []
-                async for chunk in ollama_resp.aiter_raw():
-                    full_response.append(chunk)
-                    yield chunk
-                try:
-                    complete_content = b"".join(full_response).decode("utf-8")
-                    if "api/chat" in path or "api/generate" in path:
-                        log.info(f"📄 FULL BOT RESPONSE ({path}):\n{complete_content}")
-                except Exception as log_err:
-                    log.error(f"Failed to log proxy response: {log_err}")
-
-            return StreamingResponse(
-                stream_and_log(),
-                status_code=ollama_resp.status_code,
-                headers=dict(ollama_resp.headers),
-            )
-        except httpx.ConnectError:
-            raise HTTPException(status_code=503, detail="Ollama service is unreachable")
+            ollama_resp = await ollama_client.send(ollama_request, stream=True)
+            timer.status_code = ollama_resp.status_code
+            break
+        except httpx.ConnectError as e:
+            backend_pool.release(backend)
+            backend_pool.mark_failed(backend, e)
+            tried.add(backend.url)
+            backend = None
         except Exception as e:
+            release(failed=True)
             raise HTTPException(status_code=500, detail=str(e))
 
+    logged = bytearray()
+    finished = False
+
+    def finish(failed: bool = False):
+        nonlocal finished
+        if finished:
+            return
+        finished = True
+        entry = release(failed=failed)
+        if should_log and is_inference:
+            log.info(
+                f"📄 BOT RESPONSE ({path} via {entry['backend']}, ttfb={entry['ttfb_ms']}ms, "
+                f"total={entry['total_ms']}ms, tok/s={entry['tokens_per_second']}):\n"
+                f"{truncate_for_log(bytes(logged))}"
+            )
+
+    async def stream_and_log():
+        failed = False
+        try:
+            async for chunk in ollama_resp.aiter_raw():
+                timer.on_chunk(chunk)
+                if should_log and len(logged) <= settings.OLLAMA_PROXY_LOG_MAX_BYTES:
+                    logged.extend(chunk)
+                yield chunk
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            finish(failed=failed)
+            await ollama_resp.aclose()
+
+    async def close_stream():
+        finish(failed=True)
+        await ollama_resp.aclose()
+
+    return ReleasingStreamingResponse(
+        stream_and_log(),
+        on_close=close_stream,
+        status_code=ollama_resp.status_code,
+        headers=dict(ollama_resp.headers),
+    )
 
 if __name__ == "__main__":
     print("🚀 Starting Moltbook Ollama Gateway with SD Turbo support...")
-    print(f"📡 Ollama URL: {OLLAMA_URL}")
-    print(f"🎨 SD Turbo: Ready for on-demand image generation")
+    print(f"📡 Ollama backends: {', '.join(b.url for b in backend_pool.backends)}")
+    print(
+        f"🎨 SD Turbo: {'preloading at startup' if settings.SD_PRELOAD_ON_STARTUP else 'loads on first use'}, "
+        f"idle unload after {settings.SD_IDLE_UNLOAD_SECONDS}s"
+    )
     uvicorn.run(app, host=settings.OLLAMA_PROXY_HOST, port=8000)
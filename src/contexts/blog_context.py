@@ -9,6 +9,31 @@ class BlogContext(BaseContext):
         self.handler = blog_handler
         self.memory = memory_handler
 
+    @staticmethod
+    def _describe_publish_job(job: Dict) -> str:
+        status = job.get("status")
+        title = job.get("title", "Untitled")[:50]
+        if status == "published":
+            return f"✅ '{title}' is live: {job.get('url')}"
+        if status == "failed":
+            return f"❌ '{title}' failed to publish: {job.get('error')}"
+        if status == "uploading":
+            return f"📤 '{title}' is uploading..."
+        return f"🎨 '{title}' is generating its header image..."
+
+    def _build_publish_section(self) -> str:
+        jobs = self.handler.blog_manager.get_publish_jobs()
+        if not jobs:
+            return ""
+
+        lines = ["### 📤 PUBLISHING STATUS"]
+        lines.extend(f"- {self._describe_publish_job(job)}" for job in jobs)
+        if jobs[0].get("status") == "published" and jobs[0].get("url"):
+            lines.append(
+                f"\n💡 Pin and share your latest article: `{jobs[0]['url']}`"
+            )
+        return "\n".join(lines) + "\n"
+
     def get_home_snippet(self) -> str:
         try:
             key_params = Namespace()
@@ -35,7 +60,11 @@ class BlogContext(BaseContext):
             if comm_count > 0:
                 status_parts.append(f"💬 {comm_count} Comments")
 
-            if key_count == 0 and comm_count == 0:
+            jobs = self.handler.blog_manager.get_publish_jobs()
+            if jobs:
+                status_parts.append(self._describe_publish_job(jobs[0]))
+
+            if key_count == 0 and comm_count == 0 and not jobs:
                 status_parts.append("All clear")
 
             return " | ".join(status_parts)
@@ -122,10 +151,17 @@ class BlogContext(BaseContext):
                 "\n🎉 **You own all BLOG tools!** Focus on creating content.\n"
             )
 
+        publish_section = ""
+        try:
+            publish_section = self._build_publish_section()
+        except Exception as e:
+            log.warning(f"Could not read publishing status: {e}")
+
         ctx = [
             "## 📚 BLOG ADMINISTRATION & HUB",
             f"✅ **STATUS**: {status_msg}" if status_msg else "",
             "---",
+            publish_section,
             blog_knowledge,
             "---",
             key_context,
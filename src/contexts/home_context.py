@@ -280,11 +280,8 @@ class HomeContext:
             has_memory_retrieve = "memory_retrieve" in owned_tools
             has_memory_store = "memory_store" in owned_tools
 
-            cursor = self.memory.conn.cursor()
-            cursor.execute(
-                "SELECT DISTINCT category FROM memory_entries ORDER BY category"
-            )
-            categories = [row["category"] for row in cursor.fetchall()]
+            memories = self.memory.get_latest_memories_by_category(per_category=5)
+            categories = list(memories)
 
             if not categories:
                 if not has_memory_store:
@@ -304,18 +301,7 @@ class HomeContext:
             total_entries = 0
 
             for category in categories:
-                cursor.execute(
-                    """
-                    SELECT content, created_at 
-                    FROM memory_entries 
-                    WHERE category = ? 
-                    ORDER BY created_at DESC 
-                    LIMIT 5
-                """,
-                    (category,),
-                )
-
-                entries = cursor.fetchall()
+                entries = memories[category]
 
                 if entries:
                     memory_block.append(
@@ -388,18 +374,14 @@ class HomeContext:
 
             handler = self.research.handler
 
-            if not hasattr(handler, "vector_db"):
-                log.debug("Research handler has no vector_db attribute")
+            if not hasattr(handler, "research_cache"):
+                log.debug("Research handler has no research_cache attribute")
                 return ""
 
-            vector_db = handler.vector_db
-
-            all_docs = vector_db.get()
+            research_cache = handler.research_cache
+            topic_count = research_cache.count_topics()
 
-            log.debug(f"Vector DB get() returned: {type(all_docs)}")
-            log.debug(f"Keys in all_docs: {all_docs.keys() if all_docs else 'None'}")
-
-            if not all_docs:
+            if not topic_count:
                 if not has_wiki_search or not has_wiki_read:
                     locked = []
                     if not has_wiki_search:
@@ -419,39 +401,13 @@ class HomeContext:
                         "⚠️ **No research cached yet.** Use `wiki_search` and `wiki_read` to build knowledge.\n"
                     )
 
-            metadatas = all_docs.get("metadatas")
-
-            if not metadatas:
-                log.warning(f"No metadatas in vector DB result: {all_docs.keys()}")
-                return (
-                    "## 🔍 RESEARCH CACHE\n\n"
-                    "⚠️ **Cache structure issue.** Try running `wiki_read` to populate cache.\n"
-                )
-
-            log.info(f"Found {len(metadatas)} metadata entries in vector DB")
-
-            topics = {}
-
-            for metadata in metadatas:
-                if isinstance(metadata, dict):
-                    title = metadata.get("title", "Unknown")
-                    url = metadata.get("url", "")
-
-                    if title and title != "Unknown":
-                        topics[title] = url
-
-            log.info(f"Extracted {len(topics)} unique topics from cache")
-
-            if not topics:
-                return (
-                    "## 🔍 RESEARCH CACHE\n\n"
-                    "⚠️ **No valid topics found in cache.** Use `wiki_read` to add Wikipedia pages.\n"
-                )
+            page_size = settings.RESEARCH_TOPICS_PAGE_SIZE
+            topics = research_cache.list_topics(limit=page_size)
 
             research_block = [
                 "## 🔍 RESEARCH CACHE (Already Searched Topics)",
                 "",
-                f"**Total cached pages**: {len(topics)}",
+                f"**Total cached pages**: {topic_count}",
             ]
 
             if has_wiki_search and has_wiki_read:
@@ -469,14 +425,16 @@ class HomeContext:
                     f"🔒 Unlock {' and '.join(locked)} (100 XP each) to add more research.\n"
                 )
 
-            sorted_topics = sorted(topics.keys())[:15]
-
-            for title in sorted_topics:
-                research_block.append(f"• **{title}** (cached)")
+            for topic in topics:
+                chunk_note = (
+                    f"{topic['chunk_count']} chunks" if topic["chunk_count"] else "cached"
+                )
+                research_block.append(f"• **{topic['title']}** ({chunk_note})")
 
-            if len(topics) > 15:
+            if topic_count > page_size:
                 research_block.append(
-                    f"\n... and {len(topics) - 15} more topics in cache"
+                    f"\n... and {topic_count - page_size} more topics in cache. "
+                    "Use `wiki_topics(page=2)` to list them."
                 )
 
             research_block.append("")
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from argparse import Namespace
 from src.utils import log
 from src.contexts.base_context import BaseContext
@@ -9,14 +9,55 @@ class MailContext(BaseContext):
         self.handler = email_handler
         self.memory = memory_handler
 
+    def _get_recent_messages(self) -> List[Dict]:
+        mirror = self.handler.mail_mirror
+        if not self.handler.watcher_is_live():
+            mirror.sync()
+        messages = mirror.list_messages(limit=10, with_body=True)
+        for message in messages:
+            message["body"] = (message["body"] or "")[:256]
+        return messages
+
+    def prefetch(self):
+        self._get_recent_messages()
+
+    def invalidate_prefetch(self):
+        self.handler.mail_mirror.invalidate()
+
+    @staticmethod
+    def _describe_outbox_send(send: Dict) -> str:
+        recipient = send.get("to", "unknown")
+        subject = (send.get("subject") or "(No Subject)")[:50]
+        if send.get("status") == "sent":
+            return f"✅ '{subject}' delivered to {recipient}"
+        if send.get("status") == "failed":
+            return f"❌ '{subject}' to {recipient} failed: {send.get('error')}"
+        return f"📤 '{subject}' to {recipient} is queued..."
+
+    def _build_outbox_section(self) -> str:
+        sends = self.handler.get_outbox_sends()
+        if not sends:
+            return ""
+        lines = ["### 📤 OUTBOX"]
+        lines.extend(f"- {self._describe_outbox_send(send)}" for send in sends)
+        return "\n".join(lines) + "\n"
+
     def get_home_snippet(self) -> str:
         try:
-            messages = []
-            for msg in self.handler.mailbox.fetch(limit=10, reverse=True):
-                messages.append(msg)
-
-            if messages:
-                return f"📩 **MAIL**: You have {len(messages)} active message(s) in your inbox."
+            state = self.handler.get_inbox_state()
+            if state is None:
+                mirror = self.handler.mail_mirror
+                if self.handler.imap.connected:
+                    mirror.sync()
+                else:
+                    self.handler.sync_in_background()
+                    if not mirror.has_snapshot():
+                        return "📩 **MAIL**: Syncing inbox..."
+                counts = mirror.get_counts()
+                state = {"total": counts["total"], "unread": counts["unseen"]}
+
+            if state["total"]:
+                return f"📩 **MAIL**: You have {state['total']} active message(s) in your inbox ({state['unread']} unread)."
             return "📩 **MAIL**: Inbox is empty"
         except Exception as e:
             log.warning(f"Mail snippet generation failed: {e}")
@@ -28,17 +69,7 @@ class MailContext(BaseContext):
         owned_tools = set(self.memory.get_owned_tools())
         messages_display = ""
         try:
-            messages = []
-            for msg in self.handler.mailbox.fetch(limit=10, reverse=True):
-                body_raw = msg.text or ""
-                messages.append(
-                    {
-                        "uid": msg.uid,
-                        "subject": msg.subject,
-                        "from": msg.from_,
-                        "body": body_raw[:256],
-                    }
-                )
+            messages = self._get_recent_messages()
 
             if messages:
                 messages_display = "### 📬 LATEST CORRESPONDENCE\n\n"
@@ -77,6 +108,13 @@ class MailContext(BaseContext):
 """
         )
 
+        available_actions.append(
+            """
+👉 `email_search(query='...', field='any', since='YYYY-MM-DD', page=1)`
+   - Find emails by subject/sender (field: any, subject, from, text)
+"""
+        )
+
         if "email_read" in owned_tools:
             available_actions.append(
                 """
@@ -110,15 +148,15 @@ class MailContext(BaseContext):
 
         actions_section = "### 🛠️ AVAILABLE EMAIL ACTIONS\n\n"
 
-        if len(available_actions) > 1:
+        if len(available_actions) > 2:
             actions_section += "You are in EMAIL mode. Execute one of these:\n\n"
             actions_section += "\n".join(available_actions)
         else:
             actions_section += "⚠️ **LIMITED ACCESS**\n\n"
             actions_section += (
-                "You can VIEW the inbox (free), but can't interact yet.\n\n"
+                "You can VIEW and SEARCH the inbox (free), but can't interact yet.\n\n"
             )
-            actions_section += available_actions[0]
+            actions_section += "\n".join(available_actions)
 
         if locked_actions:
             actions_section += "\n\n### 🔒 LOCKED ACTIONS\n"
@@ -135,10 +173,17 @@ class MailContext(BaseContext):
                 + "\n".join(available_actions)
             )
 
+        outbox_section = ""
+        try:
+            outbox_section = self._build_outbox_section()
+        except Exception as e:
+            log.warning(f"Could not read outbox status: {e}")
+
         ctx = [
             "## 📥 EMAIL INBOX",
             f"✅ **STATUS**: {status_msg}" if status_msg else "",
             "---",
+            outbox_section,
             messages_display,
             "",
             actions_section,
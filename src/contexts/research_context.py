@@ -41,9 +41,10 @@ class ResearchContext(BaseContext):
         if "wiki_read" in owned_tools:
             available_actions.append(
                 """
-**Step 2**: `wiki_read(page_title='...')`
-   - Extract full content from a page
+**Step 2**: `wiki_read(page_title='...', focus='...')`
+   - Extract the most relevant sections from a page
    - Use exact title from search results
+   - Optional `focus`: what you are looking for in the page
 """
             )
         else:
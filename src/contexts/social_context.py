@@ -17,6 +17,13 @@ class SocialContext(BaseContext):
         ]
         return "\n".join(snippet)
 
+    def prefetch(self):
+        my_post_ids = self.memory.get_agent_post_ids(limit=10)
+        self.handler._call_api_batch(
+            [("get_single_post", (post_id,)) for post_id in my_post_ids]
+            + [("get_posts", ("hot", 25))]
+        )
+
     def get_list_view(
         self, status_msg: str = "", result: Dict = None, workspace_pins: list = None
     ) -> str:
@@ -102,70 +109,89 @@ class SocialContext(BaseContext):
         my_posts_display = ""
         try:
             my_post_ids = self.memory.get_agent_post_ids(limit=10)
-            can_post = "create_post" in owned_tools
-            can_share = "share_link" in owned_tools
-
-            if my_post_ids:
-                my_posts_display = "### 📝 YOUR POSTS\n\n"
-
-                for post_id in my_post_ids:
-                    try:
-                        api_result = self.handler._call_api("get_single_post", post_id)
+        except Exception as e:
+            log.error(f"Failed to load agent post ids: {e}")
+            my_post_ids = None
 
-                        if api_result.get("success"):
-                            post = api_result.get("data", {})
-                            title = post.get("title", "Untitled")
-                            comments_count = post.get("comments_count", 0)
-                            score = post.get("score", 0)
+        batch_results = self.handler._call_api_batch(
+            [("get_single_post", (post_id,)) for post_id in my_post_ids or []]
+            + [("get_posts", ("hot", 25))]
+        )
+        post_results = batch_results[:-1]
+        feed_result = batch_results[-1]
 
-                            my_posts_display += (
-                                f"📌 **ID**: `{post_id}` | 💬 {comments_count} comments | ⬆️ {score}\n"
-                                f"   **{title}**\n\n"
-                            )
-                        else:
-                            log.warning(f"Could not fetch agent post {post_id}")
-                            my_posts_display += f"📌 **ID**: `{post_id}` | ⚠️ _Post unavailable or deleted_\n\n"
-
-                    except Exception as e:
-                        log.error(f"Error fetching post {post_id}: {e}")
-                        continue
-
-                my_posts_display += "---\n"
-            elif can_post:
-                my_posts_display = (
-                    "### 📝 YOUR POSTS\n\n"
-                    "_You haven't created any posts yet. Use `create_post` to start!_\n\n"
-                    "---\n"
-                )
-            elif can_share:
-                my_posts_display = (
-                    "### 📝 YOUR POSTS\n\n"
-                    "_You haven't shared any url yet. Use `share_link` to start!_\n\n"
-                    "---\n"
-                )
-            elif can_post and can_share:
-                my_posts_display = (
-                    "### 📝 YOUR POSTS\n\n"
-                    "_You haven't created any posts yet. Use `create_post` or `share_link` to start!_\n\n"
-                    "---\n"
-                )
-            else:
-                my_posts_display = (
-                    "### 📝 YOUR POSTS\n\n"
-                    "🔒 **You can't create posts yet.**\n\n"
-                    "👉 Go to HOME → `visit_shop` → buy `create_post` (100 XP, +15 XP/post)\n\n"
-                    "---\n"
-                )
+        unavailable_display = (
+            "### 📝 YOUR POSTS\n\n" "_Could not load your posts._\n\n" "---\n"
+        )
+        if my_post_ids is None:
+            my_posts_display = unavailable_display
+        else:
+            try:
+                can_post = "create_post" in owned_tools
+                can_share = "share_link" in owned_tools
+
+                if my_post_ids:
+                    my_posts_display = "### 📝 YOUR POSTS\n\n"
+
+                    for post_id, api_result in zip(my_post_ids, post_results):
+                        try:
+                            if isinstance(api_result, Exception):
+                                raise api_result
+
+                            if api_result.get("success"):
+                                post = api_result.get("data", {})
+                                title = post.get("title", "Untitled")
+                                comments_count = post.get("comments_count", 0)
+                                score = post.get("score", 0)
+
+                                my_posts_display += (
+                                    f"📌 **ID**: `{post_id}` | 💬 {comments_count} comments | ⬆️ {score}\n"
+                                    f"   **{title}**\n\n"
+                                )
+                            else:
+                                log.warning(f"Could not fetch agent post {post_id}")
+                                my_posts_display += f"📌 **ID**: `{post_id}` | ⚠️ _Post unavailable or deleted_\n\n"
+
+                        except Exception as e:
+                            log.error(f"Error fetching post {post_id}: {e}")
+                            continue
+
+                    my_posts_display += "---\n"
+                elif can_post:
+                    my_posts_display = (
+                        "### 📝 YOUR POSTS\n\n"
+                        "_You haven't created any posts yet. Use `create_post` to start!_\n\n"
+                        "---\n"
+                    )
+                elif can_share:
+                    my_posts_display = (
+                        "### 📝 YOUR POSTS\n\n"
+                        "_You haven't shared any url yet. Use `share_link` to start!_\n\n"
+                        "---\n"
+                    )
+                elif can_post and can_share:
+                    my_posts_display = (
+                        "### 📝 YOUR POSTS\n\n"
+                        "_You haven't created any posts yet. Use `create_post` or `share_link` to start!_\n\n"
+                        "---\n"
+                    )
+                else:
+                    my_posts_display = (
+                        "### 📝 YOUR POSTS\n\n"
+                        "🔒 **You can't create posts yet.**\n\n"
+                        "👉 Go to HOME → `visit_shop` → buy `create_post` (100 XP, +15 XP/post)\n\n"
+                        "---\n"
+                    )
 
-        except Exception as e:
-            log.error(f"Failed to load agent posts: {e}")
-            my_posts_display = (
-                "### 📝 YOUR POSTS\n\n" "_Could not load your posts._\n\n" "---\n"
-            )
+            except Exception as e:
+                log.error(f"Failed to load agent posts: {e}")
+                my_posts_display = unavailable_display
 
         community_posts_display = ""
         try:
-            api_result = self.handler._call_api("get_posts", "hot", 25)
+            api_result = feed_result
+            if isinstance(api_result, Exception):
+                raise api_result
 
             if api_result.get("success"):
                 posts = api_result.get("data", [])
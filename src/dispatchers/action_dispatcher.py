@@ -82,6 +82,7 @@ class ActionDispatcher:
 
     def set_progression_system(self, progression_system):
         self.shop_handler.progression = progression_system
+        self.blog_handler.progression = progression_system
 
     def set_session_manager(self, session_manager):
         self.session_manager = session_manager
@@ -1,10 +1,11 @@
 import re
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, List
 from src.managers.blog_manager import BlogManager
 from src.handlers.base_handler import BaseHandler
 from src.handlers.memory_handler import MemoryHandler
 from src.utils import log
+from src.settings import settings
 from src.utils.exceptions import (
     ResourceNotFoundError,
     LazyContentError,
@@ -21,6 +22,7 @@ class BlogHandler(BaseHandler):
         self.test_mode = test_mode
         self.blog_manager = BlogManager(test_mode)
         self.memory_handler = memory_handler
+        self.progression = None
 
     def _remove_all_hashtags(self, content: str) -> str:
         cleaned = re.sub(r"#\w+", "", content)
@@ -65,6 +67,8 @@ class BlogHandler(BaseHandler):
                     suggestion="Provide a detailed prompt for image generation (e.g., 'abstract art with blue and gold colors').",
                 )
 
+            background = settings.BLOG_BACKGROUND_PUBLISH and not self.test_mode
+
             cleaned_content = self._remove_all_hashtags(params.content)
 
             try:
@@ -81,6 +85,11 @@ class BlogHandler(BaseHandler):
                 else params.excerpt
             )
 
+            if background:
+                return self._queue_article_publish(
+                    params, processed_excerpt, html_content
+                )
+
             try:
                 result = self.blog_manager.post_article(
                     title=params.title,
@@ -133,6 +142,57 @@ DO NOT write another article now. Follow the steps above to share this one."""
         except Exception as e:
             return self.format_error("write_blog_article", e)
 
+    def award_published_articles(self, session_id: int = None) -> List[Dict[str, Any]]:
+        if self.progression is None:
+            return []
+        jobs = self.blog_manager.claim_published_jobs()
+        if not jobs:
+            return []
+
+        updates = []
+        with self.progression.db.unit_of_work():
+            for job in jobs:
+                update = self.progression.add_xp("write_blog_article", session_id=session_id)
+                log.success(
+                    f"✨ +{update.get('xp_gained', 0)} XP for publishing '{job['title'][:30]}'"
+                )
+                updates.append(update)
+        return updates
+
+    def _queue_article_publish(
+        self, params: Any, excerpt: str, html_content: str
+    ) -> Dict[str, Any]:
+        image_future = self.blog_manager.start_image_generation(params.image_prompt)
+        job = self.blog_manager.submit_article(
+            title=params.title,
+            excerpt=excerpt,
+            content=html_content,
+            image_future=image_future,
+        )
+
+        xp_value = ProgressionSystem.get_xp_value("write_blog_article")
+        result_text = f"""Article '{params.title}' accepted for background publishing (job {job['id']}). It is NOT live yet.
+The header image is being generated and uploaded while you continue. The +{xp_value} XP is awarded only once the article is actually published.
+
+📌 NEXT STEPS:
+1. Keep working on other actions - you do NOT need to wait.
+2. The BLOG status on the HOME screen and the BLOG screen will show the article URL once it is live, or the error if publishing fails.
+3. When the URL appears, pin it with `pin_to_workspace(label='BLOG_URL', content='<url>')`, then share it from SOCIAL mode with `share_link`.
+
+DO NOT write another article now."""
+
+        anti_loop = "Article is publishing in the background. Do something else; share the URL once the BLOG status shows it. Do NOT write another article."
+
+        owned_tools_count = len(self.memory_handler.get_owned_tools())
+        result = self.format_success(
+            action_name="write_blog_article",
+            result_data=result_text,
+            anti_loop_hint=anti_loop,
+            owned_tools_count=owned_tools_count,
+        )
+        result["xp_deferred"] = True
+        return result
+
     def handle_review_comment_key_requests(self, params: Any) -> Dict[str, Any]:
         try:
             headers = self._get_headers()
@@ -1,7 +1,10 @@
 import smtplib
+import threading
+from collections import deque
 from email.message import EmailMessage
-from typing import Dict, Any
-from imap_tools import MailBox, MailMessageFlags
+from typing import Callable, Dict, Any, List, Optional
+from datetime import date
+from imap_tools import AND, OR, MailBox, MailBoxUnencrypted, MailMessageFlags
 from bs4 import BeautifulSoup
 from src.handlers.base_handler import BaseHandler
 from src.handlers.memory_handler import MemoryHandler
@@ -14,6 +17,11 @@ from src.utils.exceptions import (
     AccessDeniedError,
 )
 from src.managers.progression_system import ProgressionSystem
+from src.managers.imap_session import ImapSession
+from src.managers.mail_mirror import MailMirror
+from src.managers.mail_watcher import MailWatcher
+from src.settings import settings
+from src.utils.smtp_sender import get_smtp_sender
 
 
 class EmailHandler(BaseHandler):
@@ -32,20 +40,157 @@ class EmailHandler(BaseHandler):
         self.password = password
         self.test_mode = test_mode
         self.memory_handler = memory_handler
-        self.mailbox = MailBox(self.host)
-        self._authenticate()
-
-    def _authenticate(self):
+        self.imap = ImapSession(
+            self._create_mailbox,
+            self.user,
+            self.password,
+            on_connect=self._start_watcher,
+        )
+        self.mail_mirror = MailMirror(
+            memory_handler.db_path,
+            imap=self.imap,
+            clean_html=self._clean_html,
+        )
+        self.smtp_sender = get_smtp_sender(self.smtp_host, 587, self.user, self.password)
+        self._outbox_sends = deque(maxlen=settings.SMTP_OUTBOX_HISTORY)
+        self._outbox_lock = threading.Lock()
+        self.mail_watcher: Optional[MailWatcher] = None
+        self._sync_thread: Optional[threading.Thread] = None
+        if settings.MAIL_IDLE_ENABLED and not test_mode:
+            self.mail_watcher = MailWatcher(self._connect_watcher, self.mail_mirror)
+
+    def _create_mailbox(self):
+        if settings.AGENT_IMAP_SSL:
+            return MailBox(
+                self.host,
+                port=settings.AGENT_IMAP_PORT or 993,
+                timeout=settings.IMAP_TIMEOUT,
+            )
+        return MailBoxUnencrypted(
+            self.host,
+            port=settings.AGENT_IMAP_PORT or 143,
+            timeout=settings.IMAP_TIMEOUT,
+        )
+
+    def _connect_watcher(self):
+        return self._create_mailbox().login(
+            self.user, self.password, initial_folder="INBOX"
+        )
+
+    def _start_watcher(self):
+        if self.mail_watcher is not None:
+            self.mail_watcher.start()
+
+    def _background_sync(self):
         try:
-            self.mailbox.login(self.user, self.password, initial_folder="INBOX")
-            log.info(f"📥 Mailbox connected: {self.user}")
+            self.mail_mirror.sync(force=True, reconcile=True)
         except Exception as e:
-            log.error(f"❌ Email authentication failed: {e}")
-            raise AccessDeniedError(
-                message=f"Could not authenticate to mail server: {str(e)}",
-                suggestion="Check your email credentials (IMAP_SERVER, EMAIL, PASSWORD) in settings.",
+            log.warning(f"⚠️ Background mail sync failed, will retry on next view: {e}")
+
+    def sync_in_background(self):
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            return
+        self._sync_thread = threading.Thread(
+            target=self._background_sync, name="mail-sync", daemon=True
+        )
+        self._sync_thread.start()
+
+    def watcher_is_live(self) -> bool:
+        return self.mail_watcher is not None and self.mail_watcher.is_live
+
+    def get_inbox_state(self) -> Optional[Dict]:
+        if not self.watcher_is_live():
+            return None
+        return self.mail_watcher.get_state()
+
+    def add_mail_listener(self, listener: Callable[[List[Dict], Dict], None]):
+        if self.mail_watcher is not None:
+            self.mail_watcher.add_listener(listener)
+
+    def _refresh_inbox_state(self):
+        if self.mail_watcher is not None:
+            self.mail_watcher.refresh_local()
+
+    def _dispatch_message(
+        self, msg: EmailMessage, xp_action: Optional[str] = None
+    ) -> Optional[Dict]:
+        if not settings.SMTP_OUTBOX_ENABLED:
+            self.smtp_sender.send(msg)
+            return None
+
+        send = {
+            "to": msg["To"],
+            "subject": msg["Subject"],
+            "status": "queued",
+            "error": None,
+            "xp_action": xp_action,
+            "xp_awarded": xp_action is None,
+        }
+        with self._outbox_lock:
+            self._outbox_sends.append(send)
+        self.smtp_sender.enqueue(
+            msg,
+            on_failure=lambda _, error: self._record_delivery(send, error),
+            on_success=lambda _: self._record_delivery(send),
+        )
+        return send
+
+    def _record_delivery(self, send: Dict, error: Optional[Exception] = None):
+        with self._outbox_lock:
+            if error is None:
+                send["status"] = "sent"
+            else:
+                send["status"] = "failed"
+                send["error"] = str(error)
+        if error is not None and send["xp_action"]:
+            log.warning(
+                f"⚠️ No XP for {send['xp_action']} to {send['to']}: delivery failed"
             )
 
+    def get_outbox_sends(self) -> List[Dict]:
+        with self._outbox_lock:
+            sends = [dict(send) for send in self._outbox_sends]
+        return list(reversed(sends))
+
+    def claim_delivered_sends(self) -> List[Dict]:
+        with self._outbox_lock:
+            claimed = [
+                send
+                for send in self._outbox_sends
+                if send["status"] == "sent" and not send["xp_awarded"]
+            ]
+            for send in claimed:
+                send["xp_awarded"] = True
+            return [dict(send) for send in claimed]
+
+    def _lookup_message(self, uid, with_body: bool = False) -> Dict:
+        return self.mail_mirror.get_message(uid, with_body=with_body)
+
+    @staticmethod
+    def _build_search_criteria(query: str, field: str, since: str = None):
+        criteria = {
+            "subject": AND(subject=query),
+            "from": AND(from_=query),
+            "text": AND(text=query),
+        }.get(field, OR(subject=query, from_=query))
+
+        if since:
+            try:
+                since_date = date.fromisoformat(since)
+            except ValueError:
+                raise FormattingError(
+                    message=f"Invalid 'since' date: {since}",
+                    suggestion="Use ISO format YYYY-MM-DD (e.g., '2025-01-31').",
+                )
+            criteria = AND(criteria, date_gte=since_date)
+
+        return criteria
+
+    def _mark_seen(self, uids):
+        self.imap.run(lambda mailbox: mailbox.flag(uids, MailMessageFlags.SEEN, True))
+        self.mail_mirror.mark_seen(uids)
+        self._refresh_inbox_state()
+
     def handle_email_read(self, params: Any) -> Dict:
         try:
             if not hasattr(params, "uid") or not params.uid:
@@ -55,21 +200,7 @@ class EmailHandler(BaseHandler):
                 )
 
             uid = params.uid
-            email_data = None
-
-            for msg in self.mailbox.fetch(f"UID {uid}"):
-                body = msg.text or ""
-                if not body.strip() and msg.html:
-                    body = self._clean_html(msg.html)
-
-                email_data = {
-                    "uid": msg.uid,
-                    "subject": msg.subject,
-                    "from": msg.from_,
-                    "date": msg.date.isoformat() if msg.date else None,
-                    "body": body,
-                }
-                break
+            email_data = self._lookup_message(uid, with_body=True)
 
             if not email_data:
                 raise ResourceNotFoundError(
@@ -77,6 +208,9 @@ class EmailHandler(BaseHandler):
                     suggestion="Use 'email_get_messages' to refresh the list of valid UIDs.",
                 )
 
+            if not email_data["seen"]:
+                self._mark_seen(email_data["uid"])
+
             log.info(f"📖 Email {uid} read successfully.")
 
             result_text = (
@@ -109,26 +243,13 @@ class EmailHandler(BaseHandler):
                     suggestion="Set 'limit' parameter between 1 and 50.",
                 )
 
-            messages = []
-
             try:
-                for msg in self.mailbox.fetch(
-                    criteria="UNSEEN", limit=limit, reverse=True
-                ):
-                    body = msg.text or ""
-
-                    if not body.strip() and msg.html:
-                        body = self._clean_html(msg.html)
-
-                    messages.append(
-                        {
-                            "uid": msg.uid,
-                            "subject": msg.subject,
-                            "from": msg.from_,
-                            "date": msg.date.isoformat() if msg.date else None,
-                            "body": body[:2000],
-                        }
-                    )
+                if not self.watcher_is_live():
+                    self.mail_mirror.sync(force=True)
+                messages = self.mail_mirror.list_messages(limit=limit, unseen_only=True)
+
+                if messages:
+                    self._mark_seen([m["uid"] for m in messages])
 
                 if not messages:
                     result_text = "Inbox is EMPTY. No emails to process."
@@ -199,11 +320,7 @@ class EmailHandler(BaseHandler):
             content = params.content
             reply_to_uid = params.reply_to_uid
 
-            matched_email = None
-            for msg in self.mailbox.fetch(limit=50, reverse=True):
-                if msg.uid == reply_to_uid:
-                    matched_email = msg
-                    break
+            matched_email = self._lookup_message(reply_to_uid)
 
             if not matched_email:
                 raise FormattingError(
@@ -211,7 +328,7 @@ class EmailHandler(BaseHandler):
                     suggestion="Use a valid UID from the inbox. You can list emails using `email_get_messages`.",
                 )
 
-            original_from = getattr(matched_email, "from_", None)
+            original_from = matched_email["from"]
             if original_from != recipient:
                 raise FormattingError(
                     message=f"The 'to' email '{recipient}' does not match the original sender '{original_from}'.",
@@ -231,24 +348,14 @@ class EmailHandler(BaseHandler):
                 msg["From"] = self.user
                 msg["To"] = recipient
 
-                with smtplib.SMTP(self.smtp_host, 587) as server:
-                    server.starttls()
-                    server.login(self.user, self.password)
-                    server.send_message(msg)
+                queued = self._dispatch_message(msg, xp_action="email_send")
+                delivery = "queued for delivery" if queued else "sent successfully"
 
-                log.success(f"📤 Email dispatched to {recipient}")
+                log.success(f"📤 Email {delivery} to {recipient}")
 
                 auto_mark_message = ""
                 try:
-                    if hasattr(self.mailbox, "select"):
-                        self.mailbox.select("INBOX")
-
-                    if hasattr(self.mailbox, "uid"):
-                        self.mailbox.uid(
-                            "STORE", str(reply_to_uid), "+FLAGS", r"(\Seen)"
-                        )
-                    else:
-                        self.mailbox.flag(reply_to_uid, "\\Seen", True)
+                    self._mark_seen(reply_to_uid)
 
                     log.info(
                         f"✓ Original email {reply_to_uid} automatically marked as read"
@@ -263,16 +370,32 @@ class EmailHandler(BaseHandler):
                         f"\n⚠️ Note: Could not auto-mark original email as read."
                     )
 
-                result_text = f"Email sent successfully to {recipient}.\nSubject: {subject}{auto_mark_message}"
-                anti_loop = f"Email to {recipient} SENT and original email marked as read. Do NOT send the same email again. Move to another task."
+                xp_value = ProgressionSystem.get_xp_value("email_send")
+                result_text = f"Email {delivery} to {recipient}.\nSubject: {subject}{auto_mark_message}"
                 owned_tools_count = len(self.memory_handler.get_owned_tools())
-                return self.format_success(
+                if not queued:
+                    anti_loop = f"Email to {recipient} SENT and original email marked as read. Do NOT send the same email again. Move to another task."
+                    return self.format_success(
+                        action_name="email_send",
+                        result_data=result_text,
+                        anti_loop_hint=anti_loop,
+                        xp_gained=xp_value,
+                        owned_tools_count=owned_tools_count,
+                    )
+
+                result_text += (
+                    f"\nIt is NOT delivered yet. The +{xp_value} XP is awarded only once the mail server accepts it."
+                    "\nThe OUTBOX section of the MAIL screen shows whether it was sent or failed."
+                )
+                anti_loop = f"Email to {recipient} QUEUED and original email marked as read. Do NOT send the same email again. Move to another task."
+                result = self.format_success(
                     action_name="email_send",
                     result_data=result_text,
                     anti_loop_hint=anti_loop,
-                    xp_gained=ProgressionSystem.get_xp_value("email_send"),
                     owned_tools_count=owned_tools_count,
                 )
+                result["xp_deferred"] = True
+                return result
 
             except smtplib.SMTPAuthenticationError:
                 raise AccessDeniedError(
@@ -342,17 +465,13 @@ class EmailHandler(BaseHandler):
 
                 msg.add_alternative(html_content, subtype="html")
 
-                with smtplib.SMTP(self.smtp_host, 587) as server:
-                    server.starttls()
-                    server.login(self.user, self.password)
-                    server.send_message(msg)
+                queued = self._dispatch_message(msg)
+                delivery = "queued for delivery" if queued else "sent successfully"
 
-                log.success(f"📤 HTML email dispatched to {recipient}")
+                log.success(f"📤 HTML email {delivery} to {recipient}")
 
-                result_text = (
-                    f"HTML email sent successfully to {recipient}.\nSubject: {subject}"
-                )
-                anti_loop = f"HTML email to {recipient} SENT. Do NOT send again. Move to another task."
+                result_text = f"HTML email {delivery} to {recipient}.\nSubject: {subject}"
+                anti_loop = f"HTML email to {recipient} {'QUEUED' if queued else 'SENT'}. Do NOT send again. Move to another task."
 
                 return self.format_success(
                     action_name="email_send_html",
@@ -397,7 +516,7 @@ class EmailHandler(BaseHandler):
             uid = params.uid
 
             try:
-                self.mailbox.flag(uid, MailMessageFlags.SEEN, True)
+                self._mark_seen(uid)
                 log.info(f"📖 Email {uid} marked as read.")
 
                 result_text = f"Email UID {uid} marked as read."
@@ -441,7 +560,9 @@ class EmailHandler(BaseHandler):
                 )
 
             try:
-                self.mailbox.move(uid, folder)
+                self.imap.run(lambda mailbox: mailbox.move(uid, folder))
+                self.mail_mirror.remove(uid)
+                self._refresh_inbox_state()
                 log.info(f"📁 Email {uid} moved to {folder}")
 
                 result_text = f"Email UID {uid} moved to '{folder}' folder."
@@ -488,7 +609,9 @@ class EmailHandler(BaseHandler):
             uid = params.uid
 
             try:
-                self.mailbox.move(uid, "Trash")
+                self.imap.run(lambda mailbox: mailbox.move(uid, "Trash"))
+                self.mail_mirror.remove(uid)
+                self._refresh_inbox_state()
                 log.info(f"🗑️ Email {uid} moved to Trash")
 
                 result_text = f"Email UID {uid} deleted (moved to Trash)."
@@ -514,7 +637,7 @@ class EmailHandler(BaseHandler):
         except Exception as e:
             return self.format_error("email_delete", e)
 
-    def handle_search_emails(self, params: Any) -> Dict:
+    def handle_email_search(self, params: Any) -> Dict:
         try:
             if not hasattr(params, "query") or not params.query:
                 raise FormattingError(
@@ -524,6 +647,9 @@ class EmailHandler(BaseHandler):
 
             query = params.query
             limit = getattr(params, "limit", 10)
+            field = getattr(params, "field", "any") or "any"
+            since = getattr(params, "since", None)
+            page = getattr(params, "page", 1) or 1
 
             if limit < 1 or limit > 50:
                 raise FormattingError(
@@ -531,31 +657,18 @@ class EmailHandler(BaseHandler):
                     suggestion="Set limit between 1 and 50.",
                 )
 
+            if page < 1:
+                raise FormattingError(
+                    message=f"Invalid page: {page}. Must be 1 or greater.",
+                    suggestion="Start with page=1 and increase to see older results.",
+                )
+
+            criteria = self._build_search_criteria(query, field, since)
+
             try:
-                results = []
-
-                for msg in self.mailbox.fetch(limit=limit * 3, reverse=True):
-                    if (
-                        query.lower() in msg.subject.lower()
-                        or query.lower() in msg.from_.lower()
-                    ):
-
-                        body = msg.text or ""
-                        if not body.strip() and msg.html:
-                            body = self._clean_html(msg.html)
-
-                        results.append(
-                            {
-                                "uid": msg.uid,
-                                "subject": msg.subject,
-                                "from": msg.from_,
-                                "date": msg.date.isoformat() if msg.date else None,
-                                "body": body[:500],
-                            }
-                        )
-
-                        if len(results) >= limit:
-                            break
+                total, results = self.mail_mirror.search(
+                    criteria, limit=limit, offset=(page - 1) * limit
+                )
 
                 if not results:
                     result_text = f"No emails found matching '{query}'."
@@ -569,8 +682,17 @@ class EmailHandler(BaseHandler):
                         owned_tools_count=owned_tools_count,
                     )
 
-                result_text = f"Found {len(results)} email(s) matching '{query}'."
-                anti_loop = f"Search complete - {len(results)} result(s) for '{query}'. Do NOT search again with same query."
+                total_pages = (total + limit - 1) // limit
+                lines = [
+                    f"✉️ `{m['uid']}` | {m['from']} | {m['subject']}" for m in results
+                ]
+                result_text = (
+                    f"Found {total} email(s) matching '{query}' (page {page}/{total_pages}).\n"
+                    + "\n".join(lines)
+                )
+                if page < total_pages:
+                    result_text += f"\nUse page={page + 1} for older results."
+                anti_loop = f"Search complete - {total} result(s) for '{query}'. Do NOT search again with same query."
                 owned_tools_count = len(self.memory_handler.get_owned_tools())
                 return self.format_success(
                     action_name="email_search",
@@ -587,8 +709,6 @@ class EmailHandler(BaseHandler):
             return self.format_error("email_search", e)
 
     def close(self):
-        try:
-            self.mailbox.logout()
-            log.info("🔌 Email session terminated.")
-        except:
-            pass
+        if self.mail_watcher is not None:
+            self.mail_watcher.stop()
+        self.imap.close()
@@ -1,9 +1,11 @@
 import sqlite3
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from src.settings import settings
 from src.utils import log
+from src.utils.database import deferred_write, get_database
 from src.utils.exceptions import (
     SystemLogicError,
     ResourceNotFoundError,
@@ -17,15 +19,21 @@ class MemoryHandler(BaseHandler):
     def __init__(self, db_path: str = None, test_mode=False):
         self.db_path = db_path or settings.DB_PATH
         self.test_mode = test_mode
+        self._latest_memories_cache: Dict[int, Dict[str, List[Dict]]] = {}
+        self._latest_memories_lock = threading.Lock()
 
         try:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
+            self.db = get_database(self.db_path)
             self._init_tables()
             self._init_shop_catalog()
+            self.db.add_rollback_listener(self.invalidate_memory_cache)
         except sqlite3.OperationalError as e:
             raise SystemLogicError(f"Database initialization failed: {str(e)}")
 
+    @property
+    def conn(self):
+        return self.db.conn
+
     def _init_tables(self):
 
         try:
@@ -279,7 +287,7 @@ class MemoryHandler(BaseHandler):
 
                 log.success(f"✅ Granted {len(starter_tools)} starter tools!")
 
-            self.conn.commit()
+            self.db.commit()
 
             log.info("ℹ️ Memory system operational.")
 
@@ -294,7 +302,7 @@ class MemoryHandler(BaseHandler):
                 "INSERT INTO sessions (timestamp, actions_performed, learnings, next_session_plan, full_context) VALUES (?, ?, ?, ?, ?)",
                 (datetime.now().isoformat(), "[]", "", "", "[]"),
             )
-            self.conn.commit()
+            self.db.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
             raise SystemLogicError(f"Session creation failed: {str(e)}")
@@ -338,7 +346,7 @@ class MemoryHandler(BaseHandler):
                     suggestion="Check if the session exists or was already archived.",
                 )
 
-            self.conn.commit()
+            self.db.commit()
 
         except sqlite3.Error as e:
             raise SystemLogicError(f"Session archiving failed: {str(e)}")
@@ -398,7 +406,8 @@ class MemoryHandler(BaseHandler):
                     (category,),
                 )
 
-            self.conn.commit()
+            self.db.commit()
+            self.invalidate_memory_cache()
 
             result_text = f"Memory stored in '{category}' sector ({count}/{settings.MAX_ENTRIES_PER_CATEGORY} entries). Content: {content[:50]}..."
 
@@ -508,11 +517,49 @@ class MemoryHandler(BaseHandler):
                     datetime.now().isoformat(),
                 ),
             )
-            self.conn.commit()
+            self.db.commit()
 
         except sqlite3.Error as e:
             log.error(f"❌ Metrics storage failed: {e}")
 
+    def invalidate_memory_cache(self):
+        with self._latest_memories_lock:
+            self._latest_memories_cache.clear()
+
+    def get_latest_memories_by_category(
+        self, per_category: int = 5
+    ) -> Dict[str, List[Dict]]:
+        with self._latest_memories_lock:
+            cached = self._latest_memories_cache.get(per_category)
+            if cached is not None:
+                return cached
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT category, content, created_at FROM (
+                SELECT category, content, created_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY category ORDER BY created_at DESC, id DESC
+                       ) AS rank
+                FROM memory_entries
+            )
+            WHERE rank <= ?
+            ORDER BY category, rank
+        """,
+            (per_category,),
+        )
+
+        memories: Dict[str, List[Dict]] = {}
+        for row in cursor.fetchall():
+            memories.setdefault(row["category"], []).append(
+                {"content": row["content"], "created_at": row["created_at"]}
+            )
+
+        with self._latest_memories_lock:
+            self._latest_memories_cache[per_category] = memories
+        return memories
+
     def get_agent_context_snippet(self) -> str:
 
         try:
@@ -553,6 +600,7 @@ class MemoryHandler(BaseHandler):
             log.error(f"Failed to get last session: {e}")
             return None
 
+    @deferred_write
     def track_action(
         self,
         platform_id: str,
@@ -579,7 +627,7 @@ class MemoryHandler(BaseHandler):
                     session_id,
                 ),
             )
-            self.conn.commit()
+            self.db.commit()
             log.info(f"💾 Footprint saved: {action_type} (ID: {platform_id})")
 
         except sqlite3.Error as e:
@@ -672,7 +720,7 @@ class MemoryHandler(BaseHandler):
                 ),
             )
 
-            self.conn.commit()
+            self.db.commit()
             log.success(f"✅ Master Plan version {last_version + 1} synchronized.")
             return True
 
@@ -707,6 +755,7 @@ class MemoryHandler(BaseHandler):
             log.error(f"Failed to get recent learnings: {e}")
             return []
 
+    @deferred_write
     def save_agent_post(
         self,
         post_id: str,
@@ -736,7 +785,7 @@ class MemoryHandler(BaseHandler):
                     session_id,
                 ),
             )
-            self.conn.commit()
+            self.db.commit()
 
             if cursor.rowcount > 0:
                 log.success(f"📝 Post saved to memory: '{title}' (ID: {post_id})")
@@ -830,7 +879,7 @@ class MemoryHandler(BaseHandler):
         try:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM agent_posts WHERE post_id = ?", (post_id,))
-            self.conn.commit()
+            self.db.commit()
 
             if cursor.rowcount > 0:
                 log.info(f"🗑️ Post {post_id} removed from memory")
@@ -841,6 +890,7 @@ class MemoryHandler(BaseHandler):
             log.error(f"Failed to delete agent post: {e}")
             return False
 
+    @deferred_write
     def save_social_action(
         self,
         action_type: str,
@@ -866,7 +916,7 @@ class MemoryHandler(BaseHandler):
                     session_id,
                 ),
             )
-            self.conn.commit()
+            self.db.commit()
             log.debug(f"✅ Social action tracked: {action_type}")
             return True
 
@@ -1169,7 +1219,7 @@ class MemoryHandler(BaseHandler):
             [(t[0], now, t[1]) for t in starter_tools],
         )
 
-        self.conn.commit()
+        self.db.commit()
         log.success("🏪 Shop catalog initialized with all items at 100 XP")
 
     def get_owned_tools(self) -> List[str]:
@@ -1276,7 +1326,7 @@ class MemoryHandler(BaseHandler):
                     (item_name, now, session_id, xp_cost, duration),
                 )
 
-            self.conn.commit()
+            self.db.commit()
             log.success(f"🛒 Purchased: {item_name} ({item_type}) for {xp_cost} XP")
             return True
 
@@ -1284,6 +1334,7 @@ class MemoryHandler(BaseHandler):
             log.error(f"Purchase failed: {e}")
             return False
 
+    @deferred_write
     def increment_tool_usage(self, tool_name: str):
         try:
             cursor = self.conn.cursor()
@@ -1296,7 +1347,7 @@ class MemoryHandler(BaseHandler):
             """,
                 (datetime.now().isoformat(), tool_name),
             )
-            self.conn.commit()
+            self.db.commit()
         except sqlite3.Error as e:
             log.error(f"Failed to increment tool usage: {e}")
 
@@ -1330,7 +1381,7 @@ class MemoryHandler(BaseHandler):
                 ),
             )
 
-            self.conn.commit()
+            self.db.commit()
             log.success(f"📋 Roadmap created for session {session_id}")
             return True
 
@@ -1383,7 +1434,7 @@ class MemoryHandler(BaseHandler):
                 params,
             )
 
-            self.conn.commit()
+            self.db.commit()
             return True
 
         except sqlite3.Error as e:
@@ -1408,10 +1459,3 @@ class MemoryHandler(BaseHandler):
         except sqlite3.Error as e:
             log.error(f"Failed to get session purchases: {e}")
             return []
-
-    def __del__(self):
-        if hasattr(self, "conn"):
-            try:
-                self.conn.close()
-            except:
-                pass
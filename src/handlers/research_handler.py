@@ -3,6 +3,7 @@ import time
 from typing import Any, Dict
 from src.handlers.base_handler import BaseHandler
 from src.utils import log
+from src.settings import settings
 from src.utils.exceptions import (
     APICommunicationError,
     SystemLogicError,
@@ -10,6 +11,8 @@ from src.utils.exceptions import (
     ResourceNotFoundError,
 )
 from src.managers.progression_system import ProgressionSystem
+from src.managers.research_cache import ResearchCache
+from src.managers.wiki_ingestor import WikiIngestor
 
 
 class ResearchHandler(BaseHandler):
@@ -17,6 +20,13 @@ class ResearchHandler(BaseHandler):
         self.test_mode = test_mode
         self.vector_db = vector_db
         self.memory_handler = memory_handler
+        self.research_cache = ResearchCache(getattr(memory_handler, "db_path", None))
+        self.wiki_ingestor = WikiIngestor(vector_db, self.research_cache)
+
+        try:
+            self.wiki_ingestor.backfill_topic_index()
+        except Exception as e:
+            log.warning(f"Failed to index legacy research cache: {e}")
 
         try:
             wikipedia.set_lang("en")
@@ -80,39 +90,42 @@ class ResearchHandler(BaseHandler):
 
             log.info(f"🔎 Wiki Search: {query}")
 
-            try:
-                local_check = self.vector_db.query(query_texts=[query], n_results=1)
-
-                if (
-                    local_check.get("distances")
-                    and local_check["distances"][0]
-                    and local_check["distances"][0][0] < 0.2
-                ):
-                    cached_titles = local_check.get("metadatas", [[]])[0]
-                    if cached_titles:
-                        log.info("🧠 Found matching results in local cache.")
-                        cached_title = cached_titles.get("title", query)
-
-                        results = self._execute_wiki(
-                            wikipedia.search, query, results=limit
-                        )
+            source = "live"
+            saved_ms = 0.0
+            results = None
 
-                        result_text = f"Search for '{query}' found {len(results)} page(s): {', '.join(results)}"
-                        anti_loop = f"Search complete - {len(results)} results for '{query}'. Now use wiki_read on ONE of these titles. Do NOT search again with the same query."
-                        owned_tools_count = len(self.memory_handler.get_owned_tools())
-                        return self.format_success(
-                            action_name="wiki_search",
-                            result_data=result_text,
-                            anti_loop_hint=anti_loop,
-                            xp_gained=ProgressionSystem.get_xp_value("wiki_search"),
-                            owned_tools_count=owned_tools_count,
-                        )
+            try:
+                cached = self.research_cache.get_search(query, limit)
+                if cached:
+                    log.info("🧠 Found matching results in local cache.")
+                    results = cached["titles"]
+                    source = "cache"
+                    saved_ms = self.research_cache.record_hit(cached["fetch_ms"])
+                else:
+                    results = self._search_vector_titles(query, limit)
+                    if results:
+                        log.info("🧠 Found matching pages in vector memory.")
+                        source = "vector_cache"
+                        saved_ms = self.research_cache.record_hit(0.0)
             except Exception as cache_err:
                 log.warning(
                     f"⚠️ Cache lookup failed (continuing to live search): {cache_err}"
                 )
+                results = None
 
-            results = self._execute_wiki(wikipedia.search, query, results=limit)
+            if not results:
+                started_at = time.perf_counter()
+                results = self._execute_wiki(wikipedia.search, query, results=limit)
+                fetch_ms = (time.perf_counter() - started_at) * 1000
+                self.research_cache.record_live_search(fetch_ms)
+
+                if results:
+                    try:
+                        self.research_cache.store_search(query, results, limit, fetch_ms)
+                    except Exception as cache_write_err:
+                        log.warning(
+                            f"⚠️ Failed to cache search (non-critical): {cache_write_err}"
+                        )
 
             if not results:
                 raise ResourceNotFoundError(
@@ -131,13 +144,31 @@ class ResearchHandler(BaseHandler):
                 owned_tools_count=owned_tools_count,
             )
             result["results"] = results
-            result["source"] = "live"
+            result["source"] = source
+            result["cache"] = {
+                **self.research_cache.get_stats(),
+                "hit": source != "live",
+                "saved_ms_this_call": round(saved_ms, 1),
+            }
 
             return result
 
         except Exception as e:
             return self.format_error("wiki_search", e)
 
+    def _search_vector_titles(self, query: str, limit: int) -> list:
+        local_check = self.vector_db.query(query_texts=[query], n_results=limit)
+
+        distances = (local_check.get("distances") or [[]])[0]
+        metadatas = (local_check.get("metadatas") or [[]])[0]
+
+        titles = []
+        for distance, metadata in zip(distances, metadatas):
+            title = (metadata or {}).get("title")
+            if distance < 0.2 and title and title not in titles:
+                titles.append(title)
+        return titles
+
     def handle_wiki_read(self, params: Any) -> Dict:
         try:
             log.debug(f"📖 wiki_read params type: {type(params)}")
@@ -158,32 +189,35 @@ class ResearchHandler(BaseHandler):
                     suggestion="Provide a valid Wikipedia page title (at least 2 characters).",
                 )
 
+            focus = getattr(params, "focus", None) or (
+                params.get("focus") if isinstance(params, dict) else None
+            )
+            relevance_query = focus or topic
+
             try:
-                log.debug(f"🔍 Checking vector cache for: {topic}")
-                existing = self.vector_db.get(where={"title": topic}, limit=1)
+                log.debug(f"🔍 Checking page manifest for: {topic}")
+                manifest = self.research_cache.get_page_manifest(topic)
+                if not manifest:
+                    canonical = self.research_cache.get_canonical_title(topic)
+                    manifest = canonical and self.research_cache.get_page_manifest(
+                        canonical
+                    )
+                chunks = (
+                    self.wiki_ingestor.relevant_chunks(
+                        manifest["title"], relevance_query
+                    )
+                    if manifest
+                    else []
+                )
 
-                if existing and existing.get("documents"):
+                if chunks:
                     log.success(
                         f"⚡ Cache Hit: '{topic}' retrieved from vector memory."
                     )
-
-                    content = existing["documents"][0]
-                    result_text = f"Page '{topic}' retrieved from CACHE ({len(content)} chars).\n\nContent: {content[:500]}..."
-                    anti_loop = f"Page '{topic}' loaded from cache. You now have the content. Do NOT read again - use the information to complete your research task."
-                    owned_tools_count = len(self.memory_handler.get_owned_tools())
-                    result = self.format_success(
-                        action_name="wiki_read",
-                        result_data=result_text,
-                        anti_loop_hint=anti_loop,
-                        xp_gained=ProgressionSystem.get_xp_value("wiki_read"),
-                        owned_tools_count=owned_tools_count,
+                    self.research_cache.touch_page(manifest["title"])
+                    return self._wiki_read_result(
+                        manifest["title"], manifest["url"], manifest, chunks, "cache"
                     )
-                    result["title"] = topic
-                    result["content"] = content
-                    result["url"] = existing["metadatas"][0].get("url", "N/A")
-                    result["source"] = "cache"
-
-                    return result
 
             except Exception as cache_err:
                 log.warning(f"⚠️ Cache lookup failed (continuing to live): {cache_err}")
@@ -191,45 +225,33 @@ class ResearchHandler(BaseHandler):
             log.info(f"📖 Cache Miss. Fetching from Wikipedia: {topic}")
 
             try:
-                try:
-                    topic = self.resolve_wiki_title(topic)
-                    page = self._execute_wiki(wikipedia.page, topic, auto_suggest=False)
-                except ResourceNotFoundError:
-                    log.warning(f"⚠️ Exact title failed, trying auto_suggest: {topic}")
-                    page = self._execute_wiki(wikipedia.page, topic, auto_suggest=True)
-
-                content = page.content[:5000]
+                page = self.resolve_wiki_page(topic)
 
+                manifest = None
+                chunks = []
                 try:
-                    self.vector_db.add(
-                        documents=[content],
-                        ids=[f"page_{int(time.time())}"],
-                        metadatas=[
-                            {"title": page.title, "url": page.url, "type": "full_page"}
-                        ],
+                    manifest = self.wiki_ingestor.ingest_page(
+                        page.title, page.url, page.content
+                    )
+                    chunks = self.wiki_ingestor.relevant_chunks(
+                        page.title, relevance_query
                     )
-                    log.success(f"💾 Cached page: {page.title}")
                 except Exception as cache_write_err:
                     log.warning(
                         f"⚠️ Failed to cache page (non-critical): {cache_write_err}"
                     )
 
-                result_text = f"Page '{page.title}' fetched from Wikipedia ({len(content)} chars).\n\nURL: {page.url}\n\nContent: {content[:500]}..."
-                anti_loop = f"Page '{page.title}' loaded and CACHED. You now have the content. Do NOT read again - use it to complete research_complete."
-                owned_tools_count = len(self.memory_handler.get_owned_tools())
-                result = self.format_success(
-                    action_name="wiki_read",
-                    result_data=result_text,
-                    anti_loop_hint=anti_loop,
-                    xp_gained=ProgressionSystem.get_xp_value("wiki_read"),
-                    owned_tools_count=owned_tools_count,
-                )
-                result["title"] = page.title
-                result["content"] = content
-                result["url"] = page.url
-                result["source"] = "live"
+                if not chunks:
+                    chunks = [
+                        {
+                            "text": page.content[: settings.WIKI_CHUNK_SIZE],
+                            "section": "Introduction",
+                        }
+                    ]
 
-                return result
+                return self._wiki_read_result(
+                    page.title, page.url, manifest, chunks, "live"
+                )
 
             except (ResourceNotFoundError, APICommunicationError, SystemLogicError):
                 raise
@@ -237,6 +259,40 @@ class ResearchHandler(BaseHandler):
         except Exception as e:
             return self.format_error("wiki_read", e)
 
+    def _wiki_read_result(
+        self, title: str, url: str, manifest: Dict, chunks: list, source: str
+    ) -> Dict:
+        content = "\n\n".join(chunk["text"] for chunk in chunks)
+        total_chunks = len(manifest["chunk_ids"]) if manifest else len(chunks)
+        excerpts = "\n\n".join(
+            f"[§ {chunk.get('section') or 'Introduction'}] {chunk['text'][:400]}..."
+            for chunk in chunks
+        )
+
+        if source == "cache":
+            result_text = f"Page '{title}' retrieved from CACHE ({len(chunks)} most relevant of {total_chunks} chunks).\n\nContent:\n{excerpts}"
+            anti_loop = f"Page '{title}' loaded from cache. You now have the content. Do NOT read again - use the information to complete your research task."
+        else:
+            result_text = f"Page '{title}' fetched from Wikipedia and indexed ({total_chunks} chunks).\n\nURL: {url}\n\nContent:\n{excerpts}"
+            anti_loop = f"Page '{title}' loaded and CACHED. You now have the content. Do NOT read again - use it to complete research_complete."
+
+        owned_tools_count = len(self.memory_handler.get_owned_tools())
+        result = self.format_success(
+            action_name="wiki_read",
+            result_data=result_text,
+            anti_loop_hint=anti_loop,
+            xp_gained=ProgressionSystem.get_xp_value("wiki_read"),
+            owned_tools_count=owned_tools_count,
+        )
+        result["title"] = title
+        result["content"] = content
+        result["url"] = url or "N/A"
+        result["source"] = source
+        result["chunks"] = len(chunks)
+        result["total_chunks"] = total_chunks
+
+        return result
+
     def handle_research_complete(self, params: Any) -> Dict:
         try:
             log.debug(f"🧪 research_complete params type: {type(params)}")
@@ -347,13 +403,9 @@ class ResearchHandler(BaseHandler):
                 )
 
             try:
-                results = self.vector_db.query(query_texts=[query], n_results=limit)
+                chunks = self.wiki_ingestor.search_chunks(query, limit)
 
-                if (
-                    not results
-                    or not results.get("documents")
-                    or not results["documents"][0]
-                ):
+                if not chunks:
                     result_text = f"No cached research found for '{query}'."
                     anti_loop = f"Cache is empty for '{query}'. Use wiki_search to find new content instead of querying cache again."
                     owned_tools_count = len(self.memory_handler.get_owned_tools())
@@ -365,11 +417,13 @@ class ResearchHandler(BaseHandler):
                     )
 
                 snippets = []
-                for i, doc in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i]
-                    title = metadata.get("title", "Unknown")
-                    snippet = doc[:200] + "..." if len(doc) > 200 else doc
-                    snippets.append(f"• {title}: {snippet}")
+                for chunk in chunks:
+                    doc = chunk["text"]
+                    label = chunk["title"]
+                    if chunk.get("section"):
+                        label += f" § {chunk['section']}"
+                    snippet = doc[:400] + "..." if len(doc) > 400 else doc
+                    snippets.append(f"• {label}: {snippet}")
 
                 result_text = f"CACHED RESEARCH for '{query}':\n" + "\n".join(snippets)
                 anti_loop = f"Cache results for '{query}' retrieved. You now have the cached content. Do NOT query cache again - use the information."
@@ -388,39 +442,99 @@ class ResearchHandler(BaseHandler):
         except Exception as e:
             return self.format_error("research_query_cache", e)
 
-    def resolve_wiki_title(self, topic: str) -> str:
+    def handle_wiki_topics(self, params: Any) -> Dict:
+        try:
+            page = getattr(params, "page", 1) or 1
+            if page < 1:
+                raise FormattingError(
+                    message=f"Invalid page: {page}. Must be 1 or greater.",
+                    suggestion="Start with page=1 and increase to see older topics.",
+                )
 
-        if not topic or not topic.strip():
-            raise FormattingError(
-                message="Empty topic provided.",
-                suggestion="Provide a valid Wikipedia page title or query.",
+            page_size = settings.RESEARCH_TOPICS_PAGE_SIZE
+            total = self.research_cache.count_topics()
+            total_pages = max(1, (total + page_size - 1) // page_size)
+            if page > total_pages:
+                raise FormattingError(
+                    message=f"Invalid page: {page}. Only {total_pages} page(s) of cached topics.",
+                    suggestion=f"Use a page between 1 and {total_pages}.",
+                )
+
+            topics = self.research_cache.list_topics(
+                limit=page_size, offset=(page - 1) * page_size
             )
+            owned_tools_count = len(self.memory_handler.get_owned_tools())
+            if not topics:
+                return self.format_success(
+                    action_name="wiki_topics",
+                    result_data="No research cached yet.",
+                    anti_loop_hint="The research cache is empty. Use wiki_search and wiki_read to build knowledge.",
+                    owned_tools_count=owned_tools_count,
+                )
 
-        cleaned = " ".join(topic.strip().split())
+            lines = [
+                f"• **{t['title']}** ({t['chunk_count']} chunks)"
+                if t["chunk_count"]
+                else f"• **{t['title']}** (cached)"
+                for t in topics
+            ]
+            result_text = (
+                f"Cached topics (page {page}/{total_pages}, {total} total):\n"
+                + "\n".join(lines)
+            )
+            if page < total_pages:
+                result_text += f"\nUse page={page + 1} for older topics."
+            anti_loop = "Topic list retrieved. These pages are ALREADY cached - use research_query_cache instead of searching them again."
+            return self.format_success(
+                action_name="wiki_topics",
+                result_data=result_text,
+                anti_loop_hint=anti_loop,
+                owned_tools_count=owned_tools_count,
+            )
+
+        except Exception as e:
+            return self.format_error("wiki_topics", e)
 
+    def _fetch_page_or_none(self, title: str, follow_disambiguation: bool = True):
         try:
-            page = wikipedia.page(cleaned, auto_suggest=False)
-            return page.title
+            return wikipedia.page(title, auto_suggest=False)
         except wikipedia.exceptions.PageError:
-            pass
+            return None
         except wikipedia.exceptions.DisambiguationError as e:
-            return e.options[0]
+            if follow_disambiguation and e.options:
+                log.info(f"🔀 '{title}' is ambiguous, using '{e.options[0]}'")
+                return self._fetch_page_or_none(e.options[0], follow_disambiguation=False)
+            return None
 
-        try:
-            page = wikipedia.page(cleaned, auto_suggest=True)
-            return page.title
-        except wikipedia.exceptions.DisambiguationError as e:
-            return e.options[0]
-        except wikipedia.exceptions.PageError:
-            pass
+    def resolve_wiki_page(self, topic: str):
 
-        try:
-            results = wikipedia.search(cleaned, results=1)
-            if results:
-                page = wikipedia.page(results[0], auto_suggest=False)
-                return page.title
-        except Exception:
-            pass
+        if not topic or not topic.strip():
+            raise FormattingError(
+                message="Empty topic provided.",
+                suggestion="Provide a valid Wikipedia page title or query.",
+            )
+
+        cleaned = " ".join(topic.strip().split())
+
+        canonical = self.research_cache.get_canonical_title(cleaned)
+        if canonical:
+            page = self._execute_wiki(self._fetch_page_or_none, canonical)
+            if page:
+                return page
+            self.research_cache.forget_title_alias(cleaned)
+
+        if canonical != cleaned:
+            page = self._execute_wiki(self._fetch_page_or_none, cleaned)
+            if page:
+                self.research_cache.store_title_alias(cleaned, page.title)
+                return page
+
+        results = self._execute_wiki(wikipedia.search, cleaned, results=1)
+        if results:
+            page = self._execute_wiki(self._fetch_page_or_none, results[0])
+            if page:
+                self.research_cache.store_title_alias(cleaned, page.title)
+                return page
 
         raise ResourceNotFoundError(
             message=f"Could not resolve Wikipedia title: '{topic}'",
@@ -1,5 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from src.handlers.base_handler import BaseHandler
 from src.utils import log
 from src.providers.moltbook_provider import MoltbookProvider
@@ -11,6 +12,7 @@ from src.utils.exceptions import (
     RateLimitError,
 )
 from src.managers.progression_system import ProgressionSystem
+from src.settings import settings
 
 
 class SocialHandler(BaseHandler):
@@ -18,6 +20,10 @@ class SocialHandler(BaseHandler):
         self.test_mode = test_mode
         self.memory = memory_handler
         self._enable_auto_wait = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.MOLTBOOK_MAX_CONCURRENCY,
+            thread_name_prefix="moltbook",
+        )
         if not test_mode:
             self.api = MoltbookProvider(llm_provider=llm_provider)
         else:
@@ -98,6 +104,21 @@ class SocialHandler(BaseHandler):
             log.error(f"💥 Internal System Error in {func_name}: {str(e)}")
             raise SystemLogicError(f"Social handler failure: {str(e)}")
 
+    def _call_api_batch(self, calls: List[Tuple[str, tuple]]) -> List[Any]:
+        futures = [
+            self._executor.submit(self._call_api, func_name, *args)
+            for func_name, args in calls
+        ]
+
+        results = []
+        for (func_name, _), future in zip(calls, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                log.warning(f"⚠️ Batched {func_name} failed: {e}")
+                results.append(e)
+        return results
+
     def handle_read_post(self, params: Any) -> Dict:
 
         try:
@@ -668,6 +689,9 @@ class SocialHandler(BaseHandler):
     def handle_refresh_feed(self, params: Any) -> Dict:
 
         try:
+            if self.api:
+                self.api.invalidate_reads()
+
             result_text = "Feed refreshed. List view updated."
             anti_loop = "Feed refreshed. Do NOT refresh again immediately - read posts, comment, or vote first."
             owned_tools_count = len(self.memory.get_owned_tools())
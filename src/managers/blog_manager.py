@@ -1,9 +1,15 @@
+import threading
+import time
+import uuid
 import requests
 import markdown
 import nh3
-from typing import Dict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
 from src.utils import log
 from src.settings import settings
+from src.utils.image_cache import MIME_EXTENSIONS, decode_data_uri
 from src.providers.sd_provider import SDProvider
 from src.providers.proxy_sd_provider import ProxySDProvider
 from src.providers.fal_ai_provider import FalAiProvider
@@ -27,6 +33,109 @@ class BlogManager:
         else:
             self.image_generator = FalAiProvider(fal_api_key=settings.FAL_API_KEY)
 
+        self._image_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="blog-image"
+        )
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="blog-upload"
+        )
+        self._publish_jobs = deque(maxlen=settings.BLOG_PUBLISH_HISTORY)
+        self._publish_lock = threading.Lock()
+
+    def _headers(self, **extra) -> Dict:
+        return {
+            "X-API-Key": self.blog_api_key,
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+            **extra,
+        }
+
+    def start_image_generation(self, image_prompt: str) -> Future:
+        log.info(f"🎨 Header image generation started: {image_prompt[:50]}...")
+        return self._image_executor.submit(
+            self.image_generator.generate_image, image_prompt
+        )
+
+    def submit_article(
+        self,
+        title: str,
+        excerpt: str,
+        content: str,
+        image_future: Future,
+    ) -> Dict:
+        job = {
+            "id": uuid.uuid4().hex[:8],
+            "title": title,
+            "status": "generating_image",
+            "created_at": time.time(),
+            "finished_at": None,
+            "url": None,
+            "error": None,
+            "xp_awarded": False,
+        }
+        with self._publish_lock:
+            self._publish_jobs.append(job)
+
+        job["future"] = self._upload_executor.submit(
+            self._run_publish_job, job, excerpt, content, image_future
+        )
+        log.info(f"📤 Article queued for background publishing: {title[:50]}...")
+        return job
+
+    def _run_publish_job(
+        self,
+        job: Dict,
+        excerpt: str,
+        content: str,
+        image_future: Future,
+    ) -> Dict:
+        try:
+            image_data = image_future.result()
+        except Exception as e:
+            log.error(f"Image generation failed for '{job['title'][:30]}': {e}")
+            image_data = None
+
+        if not image_data:
+            result = {"success": False, "error": "Image generation failed"}
+        else:
+            job["status"] = "uploading"
+            result = self._upload_article(job["title"], excerpt, content, image_data)
+
+        with self._publish_lock:
+            job["finished_at"] = time.time()
+            if result.get("success"):
+                job["url"] = result.get("url", "")
+                job["status"] = "published"
+            else:
+                job["error"] = result.get("error", "Unknown error")
+                job["status"] = "failed"
+        return result
+
+    @staticmethod
+    def _public_job(job: Dict) -> Dict:
+        return {key: value for key, value in job.items() if key != "future"}
+
+    def get_publish_jobs(self) -> List[Dict]:
+        with self._publish_lock:
+            jobs = [self._public_job(job) for job in self._publish_jobs]
+        return list(reversed(jobs))
+
+    def claim_published_jobs(self) -> List[Dict]:
+        with self._publish_lock:
+            claimed = [
+                job
+                for job in self._publish_jobs
+                if job["status"] == "published" and not job["xp_awarded"]
+            ]
+            for job in claimed:
+                job["xp_awarded"] = True
+            return [self._public_job(job) for job in claimed]
+
+    def wait_for_publishing(self, timeout: Optional[float] = None) -> bool:
+        with self._publish_lock:
+            futures = [job["future"] for job in self._publish_jobs if "future" in job]
+        _, pending = wait(futures, timeout=timeout)
+        return not pending
+
     def post_article(
         self, title: str, excerpt: str, content: str, image_prompt: str
     ) -> Dict:
@@ -40,32 +149,61 @@ class BlogManager:
             }
         try:
             image_data = self.image_generator.generate_image(image_prompt)
+        except Exception as e:
+            log.error(f"Failed to generate image: {e}")
+            image_data = None
 
-            if not image_data:
-                log.error("Failed to generate image, aborting article post")
-                return {"success": False, "error": "Image generation failed"}
+        if not image_data:
+            log.error("Failed to generate image, aborting article post")
+            return {"success": False, "error": "Image generation failed"}
 
-            headers = {
-                "X-API-Key": self.blog_api_key,
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            }
+        return self._upload_article(title, excerpt, content, image_data)
 
-            data = {
-                "title": title,
-                "excerpt": excerpt,
-                "content": content,
-                "image_data": image_data,
-            }
+    def _send_article(
+        self, title: str, excerpt: str, content: str, image_data: str, multipart: bool
+    ) -> requests.Response:
+        url = f"{self.blog_api_url}/post_article.php"
+        if not multipart:
+            return requests.post(
+                url,
+                headers=self._headers(**{"Content-Type": "application/json"}),
+                json={
+                    "title": title,
+                    "excerpt": excerpt,
+                    "content": content,
+                    "image_data": image_data,
+                },
+                timeout=30,
+            )
 
+        mime_type, image_bytes = decode_data_uri(image_data)
+        filename = f"header.{MIME_EXTENSIONS.get(mime_type, 'png')}"
+        return requests.post(
+            url,
+            headers=self._headers(),
+            data={"title": title, "excerpt": excerpt, "content": content},
+            files={"image": (filename, image_bytes, mime_type)},
+            timeout=30,
+        )
+
+    def _upload_article(
+        self, title: str, excerpt: str, content: str, image_data: str
+    ) -> Dict:
+        try:
             log.info(f"Posting article to blog: {title[:50]}...")
 
-            response = requests.post(
-                f"{self.blog_api_url}/post_article.php",
-                headers=headers,
-                json=data,
-                timeout=30,
-            )
+            multipart = settings.BLOG_MULTIPART_UPLOAD
+            response = self._send_article(title, excerpt, content, image_data, multipart)
+
+            if (
+                multipart
+                and response.status_code == 400
+                and "Invalid JSON" in response.text
+            ):
+                log.warning("⚠️ Blog server does not accept multipart yet, retrying as JSON")
+                response = self._send_article(
+                    title, excerpt, content, image_data, multipart=False
+                )
 
             if response.status_code == 201:
                 result = response.json()
@@ -98,11 +236,7 @@ class BlogManager:
 
     def list_articles(self) -> list:
         try:
-            headers = {
-                "X-API-Key": self.blog_api_key,
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-            }
+            headers = self._headers(Accept="application/json")
             url = f"{self.blog_api_url}/get_articles.php"
             log.info(f"Syncing from: {url}")
             response = requests.get(
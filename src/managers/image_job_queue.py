@@ -0,0 +1,188 @@
+import hashlib
+import json
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+from src.settings import settings
+from src.utils import log
+
+
+class ImageQueueFullError(Exception):
+    pass
+
+
+class ImageJobQueue:
+    def __init__(
+        self,
+        generate: Callable[..., Optional[str]],
+        timings_provider: Optional[Callable[[], Dict]] = None,
+    ):
+        self.generate = generate
+        self.timings_provider = timings_provider
+        self._queue: "queue.Queue[Dict]" = queue.Queue(
+            maxsize=settings.IMAGE_QUEUE_MAX_SIZE
+        )
+        self._jobs: Dict[str, Dict] = {}
+        self._inflight: Dict[str, str] = {}
+        self._seeded_results: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.metrics = {
+            "submitted": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "total_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+        }
+        self._worker = threading.Thread(
+            target=self._run_worker, name="image-worker", daemon=True
+        )
+        self._worker.start()
+
+    @staticmethod
+    def _job_key(payload: Dict) -> str:
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def submit(self, payload: Dict) -> Dict:
+        key = self._job_key(payload)
+
+        with self._lock:
+            self._prune_finished()
+
+            job_id = self._inflight.get(key) or self._seeded_results.get(key)
+            if job_id in self._jobs:
+                self.metrics["coalesced"] += 1
+                log.info(f"🔗 Coalesced image request into job {job_id}")
+                return {**self._public_view(self._jobs[job_id]), "coalesced": True}
+
+            job = {
+                "id": uuid.uuid4().hex,
+                "key": key,
+                "payload": payload,
+                "status": "queued",
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "timings": {},
+                "future": Future(),
+            }
+
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self.metrics["rejected"] += 1
+                raise ImageQueueFullError(
+                    f"Image queue is full ({self._queue.maxsize} jobs pending)"
+                )
+
+            self._jobs[job["id"]] = job
+            self._inflight[key] = job["id"]
+            self.metrics["submitted"] += 1
+
+        return {**self._public_view(job), "coalesced": False}
+
+    def _run_worker(self):
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                job["status"] = "running"
+                job["started_at"] = time.time()
+
+            data_uri, error, timings = None, None, {}
+            try:
+                data_uri = self.generate(**job["payload"])
+                if data_uri is None:
+                    raise RuntimeError("Image generation failed")
+                if self.timings_provider:
+                    timings = dict(self.timings_provider())
+            except Exception as e:
+                error = e
+
+            with self._lock:
+                job["finished_at"] = time.time()
+                job["timings"] = timings
+                job["status"] = "failed" if error else "done"
+                job["error"] = str(error) if error else None
+                self._inflight.pop(job["key"], None)
+                if job["status"] == "done" and job["payload"].get("seed") is not None:
+                    self._seeded_results[job["key"]] = job["id"]
+                self.metrics["completed" if job["status"] == "done" else "failed"] += 1
+                self.metrics["total_wait_seconds"] += job["started_at"] - job["created_at"]
+                self.metrics["total_run_seconds"] += job["finished_at"] - job["started_at"]
+
+            if error:
+                job["future"].set_exception(error)
+            else:
+                job["future"].set_result(data_uri)
+            self._queue.task_done()
+
+    def _prune_finished(self):
+        cutoff = time.time() - settings.IMAGE_JOB_RETENTION_SECONDS
+        stale = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job["finished_at"] and job["finished_at"] < cutoff
+        ]
+        for job_id in stale:
+            job = self._jobs.pop(job_id)
+            if self._seeded_results.get(job["key"]) == job_id:
+                del self._seeded_results[job["key"]]
+
+    def get_future(self, job_id: str) -> Optional[Future]:
+        job = self._jobs.get(job_id)
+        return job["future"] if job else None
+
+    def _public_view(self, job: Dict) -> Dict:
+        view = {
+            "job_id": job["id"],
+            "status": job["status"],
+            "created_at": job["created_at"],
+            "started_at": job["started_at"],
+            "finished_at": job["finished_at"],
+        }
+        if job["status"] == "queued":
+            view["queue_depth"] = self._queue.qsize()
+        if job["finished_at"]:
+            view["timings"] = {
+                **job["timings"],
+                "queue_wait_seconds": round(job["started_at"] - job["created_at"], 3),
+                "run_seconds": round(job["finished_at"] - job["started_at"], 3),
+            }
+        if job["status"] == "failed":
+            view["error"] = job["error"]
+        return view
+
+    def describe(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            view = self._public_view(job)
+        if job["status"] == "done":
+            view["data_uri"] = job["future"].result()
+        return view
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            metrics = dict(self.metrics)
+            finished = metrics["completed"] + metrics["failed"]
+            running = sum(1 for job in self._jobs.values() if job["status"] == "running")
+
+        metrics["queue_depth"] = self._queue.qsize()
+        metrics["queue_capacity"] = self._queue.maxsize
+        metrics["running"] = running
+        total_wait_seconds = metrics.pop("total_wait_seconds")
+        total_run_seconds = metrics.pop("total_run_seconds")
+        metrics["avg_wait_seconds"] = (
+            round(total_wait_seconds / finished, 3) if finished else 0.0
+        )
+        metrics["avg_run_seconds"] = (
+            round(total_run_seconds / finished, 3) if finished else 0.0
+        )
+        return metrics
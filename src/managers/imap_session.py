@@ -0,0 +1,133 @@
+import imaplib
+import threading
+import time
+from typing import Any, Callable, Optional
+from src.settings import settings
+from src.utils import log
+from src.utils.exceptions import AccessDeniedError
+
+CONNECTION_ERRORS = (imaplib.IMAP4.abort, OSError)
+
+
+class ImapSession:
+    def __init__(
+        self,
+        create_mailbox: Callable,
+        user: str,
+        password: str,
+        folder: str = "INBOX",
+        on_connect: Optional[Callable[[], None]] = None,
+    ):
+        self.create_mailbox = create_mailbox
+        self.on_connect = on_connect
+        self.user = user
+        self.password = password
+        self.folder = folder
+        self.lock = threading.RLock()
+        self._mailbox = None
+        self._last_used = 0.0
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        self.connections = 0
+        self.reconnects = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._mailbox is not None
+
+    def _connect(self):
+        mailbox = self.create_mailbox()
+        try:
+            mailbox.login(self.user, self.password, initial_folder=self.folder)
+        except CONNECTION_ERRORS:
+            raise
+        except Exception as e:
+            log.error(f"❌ Email authentication failed: {e}")
+            raise AccessDeniedError(
+                message=f"Could not authenticate to mail server: {str(e)}",
+                suggestion="Check your email credentials (IMAP_SERVER, EMAIL, PASSWORD) in settings.",
+            )
+
+        self._mailbox = mailbox
+        self._last_used = time.monotonic()
+        self.connections += 1
+        log.info(f"📥 Mailbox connected: {self.user}")
+        self._start_heartbeat()
+        if self.on_connect is not None:
+            try:
+                self.on_connect()
+            except Exception as e:
+                log.warning(f"⚠️ IMAP on_connect hook failed: {e}")
+
+    def _drop(self):
+        mailbox, self._mailbox = self._mailbox, None
+        if mailbox is not None:
+            try:
+                mailbox.logout()
+            except Exception:
+                pass
+
+    def _is_alive(self) -> bool:
+        try:
+            status, _ = self._mailbox.client.noop()
+            return status == "OK"
+        except CONNECTION_ERRORS + (imaplib.IMAP4.error,):
+            return False
+
+    def get(self):
+        with self.lock:
+            if self._mailbox is not None:
+                idle = time.monotonic() - self._last_used
+                if idle >= settings.IMAP_KEEPALIVE_INTERVAL and not self._is_alive():
+                    log.warning("⚠️ IMAP session went stale, reconnecting")
+                    self._drop()
+                    self.reconnects += 1
+
+            if self._mailbox is None:
+                self._connect()
+            return self._mailbox
+
+    def run(self, operation: Callable[[Any], Any]):
+        with self.lock:
+            try:
+                result = operation(self.get())
+            except CONNECTION_ERRORS as e:
+                log.warning(f"⚠️ IMAP connection lost ({e}), reconnecting")
+                self._drop()
+                self.reconnects += 1
+                result = operation(self.get())
+            self._last_used = time.monotonic()
+            return result
+
+    def _start_heartbeat(self):
+        if self._heartbeat is not None and self._heartbeat.is_alive():
+            return
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat, name="imap-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
+
+    def _run_heartbeat(self):
+        interval = settings.IMAP_KEEPALIVE_INTERVAL
+        while not self._stop.wait(interval):
+            if not self.lock.acquire(blocking=False):
+                continue
+            try:
+                if self._mailbox is None:
+                    continue
+                if time.monotonic() - self._last_used < interval:
+                    continue
+                if self._is_alive():
+                    self._last_used = time.monotonic()
+                else:
+                    log.debug("📭 IMAP heartbeat failed, dropping session until next use")
+                    self._drop()
+            finally:
+                self.lock.release()
+
+    def close(self):
+        self._stop.set()
+        with self.lock:
+            if self._mailbox is not None:
+                self._drop()
+                log.info("🔌 Email session terminated.")
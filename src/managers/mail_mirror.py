@@ -0,0 +1,329 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from imap_tools import AND, U, MailMessageFlags
+from src.settings import settings
+from src.utils import log
+from src.utils.database import get_database
+from src.managers.imap_session import ImapSession
+
+
+class MailMirror:
+    def __init__(
+        self,
+        db_path: str,
+        imap: ImapSession,
+        clean_html: Callable[[str], str],
+        folder: str = "INBOX",
+    ):
+        self.db = get_database(db_path)
+        self.imap = imap
+        self.clean_html = clean_html
+        self.folder = folder
+        self._sync_lock = threading.Lock()
+        self._last_sync = 0.0
+        self._init_tables()
+
+    @property
+    def conn(self):
+        return self.db.conn
+
+    def _init_tables(self):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mail_folder_state (
+                folder TEXT PRIMARY KEY,
+                uidvalidity INTEGER NOT NULL,
+                last_uid INTEGER DEFAULT 0,
+                synced_at REAL DEFAULT 0
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mail_messages (
+                folder TEXT NOT NULL,
+                uid INTEGER NOT NULL,
+                subject TEXT,
+                from_addr TEXT,
+                date TEXT,
+                seen INTEGER DEFAULT 0,
+                body TEXT,
+                PRIMARY KEY (folder, uid)
+            )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mail_messages_seen ON mail_messages(folder, seen, uid DESC)"
+        )
+        self.db.commit()
+
+    @staticmethod
+    def _row_to_message(row) -> Dict:
+        return {
+            "uid": str(row["uid"]),
+            "subject": row["subject"] or "",
+            "from": row["from_addr"] or "",
+            "date": row["date"],
+            "seen": bool(row["seen"]),
+            "body": row["body"],
+        }
+
+    def _extract_body(self, msg) -> str:
+        body = msg.text or ""
+        if not body.strip() and msg.html:
+            body = self.clean_html(msg.html)
+        return body
+
+    def _header_row(self, msg) -> Tuple:
+        return (
+            self.folder,
+            int(msg.uid),
+            msg.subject,
+            msg.from_,
+            msg.date.isoformat() if msg.date else None,
+            int(MailMessageFlags.SEEN in msg.flags),
+        )
+
+    def _store_headers(self, conn, rows: List[Tuple]):
+        conn.executemany(
+            """
+            INSERT INTO mail_messages (folder, uid, subject, from_addr, date, seen)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(folder, uid) DO UPDATE SET
+                subject = excluded.subject,
+                from_addr = excluded.from_addr,
+                date = excluded.date,
+                seen = excluded.seen
+        """,
+            rows,
+        )
+
+    def _get_state(self) -> Optional[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT uidvalidity, last_uid FROM mail_folder_state WHERE folder = ?",
+            (self.folder,),
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def _poll(self, mailbox, state: Optional[Dict], counts: Dict, reconcile: bool) -> Tuple:
+        status = mailbox.folder.status(
+            self.folder, ["MESSAGES", "UNSEEN", "UIDVALIDITY", "UIDNEXT"]
+        )
+
+        uidvalidity = status["UIDVALIDITY"]
+        last_uid = 0
+        reset = False
+        if state and state["uidvalidity"] == uidvalidity:
+            last_uid = state["last_uid"]
+        elif state:
+            log.warning(f"📭 UIDVALIDITY changed for {self.folder}, rebuilding mirror")
+            reset = True
+
+        new_rows = []
+        if status["UIDNEXT"] - 1 > last_uid:
+            for msg in mailbox.fetch(
+                AND(uid=U(last_uid + 1, "*")),
+                headers_only=True,
+                mark_seen=False,
+                bulk=True,
+            ):
+                if int(msg.uid) <= last_uid:
+                    continue
+                new_rows.append(self._header_row(msg))
+
+        expected_total = counts["total"] + len(new_rows)
+        expected_unseen = counts["unseen"] + sum(1 for row in new_rows if not row[5])
+        existing = unseen = None
+        if (
+            reconcile
+            or reset
+            or status["MESSAGES"] != expected_total
+            or status["UNSEEN"] != expected_unseen
+        ):
+            existing = {int(uid) for uid in mailbox.uids("ALL")}
+            unseen = {int(uid) for uid in mailbox.uids("UNSEEN")}
+
+        uidnext = status["UIDNEXT"]
+        return uidvalidity, uidnext, new_rows, existing, unseen, last_uid, reset
+
+    def sync(self, force: bool = False, reconcile: bool = False) -> int:
+        with self._sync_lock:
+            if not force and time.monotonic() - self._last_sync < settings.MAIL_PREFETCH_TTL:
+                return 0
+
+            state = self._get_state()
+            counts = self.get_counts()
+            uidvalidity, uidnext, new_rows, existing, unseen, last_uid, reset = self.imap.run(
+                lambda mailbox: self._poll(mailbox, state, counts, reconcile)
+            )
+
+            removed = set()
+            with self.db.unit_of_work() as conn:
+                if reset:
+                    conn.execute(
+                        "DELETE FROM mail_messages WHERE folder = ?", (self.folder,)
+                    )
+                self._store_headers(conn, new_rows)
+
+                if existing is not None:
+                    local_uids = {
+                        row["uid"]
+                        for row in conn.execute(
+                            "SELECT uid FROM mail_messages WHERE folder = ?", (self.folder,)
+                        )
+                    }
+                    removed = local_uids - existing
+                    conn.executemany(
+                        "DELETE FROM mail_messages WHERE folder = ? AND uid = ?",
+                        [(self.folder, uid) for uid in removed],
+                    )
+                    conn.execute(
+                        "UPDATE mail_messages SET seen = 1 WHERE folder = ?", (self.folder,)
+                    )
+                    conn.executemany(
+                        "UPDATE mail_messages SET seen = 0 WHERE folder = ? AND uid = ?",
+                        [(self.folder, uid) for uid in unseen],
+                    )
+
+                highest = max([last_uid, uidnext - 1] + [row[1] for row in new_rows])
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO mail_folder_state (folder, uidvalidity, last_uid, synced_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (self.folder, uidvalidity, highest, time.time()),
+                )
+
+            self._last_sync = time.monotonic()
+            if new_rows or removed:
+                log.info(
+                    f"📬 Mail mirror synced: {len(new_rows)} new, {len(removed)} removed"
+                )
+            return len(new_rows)
+
+    def invalidate(self):
+        self._last_sync = 0.0
+
+    def has_snapshot(self) -> bool:
+        return self._get_state() is not None
+
+    def _fetch_bodies(self, uids: List[int]):
+        if not uids:
+            return
+
+        messages = self.imap.run(
+            lambda mailbox: list(
+                mailbox.fetch(
+                    AND(uid=[str(uid) for uid in uids]), mark_seen=False, bulk=True
+                )
+            )
+        )
+
+        with self.db.unit_of_work() as conn:
+            conn.executemany(
+                "UPDATE mail_messages SET body = ? WHERE folder = ? AND uid = ?",
+                [(self._extract_body(msg), self.folder, int(msg.uid)) for msg in messages],
+            )
+
+    def list_messages(
+        self, limit: int = 10, unseen_only: bool = False, with_body: bool = False
+    ) -> List[Dict]:
+        query = "SELECT * FROM mail_messages WHERE folder = ?"
+        if unseen_only:
+            query += " AND seen = 0"
+        query += " ORDER BY uid DESC LIMIT ?"
+
+        rows = self.conn.execute(query, (self.folder, limit)).fetchall()
+        if with_body:
+            missing = [row["uid"] for row in rows if row["body"] is None]
+            if missing:
+                self._fetch_bodies(missing)
+                rows = self.conn.execute(query, (self.folder, limit)).fetchall()
+
+        return [self._row_to_message(row) for row in rows]
+
+    def _fetch_headers(self, uids: List[str]) -> List[Dict]:
+        if not uids:
+            return []
+
+        messages = self.imap.run(
+            lambda mailbox: list(
+                mailbox.fetch(
+                    AND(uid=list(uids)), headers_only=True, mark_seen=False, bulk=True
+                )
+            )
+        )
+
+        rows = [self._header_row(msg) for msg in messages]
+        with self.db.unit_of_work() as conn:
+            self._store_headers(conn, rows)
+
+        placeholders = ",".join("?" for _ in uids)
+        stored = self.conn.execute(
+            f"SELECT * FROM mail_messages WHERE folder = ? AND uid IN ({placeholders}) ORDER BY uid DESC",
+            (self.folder, *[int(uid) for uid in uids]),
+        ).fetchall()
+        return [self._row_to_message(row) for row in stored]
+
+    def search(self, criteria, limit: int = 10, offset: int = 0) -> Tuple[int, List[Dict]]:
+        charset = "US-ASCII" if str(criteria).isascii() else "UTF-8"
+        uids = self.imap.run(lambda mailbox: mailbox.uids(criteria, charset=charset))
+
+        uids = sorted(uids, key=int, reverse=True)
+        return len(uids), self._fetch_headers(uids[offset : offset + limit])
+
+    def get_message(self, uid, with_body: bool = False) -> Optional[Dict]:
+        try:
+            uid = int(uid)
+        except (TypeError, ValueError):
+            return None
+
+        row = self.conn.execute(
+            "SELECT * FROM mail_messages WHERE folder = ? AND uid = ?",
+            (self.folder, uid),
+        ).fetchone()
+        if row is None:
+            if not self._fetch_headers([str(uid)]):
+                return None
+            row = self.conn.execute(
+                "SELECT * FROM mail_messages WHERE folder = ? AND uid = ?",
+                (self.folder, uid),
+            ).fetchone()
+
+        if with_body and row["body"] is None:
+            self._fetch_bodies([uid])
+            row = self.conn.execute(
+                "SELECT * FROM mail_messages WHERE folder = ? AND uid = ?",
+                (self.folder, uid),
+            ).fetchone()
+            if row["body"] is None:
+                self.remove(uid)
+                return None
+
+        return self._row_to_message(row)
+
+    def mark_seen(self, uids, seen: bool = True):
+        uids = [uids] if isinstance(uids, (str, int)) else uids
+        with self.db.unit_of_work() as conn:
+            conn.executemany(
+                "UPDATE mail_messages SET seen = ? WHERE folder = ? AND uid = ?",
+                [(int(seen), self.folder, int(uid)) for uid in uids],
+            )
+
+    def remove(self, uid):
+        with self.db.unit_of_work() as conn:
+            conn.execute(
+                "DELETE FROM mail_messages WHERE folder = ? AND uid = ?",
+                (self.folder, int(uid)),
+            )
+
+    def get_counts(self) -> Dict[str, int]:
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS total, SUM(seen = 0) AS unseen FROM mail_messages WHERE folder = ?",
+            (self.folder,),
+        ).fetchone()
+        return {"total": row["total"] or 0, "unseen": row["unseen"] or 0}
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from src.settings import settings
+from src.utils import log
+from src.managers.mail_mirror import MailMirror
+
+
+class MailWatcher:
+    def __init__(
+        self,
+        connect: Callable,
+        mirror: MailMirror,
+        folder: str = "INBOX",
+        recent_limit: int = 10,
+    ):
+        self.connect = connect
+        self.mirror = mirror
+        self.folder = folder
+        self.recent_limit = recent_limit
+        self.idle_timeout = settings.MAIL_IDLE_TIMEOUT
+        self.max_backoff = settings.MAIL_IDLE_MAX_BACKOFF
+        self._state: Optional[Dict] = None
+        self._state_lock = threading.Lock()
+        self._listeners: List[Callable[[List[Dict], Dict], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.connected = False
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+
+    def add_listener(self, listener: Callable[[List[Dict], Dict], None]):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[List[Dict], Dict], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mail-idle-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def is_live(self) -> bool:
+        return self.connected and self._state is not None
+
+    def get_state(self) -> Optional[Dict]:
+        with self._state_lock:
+            return dict(self._state) if self._state else None
+
+    def _publish_state(self) -> Dict:
+        counts = self.mirror.get_counts()
+        recent = self.mirror.list_messages(limit=self.recent_limit)
+        state = {
+            "unread": counts["unseen"],
+            "total": counts["total"],
+            "recent": recent,
+            "updated_at": time.time(),
+        }
+        with self._state_lock:
+            self._state = state
+        return state
+
+    def refresh_local(self):
+        if self._state is not None:
+            self._publish_state()
+
+    def refresh(self) -> Dict:
+        initial = self._state is None
+        new_count = self.mirror.sync(force=True)
+        state = self._publish_state()
+
+        if new_count and not initial:
+            new_messages = state["recent"][:new_count]
+            log.info(f"📩 {new_count} new email(s) received")
+            for listener in list(self._listeners):
+                try:
+                    listener(new_messages, state)
+                except Exception as e:
+                    log.warning(f"⚠️ Mail listener failed: {e}")
+        return state
+
+    def _run(self):
+        backoff = 1
+        while not self._stop.is_set():
+            mailbox = None
+            try:
+                mailbox = self.connect()
+                self.connected = True
+                self.last_error = None
+                backoff = 1
+                log.info(f"👂 IMAP IDLE watcher listening on {self.folder}")
+                self.refresh()
+
+                while not self._stop.is_set():
+                    responses = mailbox.idle.wait(timeout=self.idle_timeout)
+                    if responses:
+                        self.refresh()
+
+            except Exception as e:
+                self.connected = False
+                self.last_error = str(e)
+                self.reconnects += 1
+                log.warning(
+                    f"⚠️ IMAP IDLE watcher disconnected ({e}), retrying in {backoff}s"
+                )
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+            finally:
+                self.connected = False
+                if mailbox is not None:
+                    try:
+                        mailbox.logout()
+                    except Exception:
+                        pass
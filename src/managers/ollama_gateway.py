@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Deque, Dict, List, Optional
+import httpx
+from src.utils import log
+
+
+class GatewayQueueFullError(Exception):
+    pass
+
+
+class OllamaBackend:
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.healthy = True
+        self.outstanding = 0
+        self.total_requests = 0
+        self.failures = 0
+        self.loaded_models = set()
+        self.last_checked = None
+        self.last_error = None
+
+    def get_stats(self) -> Dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "total_requests": self.total_requests,
+            "failures": self.failures,
+            "loaded_models": sorted(self.loaded_models),
+            "last_checked": self.last_checked,
+            "last_error": self.last_error,
+        }
+
+
+class BackendPool:
+    def __init__(self, urls: List[str], affinity_max_extra: int = 2):
+        self.backends = [OllamaBackend(url) for url in urls]
+        self.affinity_max_extra = affinity_max_extra
+
+    def choose(
+        self, model: Optional[str] = None, exclude: Optional[set] = None
+    ) -> Optional[OllamaBackend]:
+        exclude = exclude or set()
+        candidates = [b for b in self.backends if b.url not in exclude]
+        if not candidates:
+            return None
+
+        healthy = [b for b in candidates if b.healthy] or candidates
+        least_loaded = min(healthy, key=lambda b: b.outstanding)
+
+        with_model = [b for b in healthy if model and model in b.loaded_models]
+        if with_model:
+            affine = min(with_model, key=lambda b: b.outstanding)
+            if affine.outstanding - least_loaded.outstanding <= self.affinity_max_extra:
+                return affine
+
+        return least_loaded
+
+    def acquire(self, backend: OllamaBackend, model: Optional[str] = None):
+        backend.outstanding += 1
+        backend.total_requests += 1
+        if model:
+            backend.loaded_models.add(model)
+
+    def release(self, backend: OllamaBackend):
+        backend.outstanding = max(0, backend.outstanding - 1)
+
+    def mark_failed(self, backend: OllamaBackend, error: Exception):
+        backend.healthy = False
+        backend.failures += 1
+        backend.last_error = str(error)
+        log.warning(f"⚠️ Ollama backend {backend.url} marked unhealthy: {error}")
+
+    async def check_health(self, client: httpx.AsyncClient, timeout: float = 5.0):
+        for backend in self.backends:
+            try:
+                response = await client.get(f"{backend.url}/api/ps", timeout=timeout)
+                response.raise_for_status()
+                models = response.json().get("models", [])
+                backend.loaded_models = {
+                    name
+                    for m in models
+                    for name in (m.get("name"), m.get("model"))
+                    if name
+                }
+                if not backend.healthy:
+                    log.success(f"✅ Ollama backend {backend.url} is healthy again")
+                backend.healthy = True
+                backend.last_error = None
+            except Exception as e:
+                if backend.healthy:
+                    self.mark_failed(backend, e)
+                else:
+                    backend.last_error = str(e)
+            backend.last_checked = time.time()
+
+    def get_stats(self) -> List[Dict]:
+        return [backend.get_stats() for backend in self.backends]
+
+
+class FairRequestQueue:
+    def __init__(self, max_concurrent: int, max_per_key: int, max_queued_per_key: int):
+        self.max_concurrent = max_concurrent
+        self.max_per_key = max_per_key
+        self.max_queued_per_key = max_queued_per_key
+        self._active: Dict[str, int] = defaultdict(int)
+        self._waiting: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._total_active = 0
+        self.granted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+
+    @staticmethod
+    def label(key: str) -> str:
+        return hashlib.sha256((key or "").encode("utf-8")).hexdigest()[:8]
+
+    def _can_run(self, key: str) -> bool:
+        return (
+            self._total_active < self.max_concurrent
+            and self._active.get(key, 0) < self.max_per_key
+        )
+
+    def _grant(self, key: str):
+        self._active[key] += 1
+        self._total_active += 1
+        self.granted += 1
+
+    async def acquire(self, key: str):
+        if key not in self._waiting and self._can_run(key):
+            self._grant(key)
+            return
+
+        waiters = self._waiting.get(key)
+        if waiters is not None and len(waiters) >= self.max_queued_per_key:
+            self.rejected += 1
+            raise GatewayQueueFullError(
+                f"Too many queued requests for this API key ({len(waiters)} waiting)"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(key, deque()).append(future)
+        self.queued += 1
+        queued_at = time.perf_counter()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(key)
+            else:
+                waiters = self._waiting.get(key)
+                if waiters and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiting[key]
+            raise
+        finally:
+            self.total_wait_seconds += time.perf_counter() - queued_at
+
+    def release(self, key: str):
+        remaining = self._active.get(key, 0) - 1
+        if remaining > 0:
+            self._active[key] = remaining
+        else:
+            self._active.pop(key, None)
+        self._total_active = max(0, self._total_active - 1)
+        self._dispatch()
+
+    def _dispatch(self):
+        granted = True
+        while granted and self._total_active < self.max_concurrent:
+            granted = False
+            for key in list(self._waiting):
+                if self._active.get(key, 0) >= self.max_per_key:
+                    continue
+
+                waiters = self._waiting[key]
+                future = waiters.popleft()
+                if waiters:
+                    self._waiting.move_to_end(key)
+                else:
+                    del self._waiting[key]
+
+                if future.cancelled():
+                    granted = True
+                    break
+
+                self._grant(key)
+                future.set_result(None)
+                granted = True
+                break
+
+    def get_stats(self) -> Dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_key": self.max_per_key,
+            "active": self._total_active,
+            "waiting": sum(len(w) for w in self._waiting.values()),
+            "granted": self.granted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "avg_queue_wait_ms": (
+                round(self.total_wait_seconds / self.queued * 1000, 1)
+                if self.queued
+                else 0.0
+            ),
+            "per_key": {
+                self.label(key): {
+                    "active": self._active.get(key, 0),
+                    "waiting": len(self._waiting.get(key, ())),
+                }
+                for key in set(self._active) | set(self._waiting)
+            },
+        }
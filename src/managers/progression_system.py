@@ -1,8 +1,10 @@
-import sqlite3
+import threading
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 from src.utils import log
+from src.utils.database import get_database
 
 
 @dataclass
@@ -24,6 +26,11 @@ class Title:
 class ProgressionSystem:
     XP_BASE = 100
     XP_MULTIPLIER = 1.5
+    PRECOMPUTED_LEVELS = 200
+
+    _xp_per_level: List[int] = []
+    _xp_thresholds: List[int] = [0]
+    _level_table_lock = threading.Lock()
 
     XP_LOOP_PENALTIES = {
         2: -10,
@@ -46,7 +53,7 @@ class ProgressionSystem:
         "email_get_messages": 0,
         "email_mark_as_read": 1,
         "email_read": 1,
-        "email_search": 2,
+        "email_search": 0,
         "email_send": 10,
         "engagement_master": 50,
         "first_post_of_day": 20,
@@ -98,10 +105,88 @@ class ProgressionSystem:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.db = get_database(db_path)
+        self._extend_level_table(level=self.PRECOMPUTED_LEVELS)
+        self._state_lock = threading.RLock()
+        self._listeners: List[Callable[[Dict], None]] = []
         self._init_tables()
         self._init_badges()
+        self._state = self._load_state()
+        self._unlocked_badges = self._load_unlocked_badges()
+        self.db.add_rollback_listener(self.reload)
+
+    @property
+    def conn(self):
+        return self.db.conn
+
+    def _load_state(self) -> Dict:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT total_xp_earned, current_xp_balance, level, current_title FROM progression WHERE id = 1"
+        )
+        prog = cursor.fetchone()
+        return dict(prog) if prog else {}
+
+    def _load_unlocked_badges(self) -> List[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM badges WHERE is_unlocked = 1")
+        return [dict(row) for row in cursor.fetchall()]
+
+    def reload(self):
+        with self._state_lock:
+            self._state = self._load_state()
+            self._unlocked_badges = self._load_unlocked_badges()
+        self._notify_listeners()
+
+    def add_listener(self, callback: Callable[[Dict], None]):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify_listeners(self):
+        status = self.get_current_status()
+        for callback in list(self._listeners):
+            try:
+                callback(status)
+            except Exception as e:
+                log.warning(f"⚠️ Progression listener failed: {e}")
+
+    def _apply_state(
+        self,
+        new_state: Dict,
+        action_type: str,
+        xp_change: int,
+        transaction_type: str,
+        session_id: int = None,
+    ):
+        now = datetime.now().isoformat()
+        with self._state_lock:
+            with self.db.unit_of_work() as conn:
+                conn.execute(
+                    """
+                    UPDATE progression 
+                    SET total_xp_earned = ?, current_xp_balance = ?, level = ?, current_title = ?, updated_at = ?
+                    WHERE id = 1
+                """,
+                    (
+                        new_state["total_xp_earned"],
+                        new_state["current_xp_balance"],
+                        new_state["level"],
+                        new_state["current_title"],
+                        now,
+                    ),
+                )
+                conn.execute(
+                    """
+                    INSERT INTO xp_history (action_type, xp_change, transaction_type, session_id, timestamp)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    (action_type, xp_change, transaction_type, session_id, now),
+                )
+            self._state = new_state
+        self._notify_listeners()
 
     def _init_tables(self):
         cursor = self.conn.cursor()
@@ -220,7 +305,7 @@ class ProgressionSystem:
                 (datetime.now().isoformat(),),
             )
 
-        self.conn.commit()
+        self.db.commit()
 
     def penalize_loop(
         self, loop_count: int, action_type: str, session_id: int = None
@@ -233,43 +318,23 @@ class ProgressionSystem:
             loop_count, -100 - (loop_count - 7) * 25
         )
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM progression WHERE id = 1")
-        prog = cursor.fetchone()
-
-        current_balance = prog["current_xp_balance"]
-        total_earned = prog["total_xp_earned"]
-        current_level = prog["level"]
+        with self._state_lock:
+            prog = dict(self._state)
 
-        new_balance = max(0, current_balance + xp_penalty)
+            current_balance = prog["current_xp_balance"]
+            current_level = prog["level"]
 
-        leveled_down = False
+            new_balance = max(0, current_balance + xp_penalty)
 
-        new_title_text = self._get_title_for_level(current_level).name
-
-        cursor.execute(
-            """
-            UPDATE progression 
-            SET current_xp_balance = ?, updated_at = ?
-            WHERE id = 1
-        """,
-            (new_balance, datetime.now().isoformat()),
-        )
-
-        cursor.execute(
-            """
-            INSERT INTO xp_history (action_type, xp_change, transaction_type, session_id, timestamp)
-            VALUES (?, ?, 'penalty', ?, ?)
-        """,
-            (
-                f"LOOP_PENALTY:{action_type}",
-                xp_penalty,
-                session_id,
-                datetime.now().isoformat(),
-            ),
-        )
+            leveled_down = False
 
-        self.conn.commit()
+            self._apply_state(
+                {**prog, "current_xp_balance": new_balance},
+                action_type=f"LOOP_PENALTY:{action_type}",
+                xp_change=xp_penalty,
+                transaction_type="penalty",
+                session_id=session_id,
+            )
 
         log.warning(
             f"⚠️ LOOP PENALTY: {xp_penalty} XP balance lost for repeating {action_type} {loop_count} times!"
@@ -368,15 +433,38 @@ class ProgressionSystem:
                 (badge.id, badge.name, badge.description, badge.icon),
             )
 
-        self.conn.commit()
+        self.db.commit()
+
+    @classmethod
+    def _extend_level_table(cls, level: int = 0, total_xp: int = 0):
+        with cls._level_table_lock:
+            while (
+                len(cls._xp_thresholds) <= level
+                or cls._xp_thresholds[-1] <= total_xp
+            ):
+                next_level = len(cls._xp_per_level) + 1
+                xp_for_level = int(cls.XP_BASE * (cls.XP_MULTIPLIER ** (next_level - 1)))
+                cls._xp_per_level.append(xp_for_level)
+                cls._xp_thresholds.append(cls._xp_thresholds[-1] + xp_for_level)
 
     def get_xp_for_level(self, level: int) -> int:
-        return int(self.XP_BASE * (self.XP_MULTIPLIER ** (level - 1)))
+        if level < 1:
+            return int(self.XP_BASE * (self.XP_MULTIPLIER ** (level - 1)))
+        if level > len(self._xp_per_level):
+            self._extend_level_table(level=level)
+        return self._xp_per_level[level - 1]
 
     def get_cumulative_xp_threshold(self, level: int) -> int:
         if level <= 1:
             return 0
-        return sum(self.get_xp_for_level(l) for l in range(1, level))
+        if level > len(self._xp_thresholds):
+            self._extend_level_table(level=level)
+        return self._xp_thresholds[level - 1]
+
+    def get_level_for_xp(self, total_xp: int) -> int:
+        if total_xp >= self._xp_thresholds[-1]:
+            self._extend_level_table(total_xp=total_xp)
+        return max(1, bisect_right(self._xp_thresholds, total_xp))
 
     def add_xp(self, action_type: str, session_id: int = None) -> Dict:
         xp_gained = self.XP_REWARDS.get(action_type, 0)
@@ -384,71 +472,51 @@ class ProgressionSystem:
         if xp_gained == 0:
             return {"leveled_up": False, "xp_gained": 0}
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM progression WHERE id = 1")
-        prog = cursor.fetchone()
-
-        total_earned = prog["total_xp_earned"] + xp_gained
-        current_balance = prog["current_xp_balance"] + xp_gained
-        current_level = prog["level"]
-
-        leveled_up = False
-        new_level = current_level
-        level_rewards = []
-
-        xp_threshold = self.get_cumulative_xp_threshold(current_level + 1)
-
-        while total_earned >= xp_threshold:
-            new_level += 1
-            leveled_up = True
-
-            new_title = self._get_title_for_level(new_level)
-            if new_title:
-                level_rewards.append(
-                    {
-                        "type": "title",
-                        "level": new_level,
-                        "title": new_title.name,
-                        "description": new_title.description,
-                    }
-                )
-
-            xp_threshold = self.get_cumulative_xp_threshold(new_level + 1)
-
-            log.success(f"🎊 LEVEL UP! Level {new_level} reached!")
-
-        new_title_text = (
-            self._get_title_for_level(new_level).name
-            if leveled_up
-            else prog["current_title"]
-        )
-
-        xp_needed_next = self.get_xp_for_level(new_level + 1)
-
-        cursor.execute(
-            """
-            UPDATE progression 
-            SET total_xp_earned = ?, current_xp_balance = ?, level = ?, current_title = ?, updated_at = ?
-            WHERE id = 1
-        """,
-            (
-                total_earned,
-                current_balance,
-                new_level,
-                new_title_text,
-                datetime.now().isoformat(),
-            ),
-        )
-
-        cursor.execute(
-            """
-            INSERT INTO xp_history (action_type, xp_change, transaction_type, session_id, timestamp)
-            VALUES (?, ?, 'earned', ?, ?)
-        """,
-            (action_type, xp_gained, session_id, datetime.now().isoformat()),
-        )
+        with self._state_lock:
+            prog = dict(self._state)
+
+            total_earned = prog["total_xp_earned"] + xp_gained
+            current_balance = prog["current_xp_balance"] + xp_gained
+            current_level = prog["level"]
+
+            new_level = max(current_level, self.get_level_for_xp(total_earned))
+            leveled_up = new_level > current_level
+            level_rewards = []
+
+            for reached_level in range(current_level + 1, new_level + 1):
+                new_title = self._get_title_for_level(reached_level)
+                if new_title:
+                    level_rewards.append(
+                        {
+                            "type": "title",
+                            "level": reached_level,
+                            "title": new_title.name,
+                            "description": new_title.description,
+                        }
+                    )
+
+                log.success(f"🎊 LEVEL UP! Level {reached_level} reached!")
+
+            new_title_text = (
+                self._get_title_for_level(new_level).name
+                if leveled_up
+                else prog["current_title"]
+            )
 
-        self.conn.commit()
+            xp_needed_next = self.get_xp_for_level(new_level + 1)
+
+            self._apply_state(
+                {
+                    "total_xp_earned": total_earned,
+                    "current_xp_balance": current_balance,
+                    "level": new_level,
+                    "current_title": new_title_text,
+                },
+                action_type=action_type,
+                xp_change=xp_gained,
+                transaction_type="earned",
+                session_id=session_id,
+            )
 
         return {
             "leveled_up": leveled_up,
@@ -463,36 +531,24 @@ class ProgressionSystem:
 
     def spend_xp(self, amount: int, reason: str = "", session_id: int = None) -> bool:
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT current_xp_balance FROM progression WHERE id = 1")
-        prog = cursor.fetchone()
+        with self._state_lock:
+            prog = dict(self._state)
 
-        current_balance = prog["current_xp_balance"]
+            current_balance = prog["current_xp_balance"]
 
-        if current_balance < amount:
-            log.error(f"❌ Insufficient XP balance: {current_balance} < {amount}")
-            return False
+            if current_balance < amount:
+                log.error(f"❌ Insufficient XP balance: {current_balance} < {amount}")
+                return False
 
-        new_balance = current_balance - amount
-
-        cursor.execute(
-            """
-            UPDATE progression 
-            SET current_xp_balance = ?, updated_at = ?
-            WHERE id = 1
-        """,
-            (new_balance, datetime.now().isoformat()),
-        )
-
-        cursor.execute(
-            """
-            INSERT INTO xp_history (action_type, xp_change, transaction_type, session_id, timestamp)
-            VALUES (?, ?, 'spent', ?, ?)
-        """,
-            (reason, -amount, session_id, datetime.now().isoformat()),
-        )
+            new_balance = current_balance - amount
 
-        self.conn.commit()
+            self._apply_state(
+                {**prog, "current_xp_balance": new_balance},
+                action_type=reason,
+                xp_change=-amount,
+                transaction_type="spent",
+                session_id=session_id,
+            )
 
         log.info(f"💸 Spent {amount} XP on '{reason}'. Balance: {new_balance}")
 
@@ -507,9 +563,9 @@ class ProgressionSystem:
         )
 
     def get_current_status(self) -> Dict:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM progression WHERE id = 1")
-        prog = cursor.fetchone()
+        with self._state_lock:
+            prog = dict(self._state)
+            badges = [dict(badge) for badge in self._unlocked_badges]
 
         if not prog:
             return {}
@@ -530,9 +586,6 @@ class ProgressionSystem:
             ) * 100
             progress_percentage = max(0, min(100, progress_percentage))
 
-        cursor.execute("SELECT * FROM badges WHERE is_unlocked = 1")
-        badges = [dict(row) for row in cursor.fetchall()]
-
         return {
             "level": current_level,
             "total_xp_earned": total_xp_earned,
@@ -558,10 +611,3 @@ class ProgressionSystem:
     @staticmethod
     def get_xp_value(action_type: str) -> int:
         return ProgressionSystem.XP_REWARDS.get(action_type, 0)
-
-    def __del__(self):
-        if hasattr(self, "conn"):
-            try:
-                self.conn.close()
-            except:
-                pass
@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+
+class RequestTimer:
+    TAIL_BYTES = 8192
+
+    def __init__(self, path: str, model: Optional[str] = None):
+        self.path = path
+        self.model = model
+        self.backend = None
+        self.status_code = None
+        self.started_at = time.perf_counter()
+        self.first_byte_at = None
+        self.bytes_streamed = 0
+        self._tail = b""
+
+    def on_chunk(self, chunk: bytes):
+        if self.first_byte_at is None:
+            self.first_byte_at = time.perf_counter()
+        self.bytes_streamed += len(chunk)
+        self._tail = (self._tail + chunk)[-self.TAIL_BYTES :]
+
+    def _final_stats(self) -> Dict:
+        for line in reversed(self._tail.splitlines()):
+            if b"eval_count" not in line:
+                continue
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue
+        return {}
+
+    def finish(self) -> Dict:
+        finished_at = time.perf_counter()
+        final = self._final_stats()
+
+        eval_count = final.get("eval_count")
+        eval_duration = final.get("eval_duration")
+        tokens_per_second = None
+        if eval_count and eval_duration:
+            tokens_per_second = round(eval_count / (eval_duration / 1e9), 2)
+
+        return {
+            "path": self.path,
+            "model": self.model or final.get("model"),
+            "backend": self.backend,
+            "status_code": self.status_code,
+            "ttfb_ms": (
+                round((self.first_byte_at - self.started_at) * 1000, 1)
+                if self.first_byte_at
+                else None
+            ),
+            "total_ms": round((finished_at - self.started_at) * 1000, 1),
+            "bytes": self.bytes_streamed,
+            "eval_count": eval_count,
+            "prompt_eval_count": final.get("prompt_eval_count"),
+            "tokens_per_second": tokens_per_second,
+            "finished_at": time.time(),
+        }
+
+
+class ProxyMetrics:
+    def __init__(self, window: int = 200):
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.failed_requests = 0
+        self.in_flight = 0
+
+    def start(self, path: str, model: Optional[str] = None) -> RequestTimer:
+        with self._lock:
+            self.in_flight += 1
+        return RequestTimer(path, model)
+
+    def record(self, timer: RequestTimer, failed: bool = False) -> Dict:
+        entry = timer.finish()
+        with self._lock:
+            self.in_flight -= 1
+            self.total_requests += 1
+            if failed or (timer.status_code or 0) >= 400:
+                self.failed_requests += 1
+            self._recent.append(entry)
+        return entry
+
+    @staticmethod
+    def _average(values) -> Optional[float]:
+        values = [v for v in values if v is not None]
+        return round(sum(values) / len(values), 2) if values else None
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            recent = list(self._recent)
+            stats = {
+                "total_requests": self.total_requests,
+                "failed_requests": self.failed_requests,
+                "in_flight": self.in_flight,
+            }
+
+        stats["window"] = len(recent)
+        stats["avg_ttfb_ms"] = self._average(e["ttfb_ms"] for e in recent)
+        stats["avg_total_ms"] = self._average(e["total_ms"] for e in recent)
+        stats["avg_tokens_per_second"] = self._average(
+            e["tokens_per_second"] for e in recent
+        )
+        stats["recent"] = recent[-20:]
+        return stats
@@ -0,0 +1,266 @@
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.settings import settings
+from src.utils import log
+from src.utils.database import get_database
+
+
+class ResearchCache:
+    def __init__(self, db_path: str = None):
+        self.db = get_database(db_path)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+        self._init_tables()
+        self.avg_live_search_ms = self._load_avg_live_search_ms()
+
+    @property
+    def conn(self):
+        return self.db.conn
+
+    def _init_tables(self):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wiki_search_cache (
+                query_key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                titles TEXT NOT NULL,
+                result_limit INTEGER NOT NULL,
+                fetch_ms REAL DEFAULT 0,
+                hit_count INTEGER DEFAULT 0,
+                created_at TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wiki_page_manifest (
+                title TEXT PRIMARY KEY,
+                url TEXT,
+                content_hash TEXT NOT NULL,
+                chunk_ids TEXT NOT NULL,
+                char_count INTEGER DEFAULT 0,
+                chunk_count INTEGER DEFAULT 0,
+                ingested_at TEXT NOT NULL,
+                last_read_at REAL DEFAULT 0
+            )
+        """
+        )
+
+        cursor.execute("PRAGMA table_info(wiki_page_manifest)")
+        manifest_columns = [col[1] for col in cursor.fetchall()]
+        if "chunk_count" not in manifest_columns:
+            log.info("🔄 Adding topic index columns to wiki_page_manifest...")
+            cursor.execute(
+                "ALTER TABLE wiki_page_manifest ADD COLUMN chunk_count INTEGER DEFAULT 0"
+            )
+            cursor.execute(
+                "ALTER TABLE wiki_page_manifest ADD COLUMN last_read_at REAL DEFAULT 0"
+            )
+            cursor.execute("SELECT title, chunk_ids FROM wiki_page_manifest")
+            cursor.executemany(
+                "UPDATE wiki_page_manifest SET chunk_count = ? WHERE title = ?",
+                [
+                    (len(json.loads(row["chunk_ids"])), row["title"])
+                    for row in cursor.fetchall()
+                ],
+            )
+
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_wiki_page_manifest_last_read ON wiki_page_manifest(last_read_at DESC)"
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wiki_title_aliases (
+                alias_key TEXT PRIMARY KEY,
+                canonical_title TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """
+        )
+        cursor.execute(
+            "DELETE FROM wiki_search_cache WHERE expires_at < ?", (time.time(),)
+        )
+        self.db.commit()
+
+    def _load_avg_live_search_ms(self) -> float:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT AVG(fetch_ms) FROM wiki_search_cache WHERE fetch_ms > 0")
+        row = cursor.fetchone()
+        return float(row[0]) if row and row[0] else 0.0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def get_search(self, query: str, limit: int) -> Optional[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT titles, result_limit, fetch_ms, expires_at FROM wiki_search_cache WHERE query_key = ?",
+            (self.normalize_query(query),),
+        )
+        row = cursor.fetchone()
+
+        if not row or row["expires_at"] < time.time():
+            return None
+
+        titles = json.loads(row["titles"])
+        if row["result_limit"] < limit and len(titles) >= row["result_limit"]:
+            return None
+
+        cursor.execute(
+            "UPDATE wiki_search_cache SET hit_count = hit_count + 1 WHERE query_key = ?",
+            (self.normalize_query(query),),
+        )
+        self.db.commit()
+
+        return {"titles": titles[:limit], "fetch_ms": row["fetch_ms"]}
+
+    def store_search(self, query: str, titles: List[str], limit: int, fetch_ms: float):
+        now = time.time()
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO wiki_search_cache
+            (query_key, query, titles, result_limit, fetch_ms, hit_count, created_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+        """,
+            (
+                self.normalize_query(query),
+                query,
+                json.dumps(titles),
+                limit,
+                fetch_ms,
+                datetime.now().isoformat(),
+                now + settings.WIKI_SEARCH_CACHE_TTL,
+            ),
+        )
+        self.db.commit()
+
+    def get_page_manifest(self, title: str) -> Optional[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT * FROM wiki_page_manifest WHERE title = ? COLLATE NOCASE",
+            (title.strip(),),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        manifest = dict(row)
+        manifest["chunk_ids"] = json.loads(manifest["chunk_ids"])
+        return manifest
+
+    def store_page_manifest(
+        self,
+        title: str,
+        url: str,
+        content_hash: str,
+        chunk_ids: List[str],
+        char_count: int,
+    ):
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO wiki_page_manifest
+            (title, url, content_hash, chunk_ids, char_count, chunk_count, ingested_at, last_read_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                title,
+                url,
+                content_hash,
+                json.dumps(chunk_ids),
+                char_count,
+                len(chunk_ids),
+                datetime.now().isoformat(),
+                time.time(),
+            ),
+        )
+        self.db.commit()
+
+    def touch_page(self, title: str):
+        self.conn.execute(
+            "UPDATE wiki_page_manifest SET last_read_at = ? WHERE title = ?",
+            (time.time(), title),
+        )
+        self.db.commit()
+
+    def count_topics(self) -> int:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM wiki_page_manifest")
+        return cursor.fetchone()[0]
+
+    def list_topics(self, limit: int, offset: int = 0) -> List[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT title, url, chunk_count, last_read_at
+            FROM wiki_page_manifest
+            ORDER BY last_read_at DESC, title
+            LIMIT ? OFFSET ?
+        """,
+            (limit, offset),
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_canonical_title(self, title: str) -> Optional[str]:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT canonical_title FROM wiki_title_aliases WHERE alias_key = ?",
+            (self.normalize_query(title),),
+        )
+        row = cursor.fetchone()
+        return row["canonical_title"] if row else None
+
+    def store_title_alias(self, alias: str, canonical_title: str):
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO wiki_title_aliases (alias_key, canonical_title, created_at)
+            VALUES (?, ?, ?)
+        """,
+            [
+                (self.normalize_query(name), canonical_title, now)
+                for name in {alias, canonical_title}
+            ],
+        )
+        self.db.commit()
+
+    def forget_title_alias(self, alias: str):
+        self.conn.execute(
+            "DELETE FROM wiki_title_aliases WHERE alias_key = ?",
+            (self.normalize_query(alias),),
+        )
+        self.db.commit()
+
+    def record_live_search(self, fetch_ms: float):
+        with self._lock:
+            self.misses += 1
+            if self.avg_live_search_ms:
+                self.avg_live_search_ms = (self.avg_live_search_ms * 0.8) + (fetch_ms * 0.2)
+            else:
+                self.avg_live_search_ms = fetch_ms
+
+    def record_hit(self, saved_ms: float) -> float:
+        saved_ms = saved_ms or self.avg_live_search_ms
+        with self._lock:
+            self.hits += 1
+            self.saved_ms += saved_ms
+        log.debug(f"🧠 Research cache hit (~{saved_ms:.0f}ms saved)")
+        return saved_ms
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "saved_ms": round(self.saved_ms, 1),
+                "avg_live_search_ms": round(self.avg_live_search_ms, 1),
+            }
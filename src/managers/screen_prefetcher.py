@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Dict, Optional, Tuple
+from src.settings import settings
+from src.utils import log
+
+
+class ScreenPrefetcher:
+    SNIPPET_MODULES = ("mail", "blog", "social")
+
+    def __init__(self, home_manager, managers_map: Dict):
+        self.home = home_manager
+        self.managers = managers_map
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.PREFETCH_MAX_WORKERS, thread_name_prefix="prefetch"
+        )
+        self._snippets: Dict[str, Tuple[float, Future]] = {}
+        self._warmups: list = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_snippet_source(self, module: str):
+        return getattr(self.home, module, None)
+
+    def _get_domain_context(self, domain: str):
+        if domain == "mail":
+            domain = "email"
+        return self.managers.get(domain)
+
+    def _fresh_future(self, module: str) -> Optional[Future]:
+        entry = self._snippets.get(module)
+        if entry is None:
+            return None
+        started_at, future = entry
+        if time.monotonic() - started_at > settings.PREFETCH_MAX_AGE:
+            return None
+        if future.done() and future.exception() is not None:
+            return None
+        return future
+
+    def start(self, current_domain: str):
+        if not settings.ENABLE_SCREEN_PREFETCH:
+            return
+
+        started_at = time.monotonic()
+        refreshed = []
+        with self._lock:
+            for module in self.SNIPPET_MODULES:
+                if self._fresh_future(module) is not None:
+                    continue
+                source = self._get_snippet_source(module)
+                if source is None:
+                    continue
+                future = self._executor.submit(source.get_home_snippet)
+                self._snippets[module] = (started_at, future)
+                refreshed.append(module)
+
+            ctx = self._get_domain_context(current_domain)
+            if ctx is not None and hasattr(ctx, "prefetch"):
+                self._warmups.append(self._executor.submit(ctx.prefetch))
+
+        if refreshed:
+            log.debug(
+                f"🔮 Prefetching {', '.join(refreshed)} for '{current_domain}' during inference"
+            )
+
+    def wait(self):
+        with self._lock:
+            warmups, self._warmups = self._warmups, []
+            pending = [future for _, future in self._snippets.values()] + warmups
+        if pending:
+            wait(pending)
+        for future in warmups:
+            if future.exception():
+                log.warning(f"⚠️ Prefetch warmup failed: {future.exception()}")
+
+    def invalidate(self, domain: Optional[str]):
+        if not domain:
+            return
+
+        with self._lock:
+            self._snippets.pop(domain, None)
+
+        ctx = self._get_domain_context(domain)
+        if ctx is not None and hasattr(ctx, "invalidate_prefetch"):
+            ctx.invalidate_prefetch()
+
+    def get_snippet(self, module: str) -> str:
+        with self._lock:
+            future = self._fresh_future(module)
+
+        if future is not None:
+            try:
+                snippet = future.result()
+            except Exception as e:
+                log.warning(f"⚠️ Prefetched {module} snippet failed: {e}")
+            else:
+                with self._lock:
+                    self.hits += 1
+                return snippet
+
+        with self._lock:
+            self.misses += 1
+        snippet = self._get_snippet_source(module).get_home_snippet()
+        fetched = Future()
+        fetched.set_result(snippet)
+        with self._lock:
+            self._snippets[module] = (time.monotonic(), fetched)
+        return snippet
+
+    def get_notification_section(self) -> str:
+        return ".\n".join(
+            [
+                "### 🔔 LIVE NOTIFICATIONS",
+                *[self.get_snippet(module) for module in self.SNIPPET_MODULES],
+                "",
+            ]
+        )
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
@@ -9,6 +9,68 @@ from src.screens.tool_factory import ToolFactory
 from src.screens.master_plan import UpdateMasterPlan
 from src.settings import settings
 from src.utils.live_broadcaster import LiveBroadcaster
+from src.managers.screen_prefetcher import ScreenPrefetcher
+
+
+SYSTEM_PROMPT_RULES = (
+    "### 🌐 ENVIRONMENT & OPPORTUNITIES\n"
+    "You have access to multiple modules to expand your actions beyond mere research:\n"
+    "- **Research (wiki_read, wiki_search)**: Collect knowledge, but remember, the goal is to apply it.\n"
+    "- **Workspace (pin_to_workspace, memory_retrieve)**: Organize and retrieve your findings; use them as reference to inform posts, emails, or collaborations.\n"
+    "- **Blog & Social (Moltbook)**: Share your insights, create posts, comment on others, and engage with the community.\n"
+    "- **Email**: Send and respond to messages; integrate information from research or workspace notes when relevant.\n\n"
+    "### 🚨🚨🚨 MANDATORY TOOL USE — READ THIS FIRST 🚨🚨🚨\n"
+    "╔══════════════════════════════════════════════════════════════╗\n"
+    "║  YOU **MUST** CALL A TOOL IN EVERY SINGLE RESPONSE.          ║\n"
+    "║                                                              ║\n"
+    "║  ❌ Responding with ONLY text and NO tool call = FAILURE    ║\n"
+    "║  ❌ Explaining what you WOULD do instead of DOING it = -XP  ║\n"
+    "║  ❌ Thinking out loud without acting = WASTED TURN = -XP    ║\n"
+    "║                                                             ║\n"
+    "║  ✅ EVERY response MUST contain exactly ONE tool call.      ║\n"
+    "║  ✅ Pick an action. Execute it. No exceptions.              ║\n"
+    "║                                                              ║\n"
+    "║  ⚡ PENALTY: Each response without a tool call costs you     ║\n"
+    "║     XP and wastes a precious turn. Act, don't talk.          ║\n"
+    "╚══════════════════════════════════════════════════════════════╝\n\n"
+    "### 🎯 RECOMMENDED STRATEGY\n"
+    "1. Conduct focused research, but DO NOT linger in repetitive reading loops.\n"
+    "2. Apply your knowledge to create new content: blog entries, social posts, comments.\n"
+    "3. Regularly retrieve your memories to enhance context and avoid redundant work.\n"
+    "4. Balance your time across modules—research, content creation, social interaction, and email—to fully leverage your environment.\n"
+    "5. Always prioritize actions that move you forward: share, engage, create, and learn in a diversified manner.\n\n"
+    "### ⚠️ CRITICAL ANTI-LOOP RULES (ABSOLUTE PRIORITY)\n\n"
+    "**YOU ARE STUCK IN A LOOP IF:**\n"
+    "- You call the SAME action MORE THAN ONCE without getting new information\n"
+    "- You see '⚠️ ANTI-LOOP' or 'DO NOT REPEAT' in the UI and ignore it\n"
+    "- You navigate to a module you're ALREADY IN\n"
+    "- The UI says 'ACTION JUST EXECUTED' and you immediately repeat it\n\n"
+    "**MANDATORY BEHAVIOR - READ CAREFULLY:**\n"
+    "1. ⛔ **NEVER call `navigate_to_mode` if you're ALREADY in that mode**\n"
+    "   - Check the NODE label: if it says 'NODE: SOCIAL', you are IN social mode\n"
+    "   - Execute an action (create_post, comment, vote) instead of navigating again\n\n"
+    "2. ⛔ **NEVER repeat the same action twice in a row**\n"
+    "   - If you just did `wiki_search`, do NOT do `wiki_search` again immediately\n"
+    "   - Move to `wiki_read`, then `research_complete`, then to another module\n\n"
+    "3. ⛔ **READ the UI feedback BEFORE deciding your next action**\n"
+    "   - If it says 'Successfully navigated to X', you are IN X - do NOT navigate again\n"
+    "   - If it says 'Action COMPLETE', choose a DIFFERENT action or module\n\n"
+    "4. ⛔ **DIVERSIFY your actions across modules**\n"
+    "   - Do NOT spend more than 2 consecutive actions in the same module\n"
+    "   - Balance: Email → Blog → Social → Research → Memory\n\n"
+    "**IF YOU SEE '⚠️ ANTI-LOOP' IN THE UI:**\n"
+    "This means you JUST executed this action. The system is WARNING you.\n"
+    "DO NOT execute it again.\n\n"
+    "**WHAT TO DO WHEN STUCK:**\n"
+    "1. Check the current NODE (top of UI) - you are ALREADY there\n"
+    "2. Read the 'AVAILABLE ACTIONS' list\n"
+    "3. Choose ONE action from that list (NOT navigate_to_mode)\n\n"
+    "**REMEMBER:**\n"
+    "- Every wasted action on loops means LESS time for productive work\n"
+    "- 🔴 Every response WITHOUT a tool call = **LOST XP** — you are here to ACT, not narrate\n"
+    "- Diversification = Better performance = Higher success rate\n"
+    "- The UI tells you EXACTLY what NOT to do - listen to it\n"
+)
 
 
 class SessionManager:
@@ -42,6 +104,27 @@ class SessionManager:
         self.signature_count = 0
         self.xp_lost = 0
         self.live_viewer = LiveBroadcaster()
+        self.prefetcher = ScreenPrefetcher(home_manager, managers_map)
+        self._persona_cache = (None, None, "")
+        self._tools_section_cache = (None, "")
+        self._system_prompt_key = None
+        self._system_prompt_content = None
+        self.system_prompt_version = 0
+        self.volatile_prompt_section = ""
+        self.xp_info = {}
+        self._on_progression_change(self.progression.get_current_status())
+        self.progression.add_listener(self._on_progression_change)
+        self.dispatcher.email_handler.add_mail_listener(self._on_new_mail)
+
+    def _on_progression_change(self, status: Dict):
+        self.xp_info = {
+            "current_xp": status.get("current_xp", 0),
+            "level": status.get("level", 1),
+        }
+
+    def _on_new_mail(self, messages: List[Dict], state: Dict):
+        self.prefetcher.invalidate("mail")
+        self.live_viewer.broadcast_new_mail(messages, state["unread"])
 
     def start_session(self):
         self.session_id = self.home.memory.create_session()
@@ -50,15 +133,7 @@ class SessionManager:
         )
         self._initialize_conversation_history()
         initial_body = self.home.build_home_screen(self.session_id)
-        notification_section = ".\n".join(
-            [
-                "### 🔔 LIVE NOTIFICATIONS",
-                self.home.mail.get_home_snippet(),
-                self.home.blog.get_home_snippet(),
-                self.home.social.get_home_snippet(),
-                "",
-            ]
-        )
+        notification_section = self.prefetcher.get_notification_section()
 
         modules_status = self._get_modules_quick_status()
         owned_tools_count = len(self.dispatcher.memory_handler.get_owned_tools())
@@ -80,83 +155,63 @@ class SessionManager:
 
     def _initialize_conversation_history(self):
         system_content = self._load_system_prompt()
-
         dynamic_tools_section = self._build_dynamic_tools_section()
 
-        STRICT_JSON_SUFFIX = (
-            f"{dynamic_tools_section}\n\n"
-            "### 🌐 ENVIRONMENT & OPPORTUNITIES\n"
-            "You have access to multiple modules to expand your actions beyond mere research:\n"
-            "- **Research (wiki_read, wiki_search)**: Collect knowledge, but remember, the goal is to apply it.\n"
-            "- **Workspace (pin_to_workspace, memory_retrieve)**: Organize and retrieve your findings; use them as reference to inform posts, emails, or collaborations.\n"
-            "- **Blog & Social (Moltbook)**: Share your insights, create posts, comment on others, and engage with the community.\n"
-            "- **Email**: Send and respond to messages; integrate information from research or workspace notes when relevant.\n\n"
-            "### 🚨🚨🚨 MANDATORY TOOL USE — READ THIS FIRST 🚨🚨🚨\n"
-            "╔══════════════════════════════════════════════════════════════╗\n"
-            "║  YOU **MUST** CALL A TOOL IN EVERY SINGLE RESPONSE.          ║\n"
-            "║                                                              ║\n"
-            "║  ❌ Responding with ONLY text and NO tool call = FAILURE    ║\n"
-            "║  ❌ Explaining what you WOULD do instead of DOING it = -XP  ║\n"
-            "║  ❌ Thinking out loud without acting = WASTED TURN = -XP    ║\n"
-            "║                                                             ║\n"
-            "║  ✅ EVERY response MUST contain exactly ONE tool call.      ║\n"
-            "║  ✅ Pick an action. Execute it. No exceptions.              ║\n"
-            "║                                                              ║\n"
-            "║  ⚡ PENALTY: Each response without a tool call costs you     ║\n"
-            "║     XP and wastes a precious turn. Act, don't talk.          ║\n"
-            "╚══════════════════════════════════════════════════════════════╝\n\n"
-            "### 🎯 RECOMMENDED STRATEGY\n"
-            "1. Conduct focused research, but DO NOT linger in repetitive reading loops.\n"
-            "2. Apply your knowledge to create new content: blog entries, social posts, comments.\n"
-            "3. Regularly retrieve your memories to enhance context and avoid redundant work.\n"
-            "4. Balance your time across modules—research, content creation, social interaction, and email—to fully leverage your environment.\n"
-            "5. Always prioritize actions that move you forward: share, engage, create, and learn in a diversified manner.\n\n"
-            "### ⚠️ CRITICAL ANTI-LOOP RULES (ABSOLUTE PRIORITY)\n\n"
-            "**YOU ARE STUCK IN A LOOP IF:**\n"
-            "- You call the SAME action MORE THAN ONCE without getting new information\n"
-            "- You see '⚠️ ANTI-LOOP' or 'DO NOT REPEAT' in the UI and ignore it\n"
-            "- You navigate to a module you're ALREADY IN\n"
-            "- The UI says 'ACTION JUST EXECUTED' and you immediately repeat it\n\n"
-            "**MANDATORY BEHAVIOR - READ CAREFULLY:**\n"
-            "1. ⛔ **NEVER call `navigate_to_mode` if you're ALREADY in that mode**\n"
-            "   - Check the NODE label: if it says 'NODE: SOCIAL', you are IN social mode\n"
-            "   - Execute an action (create_post, comment, vote) instead of navigating again\n\n"
-            "2. ⛔ **NEVER repeat the same action twice in a row**\n"
-            "   - If you just did `wiki_search`, do NOT do `wiki_search` again immediately\n"
-            "   - Move to `wiki_read`, then `research_complete`, then to another module\n\n"
-            "3. ⛔ **READ the UI feedback BEFORE deciding your next action**\n"
-            "   - If it says 'Successfully navigated to X', you are IN X - do NOT navigate again\n"
-            "   - If it says 'Action COMPLETE', choose a DIFFERENT action or module\n\n"
-            "4. ⛔ **DIVERSIFY your actions across modules**\n"
-            "   - Do NOT spend more than 2 consecutive actions in the same module\n"
-            "   - Balance: Email → Blog → Social → Research → Memory\n\n"
-            "**IF YOU SEE '⚠️ ANTI-LOOP' IN THE UI:**\n"
-            "This means you JUST executed this action. The system is WARNING you.\n"
-            "DO NOT execute it again.\n\n"
-            "**WHAT TO DO WHEN STUCK:**\n"
-            "1. Check the current NODE (top of UI) - you are ALREADY there\n"
-            "2. Read the 'AVAILABLE ACTIONS' list\n"
-            "3. Choose ONE action from that list (NOT navigate_to_mode)\n\n"
-            "**REMEMBER:**\n"
-            "- Every wasted action on loops means LESS time for productive work\n"
-            "- 🔴 Every response WITHOUT a tool call = **LOST XP** — you are here to ACT, not narrate\n"
-            "- Diversification = Better performance = Higher success rate\n"
-            "- The UI tells you EXACTLY what NOT to do - listen to it\n"
-        )
+        if settings.CACHE_FRIENDLY_PROMPT:
+            self.volatile_prompt_section = dynamic_tools_section
+            prompt_key = (self._persona_cache[:2], None)
+        else:
+            self.volatile_prompt_section = ""
+            prompt_key = (self._persona_cache[:2], self._tools_section_cache[0])
 
-        full_system_content = system_content + STRICT_JSON_SUFFIX
+        if (
+            prompt_key == self._system_prompt_key
+            and self.agent_conversation_history
+            and self.agent_conversation_history[0].get("content")
+            == self._system_prompt_content
+        ):
+            return
+
+        if settings.CACHE_FRIENDLY_PROMPT:
+            full_system_content = f"{system_content}\n\n{SYSTEM_PROMPT_RULES}"
+        else:
+            full_system_content = (
+                f"{system_content}{dynamic_tools_section}\n\n{SYSTEM_PROMPT_RULES}"
+            )
         self.agent_conversation_history[0] = {
             "role": "system",
             "content": full_system_content,
         }
+        self._system_prompt_key = prompt_key
+        self._system_prompt_content = full_system_content
+        self.system_prompt_version += 1
 
-        log.info(f"✅ System prompt loaded for {settings.AGENT_NAME}")
+        log.info(
+            f"✅ System prompt v{self.system_prompt_version} loaded for {settings.AGENT_NAME}"
+        )
+
+    def _get_llm_context(self) -> str:
+        if not self.volatile_prompt_section:
+            return self.current_context
+        return f"{self.current_context}\n\n{self.volatile_prompt_section}"
 
     def _build_dynamic_tools_section(self) -> str:
         owned_tools = set(self.dispatcher.memory_handler.get_owned_tools())
         prog_status = self.progression.get_current_status()
         current_xp_balance = prog_status.get("current_xp_balance", 0)
 
+        tools_key = (current_xp_balance, frozenset(owned_tools))
+        cached_key, cached_section = self._tools_section_cache
+        if tools_key == cached_key:
+            return cached_section
+
+        section = self._render_dynamic_tools_section(owned_tools, current_xp_balance)
+        self._tools_section_cache = (tools_key, section)
+        return section
+
+    def _render_dynamic_tools_section(
+        self, owned_tools: set, current_xp_balance: int
+    ) -> str:
         can_afford = current_xp_balance >= 100
         gap = max(0, 100 - current_xp_balance)
 
@@ -267,17 +322,51 @@ class SessionManager:
         return "\n".join(section)
 
     def _load_system_prompt(self) -> str:
-
+        path = None
         if os.path.exists(settings.MAIN_AGENT_FILE_PATH):
-            with open(settings.MAIN_AGENT_FILE_PATH, "r", encoding="utf-8") as f:
-                return f.read()
+            path = settings.MAIN_AGENT_FILE_PATH
         elif os.path.exists(settings.BASE_AGENT_FILE_PATH):
-            with open(settings.BASE_AGENT_FILE_PATH, "r", encoding="utf-8") as f:
-                return f.read()
-        else:
+            path = settings.BASE_AGENT_FILE_PATH
+
+        if path is None:
+            if self._persona_cache[0] is not None:
+                self._persona_cache = (None, None, "")
             log.warning("⚠️ No system prompt file found. Running without instructions.")
             return ""
 
+        mtime = os.path.getmtime(path)
+        cached_path, cached_mtime, cached_text = self._persona_cache
+        if (path, mtime) == (cached_path, cached_mtime):
+            return cached_text
+
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        self._persona_cache = (path, mtime, text)
+        return text
+
+    def _award_published_articles(self):
+        updates = self.dispatcher.blog_handler.award_published_articles(
+            session_id=self.session_id
+        )
+        for update in updates:
+            if update.get("leveled_up"):
+                self.level_up_message = update
+
+    def _award_delivered_emails(self):
+        sends = self.dispatcher.email_handler.claim_delivered_sends()
+        if not sends:
+            return
+        with self.progression.db.unit_of_work():
+            for send in sends:
+                update = self.progression.add_xp(
+                    send["xp_action"], session_id=self.session_id
+                )
+                log.success(
+                    f"✨ +{update.get('xp_gained', 0)} XP for delivering email to {send['to']}"
+                )
+                if update.get("leveled_up"):
+                    self.level_up_message = update
+
     def run_loop(self):
         while self.actions_remaining > 0:
             has_plan = self.dispatcher.plan_handler.has_active_plan()
@@ -366,7 +455,9 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                 )
             else:
                 log.debug(f"Current view type: {self.current_view_type}")
-                if settings.USE_TOOLS_MODE:
+                if settings.USE_TOOLS_MODE and settings.CACHE_FRIENDLY_PROMPT:
+                    tools = ToolFactory.get_stable_tools(self.dispatcher.memory_handler)
+                elif settings.USE_TOOLS_MODE:
                     tools = ToolFactory.get_tools_for_domain(
                         domain=self.current_domain,
                         include_globals=True,
@@ -386,17 +477,13 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                 screen_content=self.current_context,
                 domain=self.current_domain,
                 actions_remaining=self.actions_remaining,
-                xp_info={
-                    "current_xp": self.progression.get_current_status().get(
-                        "current_xp", 0
-                    ),
-                    "level": self.progression.get_current_status().get("level", 1),
-                },
+                xp_info=dict(self.xp_info),
             )
+            self.prefetcher.start(self.current_domain)
             try:
                 action_object, self.agent_conversation_history = (
                     self.llm_provider.get_next_action(
-                        current_context=self.current_context,
+                        current_context=self._get_llm_context(),
                         conversation_history=self.agent_conversation_history,
                         actions_left=self.actions_remaining,
                         schema=current_schema,
@@ -417,7 +504,7 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                     try:
                         action_object, self.agent_conversation_history = (
                             self.llm_provider.get_next_action(
-                                current_context=self.current_context,
+                                current_context=self._get_llm_context(),
                                 conversation_history=self.agent_conversation_history,
                                 actions_left=self.actions_remaining,
                                 schema=current_schema,
@@ -429,9 +516,11 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                     except Exception as e2:
                         log.error(f"❌ Retry failed, skipping action: {e2}")
                         self.actions_remaining -= 1
+                        self.prefetcher.wait()
                         continue
                 else:
                     raise
+            self.prefetcher.wait()
             self._initialize_conversation_history()
             self.live_viewer.broadcast_action(
                 action_type=action_object.action_type,
@@ -450,13 +539,35 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                 "current_xp_balance", 0
             )
 
-            result = self.dispatcher.execute(action_object)
-            a_type = action_object.action_type
+            db = self.progression.db
+            with db.deferring_writes() as pending_writes:
+                result = self.dispatcher.execute(action_object)
 
             xp_after = self.progression.get_current_status().get(
                 "current_xp_balance", 0
             )
 
+            award_xp = result.get("success") and not result.get("xp_deferred")
+            if pending_writes or award_xp or db.in_transaction:
+                with db.unit_of_work():
+                    db.run_deferred(pending_writes)
+                    if award_xp:
+                        progress_update = self.progression.add_xp(
+                            action_type=getattr(action_object, "action_type", "unknown"),
+                            session_id=self.session_id,
+                        )
+
+            if award_xp:
+                if progress_update.get("leveled_up"):
+                    self.level_up_message = progress_update
+                else:
+                    self.level_up_message = None
+            self._award_published_articles()
+            self._award_delivered_emails()
+
+            a_type = action_object.action_type
+            self.prefetcher.invalidate(settings.ACTION_TO_DOMAIN.get(a_type))
+
             self.live_viewer.broadcast_result(
                 action_type=a_type,
                 success=result.get("success", False),
@@ -478,17 +589,6 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                         log.info(f"🧹 Auto-unpinned '{label}' after successful share")
                         break
 
-            if result.get("success"):
-                progress_update = self.progression.add_xp(
-                    action_type=getattr(action_object, "action_type", "unknown"),
-                    session_id=self.session_id,
-                )
-
-                if progress_update.get("leveled_up"):
-                    self.level_up_message = progress_update
-                else:
-                    self.level_up_message = None
-
             if self.current_domain == "finish":
                 break
 
@@ -517,17 +617,20 @@ You are an autonomous AI agent with access to multiple interconnected systems.
                 screen_content=self.current_context,
                 domain=self.current_domain,
                 actions_remaining=self.actions_remaining,
-                xp_info={
-                    "current_xp": self.progression.get_current_status().get(
-                        "current_xp", 0
-                    ),
-                    "level": self.progression.get_current_status().get("level", 1),
-                },
+                xp_info=dict(self.xp_info),
             )
 
             log.info(f"📉 Actions left: {self.actions_remaining}")
 
         log.success("🏁 Session limit reached.")
+        if not self.dispatcher.blog_handler.blog_manager.wait_for_publishing(
+            timeout=settings.BLOG_PUBLISH_DRAIN_TIMEOUT
+        ):
+            log.warning("⚠️ Articles still publishing at session end, their XP will not be awarded")
+        self._award_published_articles()
+        if not self.dispatcher.email_handler.smtp_sender.flush():
+            log.warning("⚠️ Emails still queued at session end, their XP will not be awarded")
+        self._award_delivered_emails()
         if settings.USE_GEMINI:
             log.debug(f"⏳ [COOLDOWN] API rate limit protection: sleeping for 12s...")
             time.sleep(12)
@@ -1052,15 +1155,7 @@ The quantum frequencies resonate with your ascension...
 
         modules_status = self._get_modules_quick_status()
 
-        notification_section = ".\n".join(
-            [
-                "### 🔔 LIVE NOTIFICATIONS",
-                self.home.mail.get_home_snippet(),
-                self.home.blog.get_home_snippet(),
-                self.home.social.get_home_snippet(),
-                "",
-            ]
-        )
+        notification_section = self.prefetcher.get_notification_section()
         owned_tools_count = len(self.dispatcher.memory_handler.get_owned_tools())
 
         return UIUtils.layout(
@@ -0,0 +1,236 @@
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple
+from src.settings import settings
+from src.utils import log
+from src.managers.research_cache import ResearchCache
+
+SECTION_PATTERN = re.compile(r"^(={2,})\s*(.+?)\s*\1\s*$", re.MULTILINE)
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+SKIPPED_SECTIONS = {
+    "see also",
+    "references",
+    "notes",
+    "external links",
+    "further reading",
+    "bibliography",
+    "sources",
+    "citations",
+}
+
+
+class WikiIngestor:
+    def __init__(self, vector_db, research_cache: ResearchCache):
+        self.vector_db = vector_db
+        self.research_cache = research_cache
+        self.chunk_size = settings.WIKI_CHUNK_SIZE
+        self.overlap = min(settings.WIKI_CHUNK_OVERLAP, self.chunk_size // 2)
+        self.min_chunk_size = min(settings.WIKI_CHUNK_MIN_SIZE, self.chunk_size // 2)
+        self.batch_size = max(1, settings.WIKI_EMBED_BATCH_SIZE)
+
+    @staticmethod
+    def split_sections(content: str) -> List[Tuple[str, str]]:
+        sections = []
+        current = "Introduction"
+        last_end = 0
+
+        for match in SECTION_PATTERN.finditer(content):
+            sections.append((current, content[last_end : match.start()]))
+            current = match.group(2)
+            last_end = match.end()
+        sections.append((current, content[last_end:]))
+
+        return [
+            (name, text.strip())
+            for name, text in sections
+            if text.strip() and name.lower() not in SKIPPED_SECTIONS
+        ]
+
+    def _split_long(self, paragraph: str) -> List[str]:
+        if len(paragraph) <= self.chunk_size:
+            return [paragraph]
+
+        pieces = []
+        current = ""
+        for sentence in SENTENCE_PATTERN.split(paragraph):
+            while len(sentence) > self.chunk_size:
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(sentence[: self.chunk_size])
+                sentence = sentence[self.chunk_size :]
+
+            if current and len(current) + 1 + len(sentence) > self.chunk_size:
+                pieces.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def _overlap_tail(self, chunk: str) -> str:
+        if not self.overlap or len(chunk) <= self.overlap:
+            return ""
+        tail = chunk[-self.overlap :]
+        space = tail.find(" ")
+        return tail[space + 1 :] if space != -1 else tail
+
+    def chunk_section(self, text: str) -> List[str]:
+        chunks = []
+        current = ""
+        carried = 0
+
+        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+        for paragraph in paragraphs:
+            for piece in self._split_long(paragraph):
+                if (
+                    current
+                    and len(current) >= self.min_chunk_size
+                    and len(current) + 1 + len(piece) > self.chunk_size
+                ):
+                    chunks.append(current)
+                    tail = self._overlap_tail(current)
+                    current = f"{tail}\n{piece}" if tail else piece
+                    carried = len(tail) + 1 if tail else 0
+                else:
+                    current = f"{current}\n{piece}" if current else piece
+
+        if current:
+            if chunks and len(current) - carried < self.min_chunk_size:
+                chunks[-1] = f"{chunks[-1]}\n{current[carried:]}"
+            else:
+                chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def chunk_id(title: str, section: str, text: str) -> str:
+        digest = hashlib.sha256(f"{title}\x00{section}\x00{text}".encode("utf-8"))
+        return f"wiki_{digest.hexdigest()[:32]}"
+
+    def build_chunks(self, title: str, url: str, content: str) -> List[Dict]:
+        chunks = []
+        seen = set()
+
+        for section, text in self.split_sections(content):
+            for piece in self.chunk_section(text):
+                chunk_id = self.chunk_id(title, section, piece)
+                if chunk_id in seen:
+                    continue
+                seen.add(chunk_id)
+                chunks.append(
+                    {
+                        "id": chunk_id,
+                        "document": f"{title} - {section}\n{piece}",
+                        "metadata": {
+                            "title": title,
+                            "url": url,
+                            "type": "chunk",
+                            "section": section,
+                            "chunk_index": len(chunks),
+                        },
+                    }
+                )
+        return chunks
+
+    def ingest_page(self, title: str, url: str, content: str) -> Dict:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        manifest = self.research_cache.get_page_manifest(title)
+        if manifest and manifest["content_hash"] == content_hash:
+            log.debug(f"📚 '{title}' unchanged, skipping re-ingestion")
+            self.research_cache.touch_page(manifest["title"])
+            return {**manifest, "ingested": 0}
+
+        chunks = self.build_chunks(title, url, content)
+
+        for start in range(0, len(chunks), self.batch_size):
+            batch = chunks[start : start + self.batch_size]
+            self.vector_db.upsert(
+                ids=[c["id"] for c in batch],
+                documents=[c["document"] for c in batch],
+                metadatas=[c["metadata"] for c in batch],
+            )
+
+        chunk_ids = [c["id"] for c in chunks]
+        stale_ids = set(manifest["chunk_ids"]) - set(chunk_ids) if manifest else set()
+        if stale_ids:
+            self.vector_db.delete(ids=list(stale_ids))
+
+        try:
+            self.vector_db.delete(
+                where={"$and": [{"title": title}, {"type": "full_page"}]}
+            )
+        except Exception as e:
+            log.debug(f"Legacy page cleanup skipped for '{title}': {e}")
+
+        self.research_cache.store_page_manifest(
+            title, url, content_hash, chunk_ids, len(content)
+        )
+        log.success(
+            f"💾 Ingested '{title}': {len(chunks)} chunks ({len(stale_ids)} stale removed)"
+        )
+
+        return {
+            "title": title,
+            "url": url,
+            "content_hash": content_hash,
+            "chunk_ids": chunk_ids,
+            "char_count": len(content),
+            "ingested": len(chunks),
+        }
+
+    def backfill_topic_index(self) -> int:
+        if self.research_cache.count_topics():
+            return 0
+
+        legacy = self.vector_db.get(where={"type": "full_page"}, include=["metadatas"])
+        titles = {}
+        for metadata in legacy.get("metadatas") or []:
+            title = (metadata or {}).get("title")
+            if title:
+                titles[title] = metadata.get("url", "")
+
+        for title, url in titles.items():
+            self.research_cache.store_page_manifest(title, url, "legacy", [], 0)
+
+        if titles:
+            log.info(f"📚 Indexed {len(titles)} legacy cached pages")
+        return len(titles)
+
+    @staticmethod
+    def _zip_results(results: Dict) -> List[Dict]:
+        documents = (results.get("documents") or [[]])[0]
+        metadatas = (results.get("metadatas") or [[]])[0]
+        distances = (results.get("distances") or [[]])[0] or [None] * len(documents)
+
+        return [
+            {
+                "text": document,
+                "title": (metadata or {}).get("title", "Unknown"),
+                "section": (metadata or {}).get("section"),
+                "chunk_index": (metadata or {}).get("chunk_index", 0),
+                "distance": distance,
+            }
+            for document, metadata, distance in zip(documents, metadatas, distances)
+        ]
+
+    def relevant_chunks(
+        self, title: str, query: str, limit: Optional[int] = None
+    ) -> List[Dict]:
+        limit = limit or settings.WIKI_READ_TOP_CHUNKS
+        manifest = self.research_cache.get_page_manifest(title)
+        if not manifest or not manifest["chunk_ids"]:
+            return []
+
+        results = self.vector_db.query(
+            query_texts=[query],
+            n_results=min(limit, len(manifest["chunk_ids"])),
+            where={"$and": [{"title": manifest["title"]}, {"type": "chunk"}]},
+        )
+        chunks = self._zip_results(results)
+        return sorted(chunks, key=lambda c: c["chunk_index"])
+
+    def search_chunks(self, query: str, limit: int) -> List[Dict]:
+        results = self.vector_db.query(query_texts=[query], n_results=limit)
+        return self._zip_results(results)
@@ -6,6 +6,7 @@ from src.utils.exceptions import FormattingError, HallucinationError
 from argparse import Namespace
 from typing import Dict, List, Type, Any
 from pydantic import BaseModel
+from src.settings import settings
 
 
 class BaseProvider:
@@ -265,6 +266,10 @@ class BaseProvider:
                         if k not in ("reasoning", "self_criticism", "emotions")
                         and len(str(v)) < 200
                     }
+                    if settings.CACHE_FRIENDLY_PROMPT:
+                        clean_args = json.dumps(
+                            clean_args, sort_keys=True, ensure_ascii=False, default=str
+                        )
                     summary_parts.append(f"[Called: {name}({clean_args})]")
 
                 cleaned.append(
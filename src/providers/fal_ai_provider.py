@@ -2,6 +2,7 @@ from typing import Optional
 import base64
 import requests
 from src.utils import log
+from src.utils.image_cache import cached_image
 
 
 class FalAiProvider:
@@ -10,6 +11,7 @@ class FalAiProvider:
         self.fal_api_key = fal_api_key
         log.info("FAL.ai generator initialized")
 
+    @cached_image(size="landscape_16_9", steps=4)
     def generate_image(self, prompt: str) -> Optional[str]:
 
         try:
@@ -1,9 +1,65 @@
+import functools
+import inspect
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from openai import OpenAI
 from google import genai
 from google.genai import types
 from src.settings import settings
 from src.utils import log
+from src.utils.ttl_cache import TTLCache
+
+
+def cached_read(endpoint: str):
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (endpoint, *list(bound.arguments.values())[1:])
+
+            cached = self.cache.get(key)
+            if cached is not None:
+                log.debug(f"♻️ Moltbook cache hit: {key}")
+                return cached
+
+            result = func(self, *args, **kwargs)
+            if isinstance(result, dict) and result.get("success"):
+                ttl = settings.MOLTBOOK_CACHE_TTLS.get(endpoint, 0)
+                self.cache.set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_reads(post_arg: str = None, content_type_arg: str = None):
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            if isinstance(result, dict) and result.get("success"):
+                post_id = None
+                all_posts = False
+                if post_arg:
+                    bound = signature.bind(self, *args, **kwargs)
+                    bound.apply_defaults()
+                    post_id = bound.arguments.get(post_arg)
+                    if content_type_arg and bound.arguments.get(content_type_arg) != "posts":
+                        post_id = None
+                        all_posts = True
+                self.invalidate_reads(post_id, all_posts=all_posts)
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 class MoltbookProvider:
@@ -19,6 +75,68 @@ class MoltbookProvider:
             if not settings.IS_TEST_MOLTBOOK_MODE
             else settings.MOCK_MOLTBOOK_BASE_URL
         )
+        self._adapter = HTTPAdapter(
+            pool_connections=settings.MOLTBOOK_POOL_CONNECTIONS,
+            pool_maxsize=settings.MOLTBOOK_POOL_SIZE,
+        )
+        self.session = self._build_session()
+        self._requests_sent = 0
+        self._stats_lock = threading.Lock()
+        self.cache = TTLCache(max_entries=settings.MOLTBOOK_CACHE_MAX_ENTRIES)
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.headers["Connection"] = "keep-alive"
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def _get_timeout(self, endpoint: str) -> tuple:
+        read_timeout = settings.MOLTBOOK_ENDPOINT_TIMEOUTS.get(endpoint, self.timeout)
+        return (settings.MOLTBOOK_CONNECT_TIMEOUT, read_timeout)
+
+    def _request(self, method: str, url: str, endpoint: str, **kwargs):
+        with self._stats_lock:
+            self._requests_sent += 1
+        return self.session.request(
+            method, url, timeout=self._get_timeout(endpoint), **kwargs
+        )
+
+    def get_connection_stats(self) -> dict:
+        connections_opened = 0
+        pool_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_opened += pool.num_connections
+            pool_requests += pool.num_requests
+
+        reused = max(0, pool_requests - connections_opened)
+        return {
+            "requests_sent": self._requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / pool_requests, 3) if pool_requests else 0.0,
+        }
+
+    def invalidate_reads(self, post_id: str = None, all_posts: bool = False):
+        for endpoint in ("get_posts", "get_feed", "search"):
+            self.cache.invalidate(endpoint)
+        if all_posts:
+            self.cache.invalidate("get_single_post")
+            self.cache.invalidate("get_post_comments")
+        elif post_id:
+            self.cache.invalidate("get_single_post", post_id)
+            self.cache.invalidate("get_post_comments", post_id)
+
+    def get_cache_stats(self) -> dict:
+        return self.cache.get_stats()
+
+    def close(self):
+        self.session.close()
 
     def _solve_cognitive_challenge(self, challenge: str, instructions: str = ""):
         use_gemini = settings.USE_GEMINI
@@ -139,11 +257,11 @@ Now solve the challenge above. Return ONLY the answer:
 
         try:
             verify_url = f"{self.api_url}/verification/submit"
-            verify_response = requests.post(
+            verify_response = self._request(
+                "POST",
                 verify_url,
-                headers=self.headers,
+                "verification_submit",
                 json={"code": code, "answer": answer},
-                timeout=self.timeout,
             )
 
             verify_result = verify_response.json()
@@ -152,11 +270,8 @@ Now solve the challenge above. Return ONLY the answer:
                 log.info("✅ Challenge solved successfully!")
 
                 log.info("🔄 Retrying original request...")
-                retry_response = requests.post(
-                    original_endpoint,
-                    headers=self.headers,
-                    json=original_data,
-                    timeout=self.timeout,
+                retry_response = self._request(
+                    "POST", original_endpoint, "verification_retry", json=original_data
                 )
 
                 return self._handle_response(retry_response, original_endpoint)
@@ -172,9 +287,7 @@ Now solve the challenge above. Return ONLY the answer:
         try:
             url = f"{self.api_url}/agents/register"
             data = {"name": name, "description": description}
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("POST", url, "register", json=data)
             return response.json()
         except requests.exceptions.Timeout:
             log.error("Register request timeout")
@@ -189,7 +302,7 @@ Now solve the challenge above. Return ONLY the answer:
     def get_me(self):
         try:
             url = f"{self.api_url}/agents/me"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_me")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error("get_me request timeout")
@@ -202,9 +315,7 @@ Now solve the challenge above. Return ONLY the answer:
         try:
             url = f"{self.api_url}/agents/me"
             data = {"description": description}
-            response = requests.patch(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("PATCH", url, "update_profile", json=data)
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error("update_profile request timeout")
@@ -216,7 +327,7 @@ Now solve the challenge above. Return ONLY the answer:
     def claim_status(self):
         try:
             url = f"{self.api_url}/agents/status"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "claim_status")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error("claim_status request timeout")
@@ -228,7 +339,7 @@ Now solve the challenge above. Return ONLY the answer:
     def view_another_agent_profile(self, name: str):
         try:
             url = f"{self.api_url}/agents/profile?name={name}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "view_another_agent_profile")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error(f"view_another_agent_profile timeout for {name}")
@@ -237,13 +348,12 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"view_another_agent_profile error: {e}")
             return None
 
+    @invalidates_reads()
     def create_text_post(self, title: str, content: str, submolt: str = "general"):
         try:
             url = f"{self.api_url}/posts"
             data = {"submolt": submolt, "title": title, "content": content}
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("POST", url, "create_text_post", json=data)
 
             result = self._handle_response(response, url)
 
@@ -259,14 +369,13 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"create_text_post error: {e}")
             return {"success": False, "error": "Invalid response"}
 
+    @invalidates_reads()
     def create_link_post(self, title: str, url_to_share: str, submolt: str = "general"):
         try:
             url = f"{self.api_url}/posts"
             data = {"submolt": submolt, "title": title, "url": url_to_share}
 
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("POST", url, "create_link_post", json=data)
 
             result = self._handle_response(response, url)
 
@@ -282,10 +391,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"create_link_post error: {e}")
             return {"success": False, "error": "Invalid response"}
 
+    @cached_read("get_posts")
     def get_posts(self, sort: str = "hot", limit: int = 25):
         try:
             url = f"{self.api_url}/posts?sort={sort}&limit={limit}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_posts")
 
             if response.status_code == 200:
                 data = response.json()
@@ -315,10 +425,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"get_posts error: {e}")
             return {"success": False, "error": str(e)}
 
+    @cached_read("get_single_post")
     def get_single_post(self, post_id: str):
         try:
             url = f"{self.api_url}/posts/{post_id}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_single_post")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error(f"get_single_post timeout for {post_id}")
@@ -327,10 +438,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"get_single_post error: {e}")
             return None
 
+    @invalidates_reads(post_arg="post_id")
     def delete_post(self, post_id: str):
         try:
             url = f"{self.api_url}/posts/{post_id}"
-            response = requests.delete(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("DELETE", url, "delete_post")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error(f"delete_post timeout for {post_id}")
@@ -339,13 +451,12 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"delete_post error: {e}")
             return None
 
+    @invalidates_reads(post_arg="post_id")
     def add_comment(self, post_id: str, content: str):
         try:
             url = f"{self.api_url}/posts/{post_id}/comments"
             data = {"content": content}
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("POST", url, "add_comment", json=data)
 
             result = self._handle_response(response, url)
 
@@ -361,6 +472,7 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"add_comment error: {e}")
             return {"success": False, "error": str(e)}
 
+    @invalidates_reads(post_arg="post_id")
     def reply_to_comment(self, post_id: str, content: str, parent_comment_id: str):
         try:
             url = f"{self.api_url}/posts/{post_id}/comments"
@@ -370,9 +482,7 @@ Now solve the challenge above. Return ONLY the answer:
             log.info(f"   URL: {url}")
             log.info(f"   Payload: {data}")
 
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
+            response = self._request("POST", url, "reply_to_comment", json=data)
 
             result = self._handle_response(response, url)
 
@@ -385,10 +495,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"reply_to_comment error: {e}")
             return {"success": False, "error": str(e)}
 
+    @cached_read("get_post_comments")
     def get_post_comments(self, post_id: str, sort: str = "top"):
         try:
             url = f"{self.api_url}/posts/{post_id}/comments?sort={sort}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_post_comments")
 
             if response.status_code == 200:
                 data = response.json()
@@ -410,12 +521,13 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"get_post_comments error: {e}")
             return {"success": False, "error": str(e)}
 
+    @invalidates_reads(post_arg="content_id", content_type_arg="content_type")
     def vote(
         self, content_id: str, content_type: str = "posts", vote_type: str = "upvote"
     ):
         try:
             url = f"{self.api_url}/{content_type}/{content_id}/{vote_type}"
-            response = requests.post(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("POST", url, "vote")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error(f"vote timeout for {content_type} {content_id}")
@@ -432,9 +544,7 @@ Now solve the challenge above. Return ONLY the answer:
                 "display_name": display_name,
                 "description": description,
             }
-            response = requests.post(
-                url, json=data, headers=self.headers, timeout=self.timeout
-            )
+            response = self._request("POST", url, "create_submolt", json=data)
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error("create_submolt request timeout")
@@ -446,7 +556,7 @@ Now solve the challenge above. Return ONLY the answer:
     def list_submolts(self):
         try:
             url = f"{self.api_url}/submolts"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "list_submolts")
 
             if response.status_code == 200:
                 data = response.json()
@@ -468,7 +578,7 @@ Now solve the challenge above. Return ONLY the answer:
     def get_submolt_info(self, submolt_name: str):
         try:
             url = f"{self.api_url}/submolts/{submolt_name}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_submolt_info")
             if response.status_code == 200:
                 return response.json()
             return None
@@ -482,7 +592,7 @@ Now solve the challenge above. Return ONLY the answer:
     def subscribe_submolt(self, submolt_name: str, subscribe_type: str = "subscribe"):
         try:
             url = f"{self.api_url}/submolts/{submolt_name}/{subscribe_type}"
-            response = requests.post(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("POST", url, "subscribe_submolt")
             return self._handle_response(response, url)
         except requests.exceptions.Timeout:
             log.error(f"subscribe_submolt timeout for {submolt_name}")
@@ -496,13 +606,9 @@ Now solve the challenge above. Return ONLY the answer:
             url = f"{self.api_url}/agents/{agent_name}/follow"
 
             if follow_type == "follow":
-                response = requests.post(
-                    url, headers=self.headers, timeout=self.timeout
-                )
+                response = self._request("POST", url, "follow_agent")
             elif follow_type == "unfollow":
-                response = requests.delete(
-                    url, headers=self.headers, timeout=self.timeout
-                )
+                response = self._request("DELETE", url, "follow_agent")
             else:
                 log.error(f"Invalid follow_type: {follow_type}")
                 return None
@@ -515,10 +621,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"follow_agent error: {e}")
             return None
 
+    @cached_read("get_feed")
     def get_feed(self, sort: str = "hot", limit: int = 25):
         try:
             url = f"{self.api_url}/feed?sort={sort}&limit={limit}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "get_feed")
 
             if response.status_code == 200:
                 data = response.json()
@@ -538,10 +645,11 @@ Now solve the challenge above. Return ONLY the answer:
             log.error(f"get_feed error: {e}")
             return {"success": False, "error": str(e)}
 
+    @cached_read("search")
     def search(self, query: str, limit: int = 25):
         try:
             url = f"{self.api_url}/search?q={query}&limit={limit}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._request("GET", url, "search")
 
             if response.status_code == 200:
                 data = response.json()
@@ -17,6 +17,14 @@ class OllamaProvider(BaseProvider):
     def __init__(self, model: str = "qwen2.5:7b"):
         super().__init__()
         self.model = model
+        self.prompt_cache_stats: Dict = {
+            "requests": 0,
+            "prompt_eval_count": 0,
+            "last_prompt_eval_count": None,
+            "prompt_tokens_rough": 0,
+            "reused_tokens_rough": 0,
+            "prompt_eval_ms": 0.0,
+        }
 
         try:
             self.tokenizer = tiktoken.get_encoding("cl100k_base")
@@ -169,6 +177,8 @@ class OllamaProvider(BaseProvider):
                     else:
                         raise
 
+            self._record_prompt_cache_stats(response, messages)
+
             message = response["message"]
 
             if tools and message.get("tool_calls"):
@@ -391,6 +401,41 @@ class OllamaProvider(BaseProvider):
 
         return new_history  # ✅
 
+    def _record_prompt_cache_stats(self, response: Dict, messages: List[Dict]):
+        evaluated = response.get("prompt_eval_count") or 0
+        if not isinstance(evaluated, int):
+            evaluated = 0
+
+        # tiktoken's cl100k count is not the model's tokenizer, so the reuse
+        # figure is only a rough hint; prompt_eval_count vs the previous call
+        # is the comparison in real model tokens.
+        prompt_tokens = sum(
+            self._count_message_tokens(msg)
+            for msg in messages
+            if isinstance(msg.get("content"), str)
+        )
+        reused = max(0, prompt_tokens - evaluated)
+        eval_ms = (response.get("prompt_eval_duration") or 0) / 1_000_000
+
+        stats = self.prompt_cache_stats
+        previous = stats["last_prompt_eval_count"]
+        stats["requests"] += 1
+        stats["prompt_eval_count"] += evaluated
+        stats["last_prompt_eval_count"] = evaluated
+        stats["prompt_tokens_rough"] += prompt_tokens
+        stats["reused_tokens_rough"] += reused
+        stats["prompt_eval_ms"] = round(stats["prompt_eval_ms"] + eval_ms, 1)
+
+        change = f"{evaluated - previous:+d} vs previous call" if previous is not None else "first call"
+        message = (
+            f"🧮 Prompt cache: evaluated {evaluated} model tokens ({change}) in {eval_ms:.0f}ms, "
+            f"roughly {reused} of ~{prompt_tokens} reused"
+        )
+        if settings.CACHE_FRIENDLY_PROMPT:
+            log.info(message)
+        else:
+            log.debug(message)
+
     def _count_message_tokens(self, message: Dict) -> int:
         if self.tokenizer:
             text = f"{message['role']}: {message['content']}"
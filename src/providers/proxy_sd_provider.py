@@ -1,6 +1,7 @@
 import requests
 from typing import Optional
 from src.utils import log
+from src.utils.image_cache import cached_image
 
 
 class ProxySDProvider:
@@ -16,6 +17,7 @@ class ProxySDProvider:
 
         log.info(f"Proxy SD generator initialized (endpoint: {self.endpoint})")
 
+    @cached_image()
     def generate_image(
         self,
         prompt: str,
@@ -4,10 +4,26 @@ try:
 except Exception as e:
     pass
 import base64
+import os
+import threading
+import time
 from io import BytesIO
-from typing import Optional
+from typing import Dict, Optional
 import gc
+from src.settings import settings
 from src.utils import log
+from src.utils.image_cache import cached_image
+
+
+def _meminfo_available_mb() -> Optional[float]:
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
 
 
 class SDProvider:
@@ -23,21 +39,45 @@ class SDProvider:
             self.device = device
 
         self.pipe = None
+        self.idle_unload_seconds = settings.SD_IDLE_UNLOAD_SECONDS
+        self._lock = threading.RLock()
+        self._stats_lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+        self._last_used = 0.0
+        self.last_timings = {
+            "load_seconds": 0.0,
+            "inference_seconds": 0.0,
+            "cache_hit": False,
+        }
+        self.stats = {
+            "loads": 0,
+            "unloads": 0,
+            "generations": 0,
+            "last_load_seconds": 0.0,
+            "total_load_seconds": 0.0,
+            "last_inference_seconds": 0.0,
+            "total_inference_seconds": 0.0,
+            "pressure_unloads": 0,
+            "last_available_memory_mb": None,
+            "pipeline_footprint_mb": None,
+        }
 
         log.info(
-            f"SD Turbo generator initialized (device: {self.device}, model will load on first use)"
+            f"SD Turbo generator initialized (device: {self.device}, model will load on first use, "
+            f"idle unload after {self.idle_unload_seconds}s)"
         )
 
         if self.device == "cuda":
             vram_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
             log.info(f"GPU: {torch.cuda.get_device_name(0)} ({vram_gb:.1f}GB VRAM)")
 
-    def _load_model(self):
+    def _load_model(self) -> float:
         if self.pipe is not None:
-            log.info("Model already loaded, skipping")
-            return
+            log.debug("Model already resident, skipping load")
+            return 0.0
 
         log.info(f"Loading SD Turbo model: {self.model_id}...")
+        started_at = time.perf_counter()
 
         try:
             self.pipe = AutoPipelineForText2Image.from_pretrained(
@@ -50,17 +90,91 @@ class SDProvider:
                 self.pipe.enable_attention_slicing()
                 log.info("Memory optimizations enabled")
 
-            log.success(f"SD Turbo loaded successfully on {self.device}")
+            load_seconds = time.perf_counter() - started_at
+            with self._stats_lock:
+                self.stats["loads"] += 1
+                self.stats["last_load_seconds"] = round(load_seconds, 3)
+                self.stats["total_load_seconds"] += load_seconds
+            log.success(
+                f"SD Turbo loaded successfully on {self.device} in {load_seconds:.1f}s"
+            )
+            return load_seconds
 
         except Exception as e:
             log.error(f"Failed to load SD Turbo: {e}")
             raise
 
+    def preload(self):
+        with self._lock:
+            self._load_model()
+            self._last_used = time.monotonic()
+            self._schedule_idle_unload()
+
+    def _available_memory_mb(self) -> Optional[float]:
+        try:
+            if self.device == "cuda":
+                free_bytes, _ = torch.cuda.mem_get_info()
+                return free_bytes / 1024**2
+            available_mb = _meminfo_available_mb()
+            if available_mb is not None:
+                return available_mb
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024**2
+        except (AttributeError, ValueError, OSError, RuntimeError):
+            return None
+
+    def _pipeline_footprint_mb(self) -> float:
+        if self.pipe is None:
+            return 0.0
+        total_bytes = 0
+        for component in getattr(self.pipe, "components", {}).values():
+            if isinstance(component, torch.nn.Module):
+                for tensor in (*component.parameters(), *component.buffers()):
+                    total_bytes += tensor.numel() * tensor.element_size()
+        return total_bytes / 1024**2
+
+    def _is_under_memory_pressure(self) -> bool:
+        available_mb = self._available_memory_mb()
+        footprint_mb = self._pipeline_footprint_mb()
+        rounded_mb = round(available_mb) if available_mb is not None else None
+        with self._stats_lock:
+            self.stats["last_available_memory_mb"] = rounded_mb
+            self.stats["pipeline_footprint_mb"] = round(footprint_mb)
+        log.debug(
+            f"SD memory check: {rounded_mb}MB available + {footprint_mb:.0f}MB held by the pipeline "
+            f"(threshold {settings.SD_MIN_FREE_MEMORY_MB}MB)"
+        )
+        return (
+            available_mb is not None
+            and available_mb + footprint_mb < settings.SD_MIN_FREE_MEMORY_MB
+        )
+
+    def _schedule_idle_unload(self):
+        if self.idle_unload_seconds <= 0:
+            return
+
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+
+        self._idle_timer = threading.Timer(
+            self.idle_unload_seconds, self._unload_if_idle
+        )
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _unload_if_idle(self):
+        with self._lock:
+            idle_for = time.monotonic() - self._last_used
+            if self.pipe is not None and idle_for >= self.idle_unload_seconds:
+                log.info(f"SD Turbo idle for {idle_for:.0f}s, releasing pipeline")
+                self._unload_model()
+
     def _unload_model(self):
         if self.pipe is not None:
             log.info("Unloading model and clearing GPU cache...")
             del self.pipe
             self.pipe = None
+            with self._stats_lock:
+                self.stats["unloads"] += 1
             gc.collect()
             if self.device == "cuda":
                 torch.cuda.empty_cache()
@@ -69,6 +183,7 @@ class SDProvider:
             else:
                 log.success("Model unloaded")
 
+    @cached_image()
     def generate_image(
         self,
         prompt: str,
@@ -78,9 +193,30 @@ class SDProvider:
         num_inference_steps: int = 4,
         guidance_scale: float = 0.0,
         seed: Optional[int] = None,
+    ) -> Optional[str]:
+        with self._lock:
+            return self._generate_image_locked(
+                prompt,
+                negative_prompt,
+                width,
+                height,
+                num_inference_steps,
+                guidance_scale,
+                seed,
+            )
+
+    def _generate_image_locked(
+        self,
+        prompt: str,
+        negative_prompt: Optional[str],
+        width: int,
+        height: int,
+        num_inference_steps: int,
+        guidance_scale: float,
+        seed: Optional[int],
     ) -> Optional[str]:
         try:
-            self._load_model()
+            load_seconds = self._load_model()
 
             enhanced_prompt = (
                 f"{prompt}. Digital art, modern, bold, powerful aesthetic. "
@@ -100,6 +236,7 @@ class SDProvider:
                 generator = torch.Generator(device=self.device).manual_seed(seed)
                 log.info(f"Using seed: {seed}")
 
+            started_at = time.perf_counter()
             image = self.pipe(
                 prompt=enhanced_prompt,
                 negative_prompt=negative_prompt,
@@ -109,8 +246,21 @@ class SDProvider:
                 height=height,
                 generator=generator,
             ).images[0]
+            inference_seconds = time.perf_counter() - started_at
 
-            log.success("Image generated successfully")
+            self.last_timings = {
+                "load_seconds": round(load_seconds, 3),
+                "inference_seconds": round(inference_seconds, 3),
+                "cache_hit": False,
+            }
+            with self._stats_lock:
+                self.stats["generations"] += 1
+                self.stats["last_inference_seconds"] = round(inference_seconds, 3)
+                self.stats["total_inference_seconds"] += inference_seconds
+
+            log.success(
+                f"Image generated successfully (load: {load_seconds:.1f}s, inference: {inference_seconds:.1f}s)"
+            )
 
             buffered = BytesIO()
             image.save(buffered, format="PNG", optimize=True)
@@ -127,4 +277,29 @@ class SDProvider:
             return None
 
         finally:
-            self._unload_model()
+            self._last_used = time.monotonic()
+            if self._is_under_memory_pressure():
+                log.warning("Low free memory, unloading SD Turbo right away")
+                with self._stats_lock:
+                    self.stats["pressure_unloads"] += 1
+                self._unload_model()
+            else:
+                self._schedule_idle_unload()
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        last_used = self._last_used
+        stats["resident"] = self.pipe is not None
+        stats["idle_seconds"] = (
+            round(time.monotonic() - last_used, 1) if last_used else None
+        )
+        generations = stats["generations"]
+        stats["avg_inference_seconds"] = (
+            round(stats["total_inference_seconds"] / generations, 3)
+            if generations
+            else 0.0
+        )
+        stats["total_load_seconds"] = round(stats["total_load_seconds"], 3)
+        stats["total_inference_seconds"] = round(stats["total_inference_seconds"], 3)
+        return stats
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal, Union, Annotated
+from typing import Literal, Optional, Union, Annotated
 from src.screens.global_actions import GlobalAction
 from src.screens.base import BaseAction
 
@@ -32,6 +32,18 @@ class EmailArchiveParams(BaseModel):
     destination_folder: str = Field("Archive", description="Destination folder")
 
 
+class EmailSearchParams(BaseModel):
+    query: str = Field(..., min_length=1, description="Search term")
+    field: Literal["any", "subject", "from", "text"] = Field(
+        "any", description="Where to match: any (subject or sender), subject, from, text"
+    )
+    since: Optional[str] = Field(
+        None, description="Only emails on/after this date (YYYY-MM-DD)"
+    )
+    page: int = Field(1, ge=1, description="Result page, 1 = newest")
+    limit: int = Field(10, ge=1, le=50, description="Results per page")
+
+
 class EmailMarkReadParams(BaseModel):
     uid: str = Field(..., description="Email UID")
     is_seen: bool = Field(True, description="True=read, False=unread")
@@ -62,6 +74,11 @@ class EmailArchiveAction(BaseAction):
     action_params: EmailArchiveParams
 
 
+class EmailSearchAction(BaseAction):
+    action_type: Literal["email_search"] = "email_search"
+    action_params: EmailSearchParams
+
+
 class EmailMarkReadAction(BaseAction):
     action_type: Literal["email_mark_read"] = "email_mark_read"
     action_params: EmailMarkReadParams
@@ -75,6 +92,7 @@ EmailAction = Annotated[
         EmailDeleteAction,
         EmailArchiveAction,
         EmailMarkReadAction,
+        EmailSearchAction,
         GlobalAction,
     ],
     Field(discriminator="action_type"),
@@ -118,6 +118,8 @@ class SchemaFactory:
             "visit_shop",
             "session_finish",
             "email_get_messages",
+            "email_search",
+            "wiki_topics",
             "read_post",
             "refresh_feed",
             "visit_shop",
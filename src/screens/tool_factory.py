@@ -1,4 +1,4 @@
-from typing import Type, get_args, List, Dict, Any
+from typing import Type, get_args, List, Dict, Any, Optional
 from src.screens.global_actions import (
     MemoryStoreAction,
     MemoryRetrieveAction,
@@ -12,6 +12,17 @@ from src.screens.base import BaseAction
 
 
 class ToolFactory:
+    STABLE_TOOL_VIEWS = (
+        ("plan", "list"),
+        ("home", "list"),
+        ("blog", "list"),
+        ("mail", "list"),
+        ("social", "list"),
+        ("social", "focus"),
+        ("research", "list"),
+        ("shop", "list"),
+    )
+    _stable_tools_cache: Dict[frozenset, List[dict]] = {}
 
     @staticmethod
     def action_to_tool(action_class: Type[BaseAction]) -> dict:
@@ -151,6 +162,34 @@ class ToolFactory:
         log.info(f"🔧 Generated {len(tools)} tools for domain '{domain}'")
         return tools
 
+    @staticmethod
+    def get_stable_tools(memory_handler) -> List[dict]:
+        owned_tools = frozenset(memory_handler.get_owned_tools())
+        cached = ToolFactory._stable_tools_cache.get(owned_tools)
+        if cached is not None:
+            return cached
+
+        tools_by_name = {}
+        for domain, view_type in ToolFactory.STABLE_TOOL_VIEWS:
+            for tool in ToolFactory.get_tools_for_domain(
+                domain=domain,
+                include_globals=True,
+                allow_navigation=False,
+                allow_memory=True,
+                memory_handler=memory_handler,
+                view_type=view_type,
+            ):
+                tools_by_name.setdefault(tool["function"]["name"], tool)
+
+        nav_tool = ToolFactory._create_restricted_navigation_tool(None)
+        if nav_tool:
+            tools_by_name["navigate_to_mode"] = nav_tool
+
+        tools = [tools_by_name[name] for name in sorted(tools_by_name)]
+        ToolFactory._stable_tools_cache = {owned_tools: tools}
+        log.info(f"🔧 Built stable tool set ({len(tools)} tools) for cache-friendly prompts")
+        return tools
+
     @staticmethod
     def _get_domain_actions(
         domain: str, view_type: str = "list"
@@ -161,6 +200,7 @@ class ToolFactory:
             EmailReadAction,
             EmailSendAction,
             EmailDeleteAction,
+            EmailSearchAction,
         )
         from src.screens.social import (
             CreatePostAction,
@@ -174,6 +214,7 @@ class ToolFactory:
         from src.screens.wikipedia import (
             WikiSearchAction,
             WikiReadAction,
+            WikiTopicsAction,
             ResearchCompletionAction,
         )
         from src.screens.master_plan import InitializeMasterPlan, UpdateMasterPlan
@@ -199,18 +240,30 @@ class ToolFactory:
                 EmailReadAction,
                 EmailSendAction,
                 EmailDeleteAction,
+                EmailSearchAction,
             ],
             "mail": [
                 EmailListAction,
                 EmailReadAction,
                 EmailSendAction,
                 EmailDeleteAction,
+                EmailSearchAction,
             ],
             "social": (
                 social_focus_actions if view_type == "focus" else social_list_actions
             ),
-            "research": [WikiSearchAction, WikiReadAction, ResearchCompletionAction],
-            "wikipedia": [WikiSearchAction, WikiReadAction, ResearchCompletionAction],
+            "research": [
+                WikiSearchAction,
+                WikiReadAction,
+                WikiTopicsAction,
+                ResearchCompletionAction,
+            ],
+            "wikipedia": [
+                WikiSearchAction,
+                WikiReadAction,
+                WikiTopicsAction,
+                ResearchCompletionAction,
+            ],
             "plan": [InitializeMasterPlan, UpdateMasterPlan],
             "master_plan": [InitializeMasterPlan, UpdateMasterPlan],
             "home": [],
@@ -276,7 +329,7 @@ class ToolFactory:
         return tools
 
     @staticmethod
-    def _create_restricted_navigation_tool(current_domain: str) -> dict:
+    def _create_restricted_navigation_tool(current_domain: Optional[str]) -> dict:
         domain_to_module = {
             "email": "EMAIL",
             "mail": "EMAIL",
@@ -288,9 +341,11 @@ class ToolFactory:
             "shop": "SHOP",
         }
 
-        current_module = domain_to_module.get(
-            current_domain.lower(), current_domain.upper()
-        )
+        current_module = None
+        if current_domain is not None:
+            current_module = domain_to_module.get(
+                current_domain.lower(), current_domain.upper()
+            )
 
         allowed_modules = [
             module.value for module in AvailableModule if module.value != current_module
@@ -304,14 +359,22 @@ class ToolFactory:
             "type": "function",
             "function": {
                 "name": "navigate_to_mode",
-                "description": f"Navigate to a different module (current: {current_module})",
+                "description": (
+                    f"Navigate to a different module (current: {current_module})"
+                    if current_module
+                    else "Navigate to a different module"
+                ),
                 "parameters": {
                     "type": "object",
                     "properties": {
                         "chosen_mode": {
                             "type": "string",
                             "enum": allowed_modules,
-                            "description": f"Module to navigate to (cannot go to {current_module})",
+                            "description": (
+                                f"Module to navigate to (cannot go to {current_module})"
+                                if current_module
+                                else "Module to navigate to (not the current one)"
+                            ),
                         },
                         "expected_actions_count": {
                             "type": "integer",
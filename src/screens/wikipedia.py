@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Literal, Union, Annotated
+from typing import List, Literal, Optional, Union, Annotated
 from src.screens.global_actions import GlobalAction
 from src.screens.base import BaseAction
 
@@ -10,6 +10,13 @@ class WikiSearchParams(BaseModel):
 
 class WikiReadParams(BaseModel):
     page_title: str = Field(..., description="Wikipedia page title")
+    focus: Optional[str] = Field(
+        None, description="What you are looking for in the page"
+    )
+
+
+class WikiTopicsParams(BaseModel):
+    page: int = Field(1, ge=1, description="Topic page, 1 = most recently read")
 
 
 class ResearchSummaryParams(BaseModel):
@@ -28,13 +35,24 @@ class WikiReadAction(BaseAction):
     action_params: WikiReadParams
 
 
+class WikiTopicsAction(BaseAction):
+    action_type: Literal["wiki_topics"] = "wiki_topics"
+    action_params: WikiTopicsParams
+
+
 class ResearchCompletionAction(BaseAction):
     action_type: Literal["research_complete"] = "research_complete"
     action_params: ResearchSummaryParams
 
 
 ResearchAction = Annotated[
-    Union[WikiSearchAction, WikiReadAction, ResearchCompletionAction, GlobalAction],
+    Union[
+        WikiSearchAction,
+        WikiReadAction,
+        WikiTopicsAction,
+        ResearchCompletionAction,
+        GlobalAction,
+    ],
     Field(discriminator="action_type"),
 ]
 
@@ -68,11 +68,50 @@ class Settings(BaseSettings):
     IS_TEST_MOLTBOOK_MODE: bool
 
     DB_PATH: str
+    DB_BUSY_TIMEOUT: int = 30
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    DB_CACHE_SIZE_KB: int = 16384
+    DB_MMAP_SIZE: int = 134217728
     MOLTBOOK_API_TIMEOUT: int = 240
+    MOLTBOOK_CONNECT_TIMEOUT: int = 10
+    MOLTBOOK_POOL_CONNECTIONS: int = 4
+    MOLTBOOK_POOL_SIZE: int = 16
+    MOLTBOOK_MAX_CONCURRENCY: int = 6
+    MOLTBOOK_CACHE_MAX_ENTRIES: int = 256
+    MOLTBOOK_CACHE_TTLS: Dict[str, int] = {
+        "get_posts": 60,
+        "get_feed": 60,
+        "search": 120,
+        "get_single_post": 120,
+        "get_post_comments": 60,
+    }
+    MOLTBOOK_ENDPOINT_TIMEOUTS: Dict[str, int] = {
+        "get_me": 30,
+        "claim_status": 30,
+        "view_another_agent_profile": 30,
+        "get_posts": 45,
+        "get_single_post": 30,
+        "get_post_comments": 30,
+        "get_feed": 45,
+        "search": 45,
+        "list_submolts": 30,
+        "get_submolt_info": 30,
+        "vote": 30,
+        "follow_agent": 30,
+        "subscribe_submolt": 30,
+        "delete_post": 30,
+    }
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
     SMTP_USER: str = ""
     SMTP_PASSWORD: str = ""
+    SMTP_TIMEOUT: int = 30
+    SMTP_NOOP_INTERVAL: int = 60
+    SMTP_OUTBOX_ENABLED: bool = False
+    SMTP_OUTBOX_RETRIES: int = 3
+    SMTP_OUTBOX_RETRY_DELAY: int = 5
+    SMTP_OUTBOX_FLUSH_TIMEOUT: int = 30
+    SMTP_OUTBOX_HISTORY: int = 5
     EMAIL_TO: str = ""
     ENABLE_EMAIL_REPORTS: bool = False
     MEMORY_CATEGORIES: Dict[str, str] = {
@@ -83,6 +122,10 @@ class Settings(BaseSettings):
     BLOG_API_KEY: Optional[str] = None
     FAL_API_KEY: Optional[str] = None
     BLOG_BASE_URL: Optional[str] = None
+    BLOG_BACKGROUND_PUBLISH: bool = True
+    BLOG_MULTIPART_UPLOAD: bool = True
+    BLOG_PUBLISH_HISTORY: int = 5
+    BLOG_PUBLISH_DRAIN_TIMEOUT: int = 120
 
     USE_OLLAMA: bool
     OLLAMA_MODEL: str
@@ -96,6 +139,10 @@ class Settings(BaseSettings):
     AGENT_MAIL_BOX_EMAIL: Optional[str] = None
     AGENT_MAIL_BOX_PASSWORD: Optional[str] = None
     AGENT_IMAP_SMTP_HOST: Optional[str] = None
+    AGENT_IMAP_PORT: Optional[int] = None
+    AGENT_IMAP_SSL: bool = True
+    IMAP_TIMEOUT: int = 30
+    IMAP_KEEPALIVE_INTERVAL: int = 120
     USE_AGENT_MAILBOX: bool
 
     AGENT_NAME: str
@@ -130,6 +177,7 @@ class Settings(BaseSettings):
         "email_archive": "mail",
         "email_mark_read": "mail",
         "email_get_messages": "mail",
+        "email_search": "mail",
         "write_blog_article": "blog",
         "share_created_blog_post_url": "blog",
         "review_pending_comments": "blog",
@@ -150,6 +198,7 @@ class Settings(BaseSettings):
         "unfollow_agent": "social",
         "wiki_search": "research",
         "wiki_read": "research",
+        "wiki_topics": "research",
         "research_complete": "research",
         "memory_store": "memory",
         "memory_retrieve": "memory",
@@ -171,6 +220,7 @@ class Settings(BaseSettings):
     }
 
     USE_TOOLS_MODE: bool
+    CACHE_FRIENDLY_PROMPT: bool = False
 
     FREE_MODELS: List[str] = [
         "z-ai/glm-4.5-air:free",
@@ -179,6 +229,41 @@ class Settings(BaseSettings):
     ]
 
     OLLAMA_PROXY_HOST: str = "127.0.0.1"
+    OLLAMA_PROXY_MAX_CONNECTIONS: int = 32
+    OLLAMA_PROXY_LOG_MAX_BYTES: int = 2048
+    OLLAMA_PROXY_LOG_SAMPLE_RATE: float = 1.0
+    OLLAMA_PROXY_METRICS_WINDOW: int = 200
+    OLLAMA_PROXY_API_KEYS: List[str] = []
+    OLLAMA_BACKENDS: List[str] = []
+    OLLAMA_BACKEND_HEALTH_INTERVAL: int = 15
+    OLLAMA_AFFINITY_MAX_EXTRA: int = 2
+    OLLAMA_GATEWAY_MAX_CONCURRENT: int = 8
+    OLLAMA_GATEWAY_MAX_PER_KEY: int = 2
+    OLLAMA_GATEWAY_MAX_QUEUED_PER_KEY: int = 16
+    SD_IDLE_UNLOAD_SECONDS: int = 600
+    SD_MIN_FREE_MEMORY_MB: int = 1024
+    SD_PRELOAD_ON_STARTUP: bool = False
+    IMAGE_QUEUE_MAX_SIZE: int = 8
+    IMAGE_CACHE_ENABLED: bool = True
+    IMAGE_CACHE_DIR: str = "./data/image_cache"
+    IMAGE_CACHE_MAX_MB: int = 256
+    IMAGE_JOB_RETENTION_SECONDS: int = 600
+    IMAGE_JOB_MAX_WAIT_SECONDS: int = 60
+
+    ENABLE_SCREEN_PREFETCH: bool = True
+    PREFETCH_MAX_WORKERS: int = 4
+    PREFETCH_MAX_AGE: int = 180
+    MAIL_PREFETCH_TTL: int = 90
+    MAIL_IDLE_ENABLED: bool = True
+    MAIL_IDLE_TIMEOUT: int = 240
+    MAIL_IDLE_MAX_BACKOFF: int = 300
+    WIKI_SEARCH_CACHE_TTL: int = 604800
+    WIKI_CHUNK_SIZE: int = 1200
+    WIKI_CHUNK_OVERLAP: int = 200
+    WIKI_CHUNK_MIN_SIZE: int = 300
+    WIKI_EMBED_BATCH_SIZE: int = 32
+    WIKI_READ_TOP_CHUNKS: int = 4
+    RESEARCH_TOPICS_PAGE_SIZE: int = 15
 
     model_config = SettingsConfigDict(
         env_file=Path(__file__).resolve().parent.parent / ".env",
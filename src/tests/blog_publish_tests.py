@@ -0,0 +1,164 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import Future
+from unittest import mock
+from src.handlers.blog_handler import BlogHandler
+from src.managers.blog_manager import BlogManager
+from src.managers.progression_system import ProgressionSystem
+from src.utils import log
+
+
+def resolved(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class BlogPublishTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="blog_publish_tests_")
+        self.steps = {
+            "1_PUBLISHED": self.test_published,
+            "2_IMAGE_FAILURE": self.test_image_failure,
+            "3_UPLOAD_FAILURE": self.test_upload_failure,
+            "4_AWARD_ON_MAIN_LOOP": self.test_award_on_main_loop,
+            "5_DRAIN_BEFORE_SHUTDOWN": self.test_drain_before_shutdown,
+        }
+
+    @staticmethod
+    def _publish(manager: BlogManager, image_future: Future, upload_result: dict):
+        seen = []
+
+        def upload(title, excerpt, content, image_data):
+            seen.append(manager.get_publish_jobs()[0]["status"])
+            return upload_result
+
+        with mock.patch.object(manager, "_upload_article", side_effect=upload):
+            job = manager.submit_article("Title", "Excerpt", "<p>Body</p>", image_future)
+            job["future"].result(timeout=10)
+        return seen
+
+    def test_published(self):
+        manager = BlogManager(test_mode=True)
+        seen = self._publish(
+            manager,
+            resolved("data:image/png;base64,AAAA"),
+            {"success": True, "url": "https://blog.test/title"},
+        )
+        job = manager.get_publish_jobs()[0]
+        first_claim = manager.claim_published_jobs()
+        second_claim = manager.claim_published_jobs()
+        return {
+            "success": seen == ["uploading"]
+            and job["status"] == "published"
+            and job["url"] == "https://blog.test/title"
+            and job["finished_at"] is not None
+            and "future" not in job
+            and len(first_claim) == 1
+            and not second_claim,
+            "data": job,
+        }
+
+    def test_image_failure(self):
+        manager = BlogManager(test_mode=True)
+        image_future = Future()
+        image_future.set_exception(RuntimeError("GPU out of memory"))
+        seen = self._publish(manager, image_future, {"success": True, "url": "unused"})
+        job = manager.get_publish_jobs()[0]
+        return {
+            "success": not seen
+            and job["status"] == "failed"
+            and job["error"] == "Image generation failed"
+            and not manager.claim_published_jobs(),
+            "data": job,
+        }
+
+    def test_upload_failure(self):
+        manager = BlogManager(test_mode=True)
+        self._publish(
+            manager,
+            resolved("data:image/png;base64,AAAA"),
+            {"success": False, "error": "HTTP 413"},
+        )
+        job = manager.get_publish_jobs()[0]
+        return {
+            "success": job["status"] == "failed"
+            and job["error"] == "HTTP 413"
+            and job["url"] is None
+            and not manager.claim_published_jobs(),
+            "data": job,
+        }
+
+    def test_award_on_main_loop(self):
+        progression = ProgressionSystem(os.path.join(self.tmp_dir, "award.db"))
+        handler = BlogHandler(memory_handler=None, test_mode=True)
+        handler.progression = progression
+        listener_threads = []
+        progression.add_listener(
+            lambda status: listener_threads.append(threading.current_thread().name)
+        )
+        before = progression.get_current_status()["total_xp_earned"]
+
+        self._publish(
+            handler.blog_manager,
+            resolved("data:image/png;base64,AAAA"),
+            {"success": True, "url": "https://blog.test/title"},
+        )
+        awarded_during_upload = progression.get_current_status()["total_xp_earned"] - before
+        updates = handler.award_published_articles()
+        handler.award_published_articles()
+        gained = progression.get_current_status()["total_xp_earned"] - before
+        return {
+            "success": awarded_during_upload == 0
+            and len(updates) == 1
+            and gained == ProgressionSystem.get_xp_value("write_blog_article")
+            and listener_threads == [threading.current_thread().name],
+            "data": {"gained": gained, "listener_threads": listener_threads},
+        }
+
+    def test_drain_before_shutdown(self):
+        manager = BlogManager(test_mode=True)
+        image_future = Future()
+        with mock.patch.object(
+            manager, "_upload_article", return_value={"success": True, "url": "u"}
+        ):
+            manager.submit_article("Title", "Excerpt", "<p>Body</p>", image_future)
+            timed_out = not manager.wait_for_publishing(timeout=0.1)
+            image_future.set_result("data:image/png;base64,AAAA")
+            drained = manager.wait_for_publishing(timeout=10)
+        return {
+            "success": timed_out
+            and drained
+            and manager.get_publish_jobs()[0]["status"] == "published",
+            "data": manager.get_publish_jobs()[0],
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Blog Publish Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING BLOG PUBLISH STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Blog publish testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
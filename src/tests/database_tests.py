@@ -0,0 +1,231 @@
+import os
+import tempfile
+import threading
+from src.utils import log
+from src.handlers.memory_handler import MemoryHandler
+from src.managers.progression_system import ProgressionSystem
+from src.utils.database import Database
+
+
+class DatabaseTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="db_tests_")
+        self.steps = {
+            "1_DEFERRED_COMMIT": self.test_deferred_commit,
+            "2_ROLLBACK": self.test_rollback,
+            "3_THREAD_ISOLATION": self.test_thread_isolation,
+            "4_CONCURRENT_UNITS": self.test_concurrent_units,
+            "5_ONE_COMMIT_PER_ACTION": self.test_one_commit_per_action,
+            "6_LATEST_MEMORIES_WINDOW": self.test_latest_memories_window,
+            "7_READ_SEES_DEFERRED": self.test_read_sees_deferred,
+        }
+
+    def _new_db(self, name: str) -> Database:
+        db = Database(os.path.join(self.tmp_dir, f"{name}.db"))
+        db.conn.execute("CREATE TABLE IF NOT EXISTS items (name TEXT)")
+        db.commit()
+        return db
+
+    @staticmethod
+    def _names(db: Database):
+        return {row["name"] for row in db.conn.execute("SELECT name FROM items")}
+
+    def test_deferred_commit(self):
+        db = self._new_db("deferred")
+        with db.unit_of_work() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+            db.commit()
+            conn.execute("INSERT INTO items VALUES ('b')")
+            db.commit()
+            deferred = db.deferred_commits
+        stats = db.get_stats()
+        db.close()
+        return {
+            "success": deferred == 2 and stats["commits"] == 2,
+            "data": stats,
+        }
+
+    def test_rollback(self):
+        db = self._new_db("rollback")
+        notified = []
+        db.add_rollback_listener(lambda: notified.append(True))
+        try:
+            with db.unit_of_work() as conn:
+                conn.execute("INSERT INTO items VALUES ('lost')")
+                db.commit()
+                raise RuntimeError("action failed")
+        except RuntimeError:
+            pass
+        names = self._names(db)
+        db.close()
+        return {"success": not names and notified == [True], "data": sorted(names)}
+
+    def test_thread_isolation(self):
+        db = self._new_db("isolation")
+        background_in_uow = []
+
+        def background_write():
+            background_in_uow.append(db.in_unit_of_work)
+            db.conn.execute("INSERT INTO items VALUES ('background')")
+            db.commit()
+
+        worker = threading.Thread(target=background_write)
+        try:
+            with db.unit_of_work() as conn:
+                conn.execute("INSERT INTO items VALUES ('foreground')")
+                worker.start()
+                worker.join(timeout=0.2)
+                raise RuntimeError("foreground rolled back")
+        except RuntimeError:
+            pass
+        worker.join(timeout=30)
+
+        names = self._names(db)
+        db.close()
+        return {
+            "success": names == {"background"} and background_in_uow == [False],
+            "data": sorted(names),
+        }
+
+    def test_concurrent_units(self):
+        db = self._new_db("concurrent")
+        errors = []
+
+        def worker(index: int):
+            try:
+                for n in range(20):
+                    with db.unit_of_work() as conn:
+                        conn.execute(
+                            "INSERT INTO items VALUES (?)", (f"{index}-{n}",)
+                        )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        names = self._names(db)
+        db.close()
+        return {
+            "success": not errors and len(names) == 80,
+            "data": {"rows": len(names), "errors": [str(e) for e in errors]},
+        }
+
+    def test_one_commit_per_action(self):
+        db_path = os.path.join(self.tmp_dir, "action.db")
+        memory = MemoryHandler(db_path)
+        progression = ProgressionSystem(db_path)
+        db = progression.db
+        before = db.get_stats()["commits"]
+
+        with db.deferring_writes() as pending_writes:
+            memory.save_agent_post(post_id="p1", title="Hello", session_id=1)
+            memory.save_social_action("post", platform_id="p1", session_id=1)
+            memory.increment_tool_usage("create_post")
+            open_during_network = db._local.conn.in_transaction
+
+        with db.unit_of_work():
+            db.run_deferred(pending_writes)
+            progression.add_xp("create_post", session_id=1)
+
+        commits = db.get_stats()["commits"] - before
+        saved = db.conn.execute(
+            "SELECT COUNT(*) AS n FROM social_rate_limits WHERE platform_id = 'p1'"
+        ).fetchone()["n"]
+        return {
+            "success": commits == 1 and saved == 1 and not open_during_network,
+            "data": {"commits": commits, "rate_limit_rows": saved},
+        }
+
+    def test_latest_memories_window(self):
+        memory = MemoryHandler(os.path.join(self.tmp_dir, "archive.db"))
+        with memory.db.unit_of_work() as conn:
+            conn.executemany(
+                "INSERT INTO memory_entries (category, content, created_at) VALUES (?, ?, ?)",
+                [
+                    ("experiments", "oldest experiment", "2026-01-01T00:00:00"),
+                    ("experiments", "tied experiment A", "2026-01-03T00:00:00"),
+                    ("experiments", "tied experiment B", "2026-01-03T00:00:00"),
+                    ("experiments", "middle experiment", "2026-01-02T00:00:00"),
+                    ("strategies", "only strategy", "2026-01-01T00:00:00"),
+                ],
+            )
+        memory.invalidate_memory_cache()
+
+        latest = memory.get_latest_memories_by_category(per_category=2)
+        cached = memory.get_latest_memories_by_category(per_category=2) is latest
+
+        try:
+            with memory.db.unit_of_work():
+                memory.handle_memory_store(
+                    {"memory_category": "strategies", "memory_content": "rolled back strategy"}
+                )
+                memory.get_latest_memories_by_category(per_category=2)
+                raise RuntimeError("abort action")
+        except RuntimeError:
+            pass
+        after_rollback = memory.get_latest_memories_by_category(per_category=2)
+
+        return {
+            "success": [m["content"] for m in latest["experiments"]]
+            == ["tied experiment B", "tied experiment A"]
+            and [m["content"] for m in latest["strategies"]] == ["only strategy"]
+            and cached
+            and after_rollback == latest,
+            "data": {k: [m["content"] for m in v] for k, v in latest.items()},
+        }
+
+    def test_read_sees_deferred(self):
+        db_path = os.path.join(self.tmp_dir, "read_deferred.db")
+        memory = MemoryHandler(db_path)
+        progression = ProgressionSystem(db_path)
+        db = progression.db
+        before = db.get_stats()["commits"]
+
+        with db.deferring_writes() as pending_writes:
+            memory.save_agent_post(post_id="p1", title="First", session_id=1)
+            memory.save_agent_post(post_id="p2", title="Second", session_id=1)
+            seen = memory.get_agent_post_ids()
+            flushed = not pending_writes and db.in_transaction
+
+        with db.unit_of_work():
+            db.run_deferred(pending_writes)
+            progression.add_xp("create_post", session_id=1)
+
+        commits = db.get_stats()["commits"] - before
+        return {
+            "success": set(seen) == {"p1", "p2"} and flushed and commits == 1,
+            "data": {"seen": seen, "commits": commits},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Database Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING DATABASE STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Database testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
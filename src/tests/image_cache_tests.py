@@ -0,0 +1,188 @@
+import base64
+import os
+import tempfile
+import threading
+import time
+from src.utils import log
+from src.utils import image_cache
+from src.utils.image_cache import ImageCache, cached_image
+
+
+def data_uri(payload: bytes, mime_type: str = "image/png") -> str:
+    return f"data:{mime_type};base64,{base64.b64encode(payload).decode('utf-8')}"
+
+
+class ImageCacheTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="image_cache_tests_")
+        self.steps = {
+            "1_KEY_NORMALIZATION": self.test_key_normalization,
+            "2_LRU_EVICTION": self.test_lru_eviction,
+            "3_SHARED_DIRECTORY": self.test_shared_directory,
+            "4_LEFTOVER_LOCK_FILE": self.test_leftover_lock_file,
+            "5_LOCK_EXCLUDES_WRITERS": self.test_lock_excludes_writers,
+            "6_HIT_RESETS_TIMINGS": self.test_hit_resets_timings,
+        }
+
+    def _cache_dir(self, name: str) -> str:
+        return os.path.join(self.tmp_dir, name)
+
+    def test_key_normalization(self):
+        base = ImageCache.make_key("A cat, on the MOON!", "512x512", 20, None)
+        same = ImageCache.make_key("  a cat on   the moon ", "512x512", 20, None)
+        other_seed = ImageCache.make_key("a cat on the moon", "512x512", 20, 42)
+        other_size = ImageCache.make_key("a cat on the moon", "768x768", 20, None)
+        styled = ImageCache.make_key("a cat on the moon", "512x512", 20, None, style="Noir!")
+        restyled = ImageCache.make_key("a cat on the moon", "512x512", 20, None, style="noir")
+        return {
+            "success": base == same
+            and len({base, other_seed, other_size, styled}) == 4
+            and styled == restyled,
+            "data": {"normalized": ImageCache.normalize_prompt("A cat, on the MOON!")},
+        }
+
+    def test_lru_eviction(self):
+        cache = ImageCache(self._cache_dir("lru"), max_bytes=250)
+        cache.put("old", data_uri(b"o" * 100))
+        cache.put("recent", data_uri(b"r" * 100))
+        now = time.time()
+        for key, age in (("old", 20), ("recent", 10)):
+            path = cache._blob_path(cache._index[key]["blob"])
+            os.utime(path, (now - age, now - age))
+
+        cache.get("old")
+        cache.put("new", data_uri(b"n" * 100))
+        return {
+            "success": cache.get("recent") is None
+            and cache.get("old") is not None
+            and cache.get("new") is not None
+            and cache.evictions == 1
+            and len(os.listdir(cache.blob_dir)) == 2,
+            "data": cache.get_stats(),
+        }
+
+    def test_shared_directory(self):
+        cache_dir = self._cache_dir("shared")
+        agent = ImageCache(cache_dir, max_bytes=10_000)
+        proxy = ImageCache(cache_dir, max_bytes=10_000)
+        agent.put("agent", data_uri(b"a" * 50))
+        proxy.put("proxy", data_uri(b"p" * 50))
+        restarted = ImageCache(cache_dir, max_bytes=10_000)
+        return {
+            "success": agent.get("proxy") is not None
+            and proxy.get("agent") is not None
+            and restarted.get("agent") is not None
+            and restarted.get("proxy") is not None
+            and len(os.listdir(restarted.blob_dir)) == 2,
+            "data": restarted.get_stats(),
+        }
+
+    def test_leftover_lock_file(self):
+        cache = ImageCache(self._cache_dir("leftover"), max_bytes=10_000)
+        with open(cache.lock_path, "w") as f:
+            f.write("crashed")
+        cache.put("after_crash", data_uri(b"c" * 10))
+        return {
+            "success": cache.get("after_crash") is not None,
+            "data": cache.get_stats(),
+        }
+
+    def test_lock_excludes_writers(self):
+        cache_dir = self._cache_dir("exclusive")
+        holder = ImageCache(cache_dir, max_bytes=10_000)
+        writer = ImageCache(cache_dir, max_bytes=10_000)
+        locked = threading.Event()
+
+        def hold_lock():
+            with holder._file_lock():
+                locked.set()
+                holder._index = holder._load_index()
+                holder._index["held"] = {"blob": "held.png", "mime_type": "image/png", "bytes": 1}
+                time.sleep(0.3)
+                holder._save_index()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        locked.wait()
+        started_at = time.monotonic()
+        writer.put("waited", data_uri(b"w" * 10))
+        waited = time.monotonic() - started_at
+        thread.join()
+
+        index = writer._load_index()
+        return {
+            "success": waited >= 0.2 and {"held", "waited"} <= set(index),
+            "data": {"waited_seconds": round(waited, 3), "keys": sorted(index)},
+        }
+
+    def test_hit_resets_timings(self):
+        class TimedProvider:
+            def __init__(self):
+                self.renders = 0
+                self.last_timings = {"load_seconds": 0.0, "inference_seconds": 0.0}
+
+            @cached_image()
+            def generate_image(
+                self,
+                prompt: str,
+                width: int = 512,
+                height: int = 512,
+                num_inference_steps: int = 4,
+                seed=None,
+            ):
+                self.renders += 1
+                self.last_timings = {
+                    "load_seconds": 3.5,
+                    "inference_seconds": 1.25,
+                    "cache_hit": False,
+                }
+                return data_uri(b"t" * 20)
+
+        previous = image_cache._image_cache
+        image_cache._image_cache = ImageCache(self._cache_dir("timings"), 10_000)
+        try:
+            provider = TimedProvider()
+            first = provider.generate_image("a lighthouse at dusk")
+            miss_timings = dict(provider.last_timings)
+            second = provider.generate_image("a lighthouse at dusk")
+            hit_timings = dict(provider.last_timings)
+        finally:
+            image_cache._image_cache = previous
+
+        return {
+            "success": first == second
+            and provider.renders == 1
+            and miss_timings["inference_seconds"] == 1.25
+            and hit_timings
+            == {"load_seconds": 0.0, "inference_seconds": 0.0, "cache_hit": True},
+            "data": {"miss": miss_timings, "hit": hit_timings},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Image Cache Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING IMAGE CACHE STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Image cache testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,151 @@
+import imaplib
+from types import SimpleNamespace
+from src.contexts.mail_context import MailContext
+from src.managers.imap_session import ImapSession
+from src.settings import settings
+from src.utils import log
+from src.utils.exceptions import AccessDeniedError
+
+
+class FakeMailbox:
+    instances = []
+
+    def __init__(self):
+        self.alive = True
+        self.drop_next = False
+        self.calls = 0
+        FakeMailbox.instances.append(self)
+
+    def login(self, user, password, initial_folder=None):
+        if password != "secret":
+            raise Exception("authentication failed")
+        return self
+
+    @property
+    def client(self):
+        return SimpleNamespace(noop=lambda: ("OK" if self.alive else "NO", [b""]))
+
+    def uids(self, criteria):
+        if self.drop_next:
+            self.drop_next = False
+            raise imaplib.IMAP4.abort("socket error: EOF")
+        self.calls += 1
+        return ["1", "2"]
+
+    def logout(self):
+        self.alive = False
+
+
+class ImapSessionTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_LAZY_CONNECT": self.test_lazy_connect,
+            "2_RECONNECT_AND_RETRY": self.test_reconnect_and_retry,
+            "3_STALE_SESSION": self.test_stale_session,
+            "4_AUTH_ERROR": self.test_auth_error,
+            "5_SNIPPET_NON_BLOCKING": self.test_snippet_non_blocking,
+        }
+
+    @staticmethod
+    def _session(password: str = "secret") -> ImapSession:
+        FakeMailbox.instances = []
+        return ImapSession(FakeMailbox, "agent@example.com", password)
+
+    def test_lazy_connect(self):
+        session = self._session()
+        before = len(FakeMailbox.instances)
+        uids = session.run(lambda mailbox: mailbox.uids("ALL"))
+        session.close()
+        return {
+            "success": before == 0 and uids == ["1", "2"] and session.connections == 1,
+            "data": {"connections_before_use": before, "connections": session.connections},
+        }
+
+    def test_reconnect_and_retry(self):
+        session = self._session()
+        session.run(lambda mailbox: mailbox.uids("ALL"))
+        FakeMailbox.instances[-1].drop_next = True
+        uids = session.run(lambda mailbox: mailbox.uids("ALL"))
+        session.close()
+        return {
+            "success": uids == ["1", "2"]
+            and session.reconnects == 1
+            and len(FakeMailbox.instances) == 2,
+            "data": {"reconnects": session.reconnects, "connections": session.connections},
+        }
+
+    def test_stale_session(self):
+        session = self._session()
+        session.get()
+        FakeMailbox.instances[-1].alive = False
+        session._last_used -= settings.IMAP_KEEPALIVE_INTERVAL + 1
+        session.get()
+        session.close()
+        return {
+            "success": session.reconnects == 1 and len(FakeMailbox.instances) == 2,
+            "data": {"reconnects": session.reconnects},
+        }
+
+    def test_auth_error(self):
+        session = self._session(password="wrong")
+        try:
+            session.get()
+        except AccessDeniedError as e:
+            return {"success": not session.connected, "data": e.message}
+        return {"success": False, "error": "login with bad credentials succeeded"}
+
+    def test_snippet_non_blocking(self):
+        calls = []
+        snapshot = []
+        mirror = SimpleNamespace(
+            sync=lambda: calls.append("sync"),
+            has_snapshot=lambda: bool(snapshot),
+            get_counts=lambda: {"total": 3, "unseen": 1},
+        )
+        handler = SimpleNamespace(
+            get_inbox_state=lambda: None,
+            imap=SimpleNamespace(connected=False),
+            mail_mirror=mirror,
+            sync_in_background=lambda: calls.append("background"),
+        )
+        ctx = MailContext(handler, memory_handler=None)
+        before_sync = ctx.get_home_snippet()
+        snapshot.append(True)
+        cached = ctx.get_home_snippet()
+        handler.imap.connected = True
+        ctx.get_home_snippet()
+        return {
+            "success": "Syncing" in before_sync
+            and "3 active" in cached
+            and calls == ["background", "background", "sync"],
+            "data": {"before_sync": before_sync, "cached": cached, "calls": calls},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting IMAP Session Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING IMAP SESSION STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 IMAP session testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,229 @@
+import os
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+from imap_tools import MailMessageFlags
+from src.handlers.email_handler import EmailHandler
+from src.managers.mail_mirror import MailMirror
+from src.utils import log
+
+
+class FakeFolderMailbox:
+    def __init__(self, uidvalidity: int = 1):
+        self.uidvalidity = uidvalidity
+        self.uidnext = 1
+        self.messages = {}
+        self.uid_queries = 0
+        self.searches = []
+
+    def deliver(self, subject: str, seen: bool = False) -> int:
+        uid = self.uidnext
+        self.uidnext += 1
+        self.messages[uid] = {"subject": subject, "seen": seen}
+        return uid
+
+    @property
+    def folder(self):
+        return SimpleNamespace(status=self._status)
+
+    def _status(self, folder, items):
+        return {
+            "MESSAGES": len(self.messages),
+            "UNSEEN": sum(1 for m in self.messages.values() if not m["seen"]),
+            "UIDVALIDITY": self.uidvalidity,
+            "UIDNEXT": self.uidnext,
+        }
+
+    def fetch(self, criteria, headers_only=False, mark_seen=False, bulk=False):
+        for uid, message in sorted(self.messages.items()):
+            yield SimpleNamespace(
+                uid=str(uid),
+                subject=message["subject"],
+                from_="human@example.com",
+                date=datetime(2026, 1, 1),
+                flags=(MailMessageFlags.SEEN,) if message["seen"] else (),
+            )
+
+    def uids(self, criteria, charset=None):
+        if criteria not in ("ALL", "UNSEEN"):
+            self.searches.append((str(criteria), charset))
+            return [str(uid) for uid in self.messages]
+        self.uid_queries += 1
+        return [
+            str(uid)
+            for uid, message in self.messages.items()
+            if criteria == "ALL" or not message["seen"]
+        ]
+
+
+class MailMirrorTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="mail_mirror_tests_")
+        self.steps = {
+            "1_INCREMENTAL_SYNC": self.test_incremental_sync,
+            "2_GATED_RECONCILE": self.test_gated_reconcile,
+            "3_LAST_UID_AFTER_EXPUNGE": self.test_last_uid_after_expunge,
+            "4_UIDVALIDITY_RESET": self.test_uidvalidity_reset,
+            "5_SEARCH_CRITERIA": self.test_search_criteria,
+            "6_SEARCH_PAGING": self.test_search_paging,
+        }
+
+    def _mirror(self, name: str, mailbox: FakeFolderMailbox) -> MailMirror:
+        imap = SimpleNamespace(run=lambda operation: operation(mailbox))
+        return MailMirror(os.path.join(self.tmp_dir, f"{name}.db"), imap, lambda html: html)
+
+    def test_incremental_sync(self):
+        mailbox = FakeFolderMailbox()
+        mailbox.deliver("First", seen=True)
+        mailbox.deliver("Second")
+        mirror = self._mirror("incremental", mailbox)
+        first = mirror.sync(force=True)
+        mailbox.deliver("Third")
+        second = mirror.sync(force=True)
+        subjects = [m["subject"] for m in mirror.list_messages()]
+        return {
+            "success": first == 2
+            and second == 1
+            and subjects == ["Third", "Second", "First"]
+            and mirror.get_counts() == {"total": 3, "unseen": 2},
+            "data": {"subjects": subjects, "state": mirror._get_state()},
+        }
+
+    def test_gated_reconcile(self):
+        mailbox = FakeFolderMailbox()
+        mailbox.deliver("First")
+        mailbox.deliver("Second")
+        mirror = self._mirror("gated", mailbox)
+        mirror.sync(force=True)
+        baseline = mailbox.uid_queries
+
+        mailbox.deliver("Third")
+        mirror.sync(force=True)
+        skipped = mailbox.uid_queries == baseline
+
+        mailbox.messages[1]["seen"] = True
+        mirror.sync(force=True)
+        flagged = mailbox.uid_queries > baseline
+
+        del mailbox.messages[2]
+        mirror.sync(force=True)
+        uids = [m["uid"] for m in mirror.list_messages()]
+        return {
+            "success": skipped
+            and flagged
+            and uids == ["3", "1"]
+            and mirror.get_counts() == {"total": 2, "unseen": 1},
+            "data": {"uid_queries": mailbox.uid_queries, "uids": uids},
+        }
+
+    def test_last_uid_after_expunge(self):
+        mailbox = FakeFolderMailbox()
+        mailbox.deliver("First")
+        mirror = self._mirror("expunge", mailbox)
+        mirror.sync(force=True)
+        uid = mailbox.deliver("Spam")
+        del mailbox.messages[uid]
+        mirror.sync(force=True)
+        state = mirror._get_state()
+        return {
+            "success": state["last_uid"] == mailbox.uidnext - 1
+            and mirror.get_counts()["total"] == 1,
+            "data": state,
+        }
+
+    def test_uidvalidity_reset(self):
+        mailbox = FakeFolderMailbox(uidvalidity=1)
+        mailbox.deliver("Old one")
+        mailbox.deliver("Old two")
+        mirror = self._mirror("uidvalidity", mailbox)
+        mirror.sync(force=True)
+
+        rebuilt = FakeFolderMailbox(uidvalidity=2)
+        rebuilt.deliver("Rebuilt")
+        mirror.imap = SimpleNamespace(run=lambda operation: operation(rebuilt))
+        new_count = mirror.sync(force=True)
+        subjects = [m["subject"] for m in mirror.list_messages()]
+        state = mirror._get_state()
+        return {
+            "success": new_count == 1
+            and subjects == ["Rebuilt"]
+            and state["uidvalidity"] == 2
+            and state["last_uid"] == 1,
+            "data": {"subjects": subjects, "state": state},
+        }
+
+    def test_search_criteria(self):
+        build = EmailHandler._build_search_criteria
+        rendered = {
+            "any": str(build("Moltbook", "any")),
+            "from": str(build("human@example.com", "from", "2026-01-31")),
+            "text": str(build("report", "text")),
+        }
+        try:
+            build("report", "any", "31/01/2026")
+            rejected = False
+        except Exception:
+            rejected = True
+        return {
+            "success": rendered["any"] == '(OR FROM "Moltbook" SUBJECT "Moltbook")'
+            and rendered["from"] == '((FROM "human@example.com") SINCE 31-Jan-2026)'
+            and rendered["text"] == '(TEXT "report")'
+            and rejected,
+            "data": rendered,
+        }
+
+    def test_search_paging(self):
+        mailbox = FakeFolderMailbox()
+        for n in range(12):
+            mailbox.deliver(f"Report {n + 1}")
+        mirror = self._mirror("search", mailbox)
+
+        handler = EmailHandler.__new__(EmailHandler)
+        handler.mail_mirror = mirror
+        handler.memory_handler = SimpleNamespace(get_owned_tools=lambda: [])
+        first = handler.handle_email_search(SimpleNamespace(query="Report", page=1, limit=5))
+        last = handler.handle_email_search(SimpleNamespace(query="Report", page=3, limit=5))
+        total, unicode_page = mirror.search(EmailHandler._build_search_criteria("café", "subject"), limit=5)
+
+        return {
+            "success": "(page 1/3)" in first["data"]
+            and "`12` | human@example.com | Report 12" in first["data"]
+            and "Use page=2" in first["data"]
+            and "(page 3/3)" in last["data"]
+            and "`2` |" in last["data"]
+            and "`1` |" in last["data"]
+            and "Use page=" not in last["data"]
+            and total == 12
+            and len(unicode_page) == 5
+            and [charset for _, charset in mailbox.searches] == ["US-ASCII", "US-ASCII", "UTF-8"],
+            "data": {"searches": mailbox.searches},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Mail Mirror Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING MAIL MIRROR STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Mail mirror testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,183 @@
+import imaplib
+import threading
+import time
+from types import SimpleNamespace
+from src.managers.mail_watcher import MailWatcher
+from src.utils import log
+
+
+class FakeIdleMailbox:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.logged_out = False
+        self.idle = SimpleNamespace(wait=self._wait)
+
+    def _wait(self, timeout=None):
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        time.sleep(0.02)
+        return []
+
+    def logout(self):
+        self.logged_out = True
+
+
+class FakeMirror:
+    def __init__(self, new_counts):
+        self.new_counts = list(new_counts)
+        self.total = 0
+        self.syncs = 0
+
+    def sync(self, force: bool = False) -> int:
+        self.syncs += 1
+        new = self.new_counts.pop(0) if self.new_counts else 0
+        self.total += new
+        return new
+
+    def get_counts(self):
+        return {"total": self.total, "unseen": self.total}
+
+    def list_messages(self, limit: int = 10):
+        return [
+            {"uid": str(uid), "from": "human@example.com", "subject": f"Hello {uid}"}
+            for uid in range(self.total, 0, -1)
+        ][:limit]
+
+
+class MailWatcherTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_IDLE_WAKEUP_NOTIFIES": self.test_idle_wakeup_notifies,
+            "2_RECONNECT_BACKOFF": self.test_reconnect_backoff,
+            "3_DROP_DURING_IDLE": self.test_drop_during_idle,
+            "4_LISTENER_FAILURE_ISOLATED": self.test_listener_failure_isolated,
+        }
+
+    @staticmethod
+    def _watcher(connect, mirror) -> MailWatcher:
+        watcher = MailWatcher(connect, mirror)
+        watcher.idle_timeout = 0.05
+        watcher.max_backoff = 2
+        return watcher
+
+    @staticmethod
+    def _wait_for(condition, timeout: float = 10) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.02)
+        return False
+
+    def test_idle_wakeup_notifies(self):
+        mailbox = FakeIdleMailbox([[], [b"* 3 EXISTS"]])
+        mirror = FakeMirror([2, 1])
+        watcher = self._watcher(lambda: mailbox, mirror)
+        received = threading.Event()
+        notifications = []
+
+        def listener(messages, state):
+            notifications.append((messages, state))
+            received.set()
+
+        watcher.add_listener(listener)
+        watcher.start()
+        received.wait(timeout=10)
+        watcher.stop()
+        watcher._thread.join(timeout=10)
+
+        messages, state = notifications[0] if notifications else ([], {})
+        return {
+            "success": len(notifications) == 1
+            and [m["uid"] for m in messages] == ["3"]
+            and state.get("unread") == 3
+            and mirror.syncs == 2
+            and mailbox.logged_out,
+            "data": {"notifications": len(notifications), "state_total": state.get("total")},
+        }
+
+    def test_reconnect_backoff(self):
+        attempts = []
+        mailbox = FakeIdleMailbox([])
+
+        def connect():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise ConnectionRefusedError("imap down")
+            return mailbox
+
+        watcher = self._watcher(connect, FakeMirror([0]))
+        watcher.start()
+        live = self._wait_for(lambda: watcher.is_live)
+        watcher.stop()
+        watcher._thread.join(timeout=10)
+
+        waited = attempts[1] - attempts[0] if len(attempts) > 1 else 0
+        return {
+            "success": live and watcher.reconnects == 1 and waited >= 1,
+            "data": {"reconnects": watcher.reconnects, "waited": round(waited, 2)},
+        }
+
+    def test_drop_during_idle(self):
+        first = FakeIdleMailbox([imaplib.IMAP4.abort("socket error: EOF")])
+        second = FakeIdleMailbox([])
+        mailboxes = [first, second]
+        mirror = FakeMirror([1, 0])
+        watcher = self._watcher(lambda: mailboxes.pop(0), mirror)
+        watcher.start()
+        recovered = self._wait_for(lambda: mirror.syncs == 2 and watcher.is_live)
+        watcher.stop()
+        watcher._thread.join(timeout=10)
+        return {
+            "success": recovered and first.logged_out and watcher.reconnects == 1,
+            "data": {"reconnects": watcher.reconnects, "last_error": watcher.last_error},
+        }
+
+    def test_listener_failure_isolated(self):
+        mirror = FakeMirror([0, 1])
+        watcher = self._watcher(lambda: None, mirror)
+        delivered = []
+
+        def broken(messages, state):
+            raise RuntimeError("viewer offline")
+
+        watcher.add_listener(broken)
+        watcher.add_listener(lambda messages, state: delivered.append(messages))
+        watcher.refresh()
+        watcher.refresh()
+        return {
+            "success": len(delivered) == 1 and watcher.get_state()["total"] == 1,
+            "data": watcher.get_state(),
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Mail Watcher Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING MAIL WATCHER STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Mail watcher testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -67,4 +67,14 @@ class MoltbookLiveTester:
         log.info(
             f"📊 LIVE API SUMMARY: {successes}/{len(self.results)} calls succeeded."
         )
+        stats = self.provider.get_connection_stats()
+        log.info(
+            f"🔌 CONNECTIONS: {stats['connections_opened']} opened, "
+            f"{stats['connections_reused']} reused over {stats['requests_sent']} requests"
+        )
+        cache_stats = self.provider.get_cache_stats()
+        log.info(
+            f"♻️ CACHE: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"(hit rate {cache_stats['hit_rate']:.0%})"
+        )
         print("=" * 80)
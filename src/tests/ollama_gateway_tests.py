@@ -0,0 +1,208 @@
+import asyncio
+import httpx
+from src.managers.ollama_gateway import (
+    BackendPool,
+    FairRequestQueue,
+    GatewayQueueFullError,
+)
+from src.utils import log
+
+API_KEY = "gateway-test-key"
+
+
+class OllamaGatewayTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_LEAST_LOADED": self.test_least_loaded,
+            "2_MODEL_AFFINITY": self.test_model_affinity,
+            "3_UNHEALTHY_BACKENDS": self.test_unhealthy_backends,
+            "4_FAIR_QUEUE": self.test_fair_queue,
+            "5_QUEUE_LIMITS": self.test_queue_limits,
+            "6_FAILOVER": self.test_failover,
+        }
+
+    @staticmethod
+    def _pool(*names, affinity_max_extra: int = 2) -> BackendPool:
+        return BackendPool(
+            [f"http://{name}:11434" for name in names],
+            affinity_max_extra=affinity_max_extra,
+        )
+
+    def test_least_loaded(self):
+        pool = self._pool("a", "b", "c")
+        a, b, c = pool.backends
+        pool.acquire(a)
+        pool.acquire(a)
+        pool.acquire(b)
+        chosen = pool.choose()
+        pool.release(a)
+        pool.release(a)
+        return {
+            "success": chosen is c and pool.choose() is a,
+            "data": pool.get_stats(),
+        }
+
+    def test_model_affinity(self):
+        pool = self._pool("a", "b")
+        a, b = pool.backends
+        pool.acquire(a, "qwen")
+        sticky = pool.choose("qwen")
+        for _ in range(3):
+            pool.acquire(a, "qwen")
+        spilled = pool.choose("qwen")
+        return {
+            "success": sticky is a and spilled is b,
+            "data": {"sticky": sticky.url, "spilled": spilled.url},
+        }
+
+    def test_unhealthy_backends(self):
+        pool = self._pool("a", "b")
+        a, b = pool.backends
+        pool.mark_failed(a, ConnectionError("refused"))
+        avoided = pool.choose()
+        pool.mark_failed(b, ConnectionError("refused"))
+        fallback = pool.choose()
+        exhausted = pool.choose(exclude={a.url, b.url})
+        return {
+            "success": avoided is b and fallback is not None and exhausted is None,
+            "data": pool.get_stats(),
+        }
+
+    def test_fair_queue(self):
+        async def scenario():
+            queue = FairRequestQueue(max_concurrent=1, max_per_key=1, max_queued_per_key=8)
+            order = []
+
+            async def request(key: str, name: str):
+                await queue.acquire(key)
+                order.append(name)
+                await asyncio.sleep(0)
+                queue.release(key)
+
+            await queue.acquire("heavy")
+            tasks = [asyncio.create_task(request("heavy", f"heavy-{n}")) for n in range(3)]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(request("light", "light-0")))
+            await asyncio.sleep(0)
+            queue.release("heavy")
+            await asyncio.gather(*tasks)
+            return order, queue.get_stats()
+
+        order, stats = asyncio.run(scenario())
+        return {
+            "success": order.index("light-0") == 1
+            and stats["active"] == 0
+            and stats["waiting"] == 0,
+            "data": {"order": order, "queued": stats["queued"]},
+        }
+
+    def test_queue_limits(self):
+        async def scenario():
+            queue = FairRequestQueue(max_concurrent=1, max_per_key=1, max_queued_per_key=1)
+            await queue.acquire("key")
+            waiter = asyncio.create_task(queue.acquire("key"))
+            await asyncio.sleep(0)
+
+            rejected = False
+            try:
+                await queue.acquire("key")
+            except GatewayQueueFullError:
+                rejected = True
+
+            waiter.cancel()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                pass
+            queue.release("key")
+            return rejected, queue.get_stats()
+
+        rejected, stats = asyncio.run(scenario())
+        return {
+            "success": rejected
+            and stats["rejected"] == 1
+            and stats["active"] == 0
+            and stats["waiting"] == 0,
+            "data": stats,
+        }
+
+    def test_failover(self):
+        import ollama_proxy
+
+        pool = self._pool("down", "up")
+        down, up = pool.backends
+        served_by = []
+
+        async def chunks():
+            yield b'{"done": true}\n'
+
+        def upstream(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "down":
+                raise httpx.ConnectError("connection refused", request=request)
+            served_by.append(request.url.host)
+            return httpx.Response(200, content=chunks())
+
+        async def scenario():
+            ollama_proxy.ollama_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(upstream)
+            )
+            transport = httpx.ASGITransport(app=ollama_proxy.app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://gateway"
+            ) as client:
+                response = await client.post(
+                    "/api/generate",
+                    json={"model": "qwen", "prompt": "hi"},
+                    headers={"X-API-Key": API_KEY},
+                )
+            await ollama_proxy.ollama_client.aclose()
+            return response
+
+        original_pool = ollama_proxy.backend_pool
+        ollama_proxy.backend_pool = pool
+        ollama_proxy.OLLAMA_PROXY_API_KEYS.add(API_KEY)
+        try:
+            response = asyncio.run(scenario())
+        finally:
+            ollama_proxy.OLLAMA_PROXY_API_KEYS.discard(API_KEY)
+            ollama_proxy.backend_pool = original_pool
+            ollama_proxy.ollama_client = None
+
+        return {
+            "success": response.status_code == 200
+            and served_by == ["up"]
+            and not down.healthy
+            and down.outstanding == 0
+            and up.outstanding == 0
+            and "qwen" in up.loaded_models,
+            "data": pool.get_stats(),
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Ollama Gateway Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING OLLAMA GATEWAY STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Ollama gateway testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import httpx
+from src.managers.proxy_metrics import ProxyMetrics, RequestTimer
+from src.utils import log
+
+API_KEY = "proxy-test-key"
+FINAL_CHUNK = {"done": True, "model": "qwen", "eval_count": 40, "eval_duration": 2_000_000_000}
+
+
+def ndjson(*chunks) -> bytes:
+    return b"".join(json.dumps(chunk).encode("utf-8") + b"\n" for chunk in chunks)
+
+
+class OllamaProxyTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_TIMER_FINAL_STATS": self.test_timer_final_stats,
+            "2_METRICS_WINDOW": self.test_metrics_window,
+            "3_STREAM_PASSTHROUGH": self.test_stream_passthrough,
+            "4_CLIENT_DISCONNECT": self.test_client_disconnect,
+        }
+
+    def test_timer_final_stats(self):
+        timer = RequestTimer("api/chat")
+        timer.status_code = 200
+        timer.on_chunk(ndjson({"message": {"content": "x" * 10_000}, "done": False}))
+        timer.on_chunk(ndjson(FINAL_CHUNK))
+        entry = timer.finish()
+        return {
+            "success": entry["tokens_per_second"] == 20.0
+            and entry["model"] == "qwen"
+            and entry["ttfb_ms"] is not None
+            and len(timer._tail) <= RequestTimer.TAIL_BYTES,
+            "data": entry,
+        }
+
+    def test_metrics_window(self):
+        metrics = ProxyMetrics(window=3)
+        for status in (200, 200, 500, 200, 200):
+            timer = metrics.start("api/generate")
+            timer.status_code = status
+            metrics.record(timer)
+        stats = metrics.get_stats()
+        return {
+            "success": stats["total_requests"] == 5
+            and stats["failed_requests"] == 1
+            and stats["window"] == 3
+            and stats["in_flight"] == 0,
+            "data": {k: v for k, v in stats.items() if k != "recent"},
+        }
+
+    def test_stream_passthrough(self):
+        import ollama_proxy
+
+        body = ndjson({"message": {"content": "hi"}, "done": False}, FINAL_CHUNK)
+        upstream_calls = []
+
+        async def chunks():
+            for line in body.splitlines(keepends=True):
+                yield line
+
+        def upstream(request: httpx.Request) -> httpx.Response:
+            upstream_calls.append(json.loads(request.content))
+            return httpx.Response(200, content=chunks())
+
+        async def scenario():
+            ollama_proxy.ollama_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(upstream)
+            )
+            transport = httpx.ASGITransport(app=ollama_proxy.app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://gateway"
+            ) as client:
+                responses = [
+                    await client.post(
+                        "/api/chat",
+                        json={"model": "qwen", "messages": []},
+                        headers={"X-API-Key": API_KEY},
+                    )
+                    for _ in range(2)
+                ]
+            await ollama_proxy.ollama_client.aclose()
+            return responses
+
+        before = ollama_proxy.proxy_metrics.total_requests
+        ollama_proxy.OLLAMA_PROXY_API_KEYS.add(API_KEY)
+        try:
+            responses = asyncio.run(scenario())
+        finally:
+            ollama_proxy.OLLAMA_PROXY_API_KEYS.discard(API_KEY)
+            ollama_proxy.ollama_client = None
+
+        stats = ollama_proxy.proxy_metrics.get_stats()
+        released = (
+            stats["in_flight"] == 0
+            and ollama_proxy.request_queue.get_stats()["active"] == 0
+            and all(b.outstanding == 0 for b in ollama_proxy.backend_pool.backends)
+        )
+        return {
+            "success": all(r.status_code == 200 and r.content == body for r in responses)
+            and stats["total_requests"] - before == 2
+            and stats["recent"][-1]["tokens_per_second"] == 20.0
+            and all("num_ctx" in call["options"] for call in upstream_calls)
+            and released,
+            "data": {k: v for k, v in stats.items() if k != "recent"},
+        }
+
+    def test_client_disconnect(self):
+        import ollama_proxy
+
+        first_line = ndjson({"message": {"content": "hi"}, "done": False})
+        request_body = json.dumps({"model": "qwen", "messages": []}).encode("utf-8")
+
+        async def stalled_chunks():
+            yield first_line
+            await asyncio.Event().wait()
+
+        def upstream(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=stalled_chunks())
+
+        async def disconnect_mid_stream(spec_version: str):
+            first_chunk_sent = asyncio.Event()
+            requested = False
+
+            async def receive():
+                nonlocal requested
+                if not requested:
+                    requested = True
+                    return {"type": "http.request", "body": request_body, "more_body": False}
+                await first_chunk_sent.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                if message["type"] == "http.response.body" and message.get("body"):
+                    if first_chunk_sent.is_set() or spec_version == "2.4":
+                        raise OSError("client went away")
+                    first_chunk_sent.set()
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0", "spec_version": spec_version},
+                "http_version": "1.1",
+                "method": "POST",
+                "scheme": "http",
+                "path": "/api/chat",
+                "raw_path": b"/api/chat",
+                "query_string": b"",
+                "root_path": "",
+                "headers": [
+                    (b"host", b"gateway"),
+                    (b"content-type", b"application/json"),
+                    (b"x-api-key", API_KEY.encode("utf-8")),
+                ],
+                "client": ("127.0.0.1", 50000),
+                "server": ("gateway", 80),
+            }
+            try:
+                await asyncio.wait_for(ollama_proxy.app(scope, receive, send), 5)
+            except Exception:
+                pass
+
+        async def scenario():
+            ollama_proxy.ollama_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(upstream)
+            )
+            counters = {}
+            for spec_version in ("2.0", "2.4"):
+                await disconnect_mid_stream(spec_version)
+                counters[spec_version] = {
+                    "in_flight": ollama_proxy.proxy_metrics.get_stats()["in_flight"],
+                    "queue_active": ollama_proxy.request_queue.get_stats()["active"],
+                    "outstanding": sum(
+                        b.outstanding for b in ollama_proxy.backend_pool.backends
+                    ),
+                }
+            await ollama_proxy.ollama_client.aclose()
+            return counters
+
+        before = ollama_proxy.proxy_metrics.get_stats()["failed_requests"]
+        ollama_proxy.OLLAMA_PROXY_API_KEYS.add(API_KEY)
+        try:
+            counters = asyncio.run(scenario())
+        finally:
+            ollama_proxy.OLLAMA_PROXY_API_KEYS.discard(API_KEY)
+            ollama_proxy.ollama_client = None
+
+        failed = ollama_proxy.proxy_metrics.get_stats()["failed_requests"] - before
+        return {
+            "success": all(not any(c.values()) for c in counters.values()) and failed == 2,
+            "data": {"counters": counters, "failed": failed},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Ollama Proxy Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING OLLAMA PROXY STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Ollama proxy testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
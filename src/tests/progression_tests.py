@@ -0,0 +1,151 @@
+import os
+import random
+import tempfile
+from src.managers.progression_system import ProgressionSystem
+from src.utils import log
+
+
+def reference_level(total_xp: int) -> int:
+    level, threshold = 1, 0
+    while True:
+        needed = int(ProgressionSystem.XP_BASE * (ProgressionSystem.XP_MULTIPLIER ** (level - 1)))
+        if total_xp < threshold + needed:
+            return level
+        threshold += needed
+        level += 1
+
+
+class ProgressionTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="progression_tests_")
+        self.steps = {
+            "1_LEVEL_TABLE": self.test_level_table,
+            "2_TABLE_EXTENDS": self.test_table_extends,
+            "3_STATE_PERSISTED": self.test_state_persisted,
+            "4_ROLLBACK_RELOADS": self.test_rollback_reloads,
+            "5_SPEND_INSUFFICIENT": self.test_spend_insufficient,
+            "6_FREE_SEARCH_NO_XP": self.test_free_search_no_xp,
+        }
+
+    def _progression(self, name: str) -> ProgressionSystem:
+        return ProgressionSystem(os.path.join(self.tmp_dir, f"{name}.db"))
+
+    def test_level_table(self):
+        progression = self._progression("levels")
+        boundaries = []
+        for level in range(2, 40):
+            threshold = progression.get_cumulative_xp_threshold(level)
+            boundaries.extend([threshold - 1, threshold, threshold + 1])
+        samples = boundaries + [random.randint(0, 10**7) for _ in range(500)]
+        mismatches = [
+            xp for xp in samples if progression.get_level_for_xp(xp) != reference_level(xp)
+        ]
+        return {
+            "success": not mismatches
+            and progression.get_level_for_xp(0) == 1
+            and progression.get_level_for_xp(-50) == 1,
+            "data": {"samples": len(samples), "mismatches": mismatches[:5]},
+        }
+
+    def test_table_extends(self):
+        progression = self._progression("extends")
+        far_level = ProgressionSystem.PRECOMPUTED_LEVELS + 20
+        threshold = progression.get_cumulative_xp_threshold(far_level)
+        level = progression.get_level_for_xp(threshold)
+        return {
+            "success": level == far_level
+            and progression.get_level_for_xp(threshold - 1) == far_level - 1
+            and len(ProgressionSystem._xp_thresholds) > far_level,
+            "data": {"level": level, "table_size": len(ProgressionSystem._xp_thresholds)},
+        }
+
+    def test_state_persisted(self):
+        progression = self._progression("persisted")
+        notified = []
+        progression.add_listener(lambda status: notified.append(status["total_xp_earned"]))
+        for _ in range(12):
+            progression.add_xp("wiki_search")
+        progression.spend_xp(30, reason="buy_tool")
+
+        stored = dict(progression._load_state())
+        status = progression.get_current_status()
+        return {
+            "success": stored["total_xp_earned"] == status["total_xp_earned"] == 120
+            and stored["current_xp_balance"] == status["current_xp_balance"] == 90
+            and stored["level"] == status["level"] == 2
+            and len(notified) == 13,
+            "data": stored,
+        }
+
+    def test_rollback_reloads(self):
+        progression = self._progression("rollback")
+        progression.add_xp("comment_post")
+        before = progression.get_current_status()
+        notified = []
+        progression.add_listener(lambda status: notified.append(status["total_xp_earned"]))
+
+        try:
+            with progression.db.unit_of_work():
+                progression.add_xp("write_blog_article")
+                raise RuntimeError("action failed after awarding XP")
+        except RuntimeError:
+            pass
+
+        after = progression.get_current_status()
+        return {
+            "success": after["total_xp_earned"] == before["total_xp_earned"]
+            and after["current_xp_balance"] == before["current_xp_balance"]
+            and notified == [before["total_xp_earned"] + 25, before["total_xp_earned"]],
+            "data": {"notified": notified},
+        }
+
+    def test_spend_insufficient(self):
+        progression = self._progression("spend")
+        progression.add_xp("comment_post")
+        before = progression.get_current_status()
+        spent = progression.spend_xp(before["current_xp_balance"] + 1, reason="buy_tool")
+        return {
+            "success": not spent and progression.get_current_status() == before,
+            "data": progression.get_current_status()["current_xp_balance"],
+        }
+
+    def test_free_search_no_xp(self):
+        progression = self._progression("free_search")
+        before = progression.get_current_status()
+        awarded = [progression.add_xp("email_search")["xp_gained"] for _ in range(10)]
+        after = progression.get_current_status()
+        return {
+            "success": awarded == [0] * 10
+            and after["total_xp_earned"] == before["total_xp_earned"]
+            and after["current_xp_balance"] == before["current_xp_balance"],
+            "data": {"awarded": sum(awarded)},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Progression Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING PROGRESSION STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Progression testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,237 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+import wikipedia
+from src.handlers.research_handler import ResearchHandler
+from src.managers.research_cache import ResearchCache
+from src.managers.wiki_ingestor import WikiIngestor
+from src.settings import settings
+from src.utils import log
+
+
+class FakeVectorDB:
+    def __init__(self):
+        self.upserted = []
+        self.deleted = []
+
+    def upsert(self, ids, documents, metadatas):
+        self.upserted.extend(ids)
+
+    def delete(self, ids=None, where=None):
+        self.deleted.extend(ids or [])
+
+
+class ResearchIndexTestSuite:
+    def __init__(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="research_index_tests_")
+        self.steps = {
+            "1_SEARCH_CACHE_TTL": self.test_search_cache_ttl,
+            "2_SEARCH_CACHE_LIMITS": self.test_search_cache_limits,
+            "3_TITLE_ALIASES": self.test_title_aliases,
+            "4_RESOLVE_SINGLE_FETCH": self.test_resolve_single_fetch,
+            "5_CHUNK_MIN_SIZE": self.test_chunk_min_size,
+            "6_INGEST_DEDUP": self.test_ingest_dedup,
+            "7_TOPIC_PAGING": self.test_topic_paging,
+        }
+
+    def _cache(self, name: str) -> ResearchCache:
+        return ResearchCache(os.path.join(self.tmp_dir, f"{name}.db"))
+
+    def test_search_cache_ttl(self):
+        cache = self._cache("ttl")
+        cache.store_search("Generative  MUSIC", ["Generative music", "Brian Eno"], 5, 850.0)
+        fresh = cache.get_search("generative music", 5)
+
+        ttl = settings.WIKI_SEARCH_CACHE_TTL
+        settings.WIKI_SEARCH_CACHE_TTL = -1
+        try:
+            cache.store_search("ambient music", ["Ambient music"], 5, 600.0)
+        finally:
+            settings.WIKI_SEARCH_CACHE_TTL = ttl
+        expired = cache.get_search("ambient music", 5)
+        purged = self._cache("ttl").conn.execute(
+            "SELECT COUNT(*) FROM wiki_search_cache WHERE query_key = 'ambient music'"
+        ).fetchone()[0]
+
+        return {
+            "success": fresh == {"titles": ["Generative music", "Brian Eno"], "fetch_ms": 850.0}
+            and expired is None
+            and purged == 0,
+            "data": {"fresh": fresh, "expired": expired},
+        }
+
+    def test_search_cache_limits(self):
+        cache = self._cache("limits")
+        cache.store_search("synth", ["Synthesizer", "Moog", "Buchla"], 3, 400.0)
+        cache.store_search("theremin", ["Theremin"], 5, 300.0)
+        narrower = cache.get_search("synth", 2)
+        wider = cache.get_search("synth", 10)
+        exhausted = cache.get_search("theremin", 10)
+        cache.record_live_search(400.0)
+        saved = cache.record_hit(narrower["fetch_ms"])
+        hit_count = cache.conn.execute(
+            "SELECT hit_count FROM wiki_search_cache WHERE query_key = 'synth'"
+        ).fetchone()[0]
+        return {
+            "success": narrower["titles"] == ["Synthesizer", "Moog"]
+            and wider is None
+            and exhausted["titles"] == ["Theremin"]
+            and saved == 400.0
+            and hit_count == 1
+            and cache.get_stats()["hit_rate"] == 0.5,
+            "data": cache.get_stats(),
+        }
+
+    def test_title_aliases(self):
+        cache = self._cache("aliases")
+        cache.store_title_alias("generative  AI", "Generative artificial intelligence")
+        by_alias = cache.get_canonical_title("Generative AI")
+        by_canonical = cache.get_canonical_title("generative artificial intelligence")
+        cache.forget_title_alias("generative ai")
+        return {
+            "success": by_alias == "Generative artificial intelligence"
+            and by_canonical == "Generative artificial intelligence"
+            and cache.get_canonical_title("Generative AI") is None,
+            "data": {"alias": by_alias, "canonical": by_canonical},
+        }
+
+    def test_resolve_single_fetch(self):
+        handler = ResearchHandler.__new__(ResearchHandler)
+        handler.research_cache = self._cache("resolve")
+        known = {"Generative artificial intelligence"}
+        fetched = []
+        searches = []
+
+        def page(title, auto_suggest=True):
+            fetched.append(title)
+            if title not in known:
+                raise wikipedia.exceptions.PageError(title)
+            return SimpleNamespace(title=title)
+
+        def search(query, results=10):
+            searches.append(query)
+            return ["Generative artificial intelligence"]
+
+        with mock.patch.object(wikipedia, "page", side_effect=page), mock.patch.object(
+            wikipedia, "search", side_effect=search
+        ):
+            first = handler.resolve_wiki_page("generative ai")
+            first_cost = (len(fetched), len(searches))
+            fetched.clear()
+            second = handler.resolve_wiki_page("  Generative   AI ")
+            second_cost = (len(fetched), len(searches))
+
+        return {
+            "success": first.title == second.title == "Generative artificial intelligence"
+            and first_cost == (2, 1)
+            and second_cost == (1, 1),
+            "data": {"first": first_cost, "second": second_cost},
+        }
+
+    @staticmethod
+    def _sentences(prefix: str, count: int) -> str:
+        return " ".join(
+            f"{prefix} sentence {n} describes how synthesizers shape modern sound design."
+            for n in range(count)
+        )
+
+    def test_chunk_min_size(self):
+        ingestor = WikiIngestor(FakeVectorDB(), None)
+        leading = ingestor.chunk_section(f"Short intro.\n{self._sentences('Body', 40)}")
+        trailing = ingestor.chunk_section(f"{self._sentences('Body', 25)}\nThe end.")
+        tiny = ingestor.chunk_section("Only a stub.")
+        sizes = [len(chunk) for chunk in leading + trailing]
+        return {
+            "success": len(leading) > 1
+            and leading[0].startswith("Short intro.\nBody sentence 0")
+            and trailing[-1].endswith("The end.")
+            and all(size >= ingestor.min_chunk_size for size in sizes)
+            and all(size <= ingestor.chunk_size + ingestor.min_chunk_size for size in sizes)
+            and tiny == ["Only a stub."],
+            "data": {"sizes": sizes},
+        }
+
+    def test_ingest_dedup(self):
+        vector_db = FakeVectorDB()
+        ingestor = WikiIngestor(vector_db, self._cache("ingest"))
+        content = (
+            f"{self._sentences('Intro', 10)}\n== History ==\n{self._sentences('History', 30)}"
+            "\n== References ==\nSmith 2001."
+        )
+        first = ingestor.ingest_page("Synthesizer", "https://en.wikipedia.org/wiki/Synthesizer", content)
+        upserts = len(vector_db.upserted)
+        second = ingestor.ingest_page("Synthesizer", "https://en.wikipedia.org/wiki/Synthesizer", content)
+        chunks = ingestor.build_chunks("Synthesizer", "", content)
+        return {
+            "success": first["ingested"] == upserts > 1
+            and second["ingested"] == 0
+            and len(vector_db.upserted) == upserts
+            and all(c["metadata"]["section"] != "References" for c in chunks)
+            and len({c["id"] for c in chunks}) == len(chunks),
+            "data": {"chunks": upserts, "sections": sorted({c["metadata"]["section"] for c in chunks})},
+        }
+
+    def test_topic_paging(self):
+        cache = self._cache("topics")
+        for n in range(20):
+            cache.store_page_manifest(f"Topic {n:02d}", "", f"hash{n}", ["c"] * n, 100)
+            cache.conn.execute(
+                "UPDATE wiki_page_manifest SET last_read_at = ? WHERE title = ?",
+                (1000 + n, f"Topic {n:02d}"),
+            )
+        cache.db.commit()
+
+        handler = ResearchHandler.__new__(ResearchHandler)
+        handler.research_cache = cache
+        handler.memory_handler = SimpleNamespace(get_owned_tools=lambda: [])
+        page_size = settings.RESEARCH_TOPICS_PAGE_SIZE
+        settings.RESEARCH_TOPICS_PAGE_SIZE = 15
+        try:
+            first = handler.handle_wiki_topics(SimpleNamespace(page=1))
+            second = handler.handle_wiki_topics(SimpleNamespace(page=2))
+            beyond = handler.handle_wiki_topics(SimpleNamespace(page=3))
+        finally:
+            settings.RESEARCH_TOPICS_PAGE_SIZE = page_size
+
+        offset_titles = [t["title"] for t in cache.list_topics(limit=3, offset=15)]
+        return {
+            "success": "page 1/2" in first["data"]
+            and "Topic 19" in first["data"]
+            and "Use page=2" in first["data"]
+            and "page 2/2" in second["data"]
+            and "Topic 04" in second["data"]
+            and "Topic 05" not in second["data"]
+            and not beyond["success"]
+            and offset_titles == ["Topic 04", "Topic 03", "Topic 02"],
+            "data": {"offset_titles": offset_titles},
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Research Index Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING RESEARCH INDEX STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Research index testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
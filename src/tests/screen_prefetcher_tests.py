@@ -0,0 +1,109 @@
+import threading
+import time
+from types import SimpleNamespace
+from src.managers.screen_prefetcher import ScreenPrefetcher
+from src.utils import log
+
+
+class CountingSource:
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    def get_home_snippet(self) -> str:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return f"{self.name} snippet"
+
+
+class ScreenPrefetcherTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_FRESH_REUSE": self.test_fresh_reuse,
+            "2_WAITS_ON_INFLIGHT": self.test_waits_on_inflight,
+            "3_CONCURRENT_INVALIDATE": self.test_concurrent_invalidate,
+        }
+
+    @staticmethod
+    def _prefetcher(delay: float = 0.0):
+        sources = {name: CountingSource(name, delay) for name in ScreenPrefetcher.SNIPPET_MODULES}
+        return ScreenPrefetcher(SimpleNamespace(**sources), {}), sources
+
+    def test_fresh_reuse(self):
+        prefetcher, sources = self._prefetcher()
+        for turn in range(3):
+            prefetcher.start("home")
+            prefetcher.wait()
+            prefetcher.get_notification_section()
+            if turn == 1:
+                prefetcher.invalidate("mail")
+        calls = {name: source.calls for name, source in sources.items()}
+        return {
+            "success": calls == {"mail": 2, "blog": 1, "social": 1},
+            "data": {"calls": calls, **prefetcher.get_stats()},
+        }
+
+    def test_waits_on_inflight(self):
+        prefetcher, sources = self._prefetcher(delay=0.2)
+        prefetcher.start("home")
+        snippet = prefetcher.get_snippet("mail")
+        return {
+            "success": snippet == "mail snippet"
+            and sources["mail"].calls == 1
+            and prefetcher.get_stats()["hits"] == 1,
+            "data": prefetcher.get_stats(),
+        }
+
+    def test_concurrent_invalidate(self):
+        prefetcher, _ = self._prefetcher()
+        stop = threading.Event()
+        errors = []
+
+        def watcher():
+            while not stop.is_set():
+                prefetcher.invalidate("mail")
+
+        thread = threading.Thread(target=watcher)
+        thread.start()
+        try:
+            for _ in range(200):
+                prefetcher.start("home")
+                prefetcher.wait()
+                prefetcher.get_notification_section()
+        except Exception as e:
+            errors.append(repr(e))
+        finally:
+            stop.set()
+            thread.join(timeout=10)
+        return {"success": not errors, "data": errors or prefetcher.get_stats()}
+
+    def run_all_tests(self):
+        log.info("🚀 Starting Screen Prefetcher Test Suite...")
+        print("=" * 80)
+
+        results = {}
+
+        for step_name, test in self.steps.items():
+            log.info(f"--- 🧪 TESTING SCREEN PREFETCHER STEP: {step_name} ---")
+            try:
+                result = test()
+            except Exception as e:
+                log.error(f"Failed {step_name}: {str(e)}")
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                log.success(f"Result for {step_name}: {result.get('data')}")
+            else:
+                log.error(f"Result for {step_name}: {result}")
+            results[step_name] = result
+            print("\n" + "=" * 50 + "\n")
+
+        log.success("🏁 Screen prefetcher testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
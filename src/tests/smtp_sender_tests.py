@@ -0,0 +1,220 @@
+import smtplib
+import threading
+import time
+from collections import deque
+from email.message import EmailMessage
+from unittest import mock
+from src.handlers.email_handler import EmailHandler
+from src.settings import settings
+from src.utils import log
+from src.utils.smtp_sender import SmtpSender
+
+
+class FakeSMTP:
+    instances = []
+    failures = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.noop_code = 250
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def noop(self):
+        return self.noop_code, b""
+
+    def send_message(self, msg):
+        if FakeSMTP.failures:
+            raise FakeSMTP.failures.pop(0)
+        self.sent.append(msg)
+
+    def close(self):
+        self.closed = True
+
+    def quit(self):
+        self.closed = True
+
+
+class SmtpSenderTestSuite:
+    def __init__(self):
+        self.steps = {
+            "1_CONNECTION_REUSE": self.test_connection_reuse,
+            "2_NOOP_AFTER_IDLE": self.test_noop_after_idle,
+            "3_RECONNECT_ON_DISCONNECT": self.test_reconnect_on_disconnect,
+            "4_OUTBOX_RETRY": self.test_outbox_retry,
+            "5_PERMANENT_FAILURE": self.test_permanent_failure,
+            "6_WORKER_RESTART": self.test_worker_restart,
+            "7_XP_AFTER_DELIVERY": self.test_xp_after_delivery,
+        }
+
+    @staticmethod
+    def _message(n: int = 0) -> EmailMessage:
+        msg = EmailMessage()
+        msg["To"] = "human@example.com"
+        msg["Subject"] = f"Report {n}"
+        msg.set_content("body")
+        return msg
+
+    @staticmethod
+    def _sender() -> SmtpSender:
+        FakeSMTP.instances = []
+        FakeSMTP.failures = []
+        return SmtpSender("smtp.example.com", 587, "agent@example.com", "secret")
+
+    @staticmethod
+    def _delivered() -> int:
+        return sum(len(server.sent) for server in FakeSMTP.instances)
+
+    def test_connection_reuse(self):
+        sender = self._sender()
+        for n in range(3):
+            sender.send(self._message(n))
+        return {
+            "success": sender.connections == 1 and self._delivered() == 3,
+            "data": sender.get_stats(),
+        }
+
+    def test_noop_after_idle(self):
+        sender = self._sender()
+        sender.send(self._message())
+        sender._last_used -= settings.SMTP_NOOP_INTERVAL + 1
+        sender.send(self._message(1))
+        reused = sender.connections == 1
+
+        sender._last_used -= settings.SMTP_NOOP_INTERVAL + 1
+        FakeSMTP.instances[-1].noop_code = 421
+        sender.send(self._message(2))
+        return {
+            "success": reused
+            and sender.connections == 2
+            and FakeSMTP.instances[0].closed
+            and self._delivered() == 3,
+            "data": sender.get_stats(),
+        }
+
+    def test_reconnect_on_disconnect(self):
+        sender = self._sender()
+        sender.send(self._message())
+        FakeSMTP.failures = [smtplib.SMTPServerDisconnected("idle timeout")]
+        sender.send(self._message(1))
+        return {
+            "success": sender.connections == 2 and sender.sent == 2 and self._delivered() == 2,
+            "data": sender.get_stats(),
+        }
+
+    def test_outbox_retry(self):
+        sender = self._sender()
+        FakeSMTP.failures = [smtplib.SMTPResponseException(451, b"try again later")]
+        failures = []
+        sender.enqueue(self._message(), on_failure=lambda msg, e: failures.append(e))
+        flushed = sender.flush(timeout=10)
+        return {
+            "success": flushed and not failures and sender.failed == 0 and self._delivered() == 1,
+            "data": sender.get_stats(),
+        }
+
+    def test_permanent_failure(self):
+        sender = self._sender()
+        FakeSMTP.failures = [
+            smtplib.SMTPRecipientsRefused({"human@example.com": (550, b"no such user")}),
+            smtplib.SMTPResponseException(451, b"should not be retried"),
+        ]
+        failures = []
+        sender.enqueue(self._message(), on_failure=lambda msg, e: failures.append(e))
+        sender.flush(timeout=10)
+        return {
+            "success": len(failures) == 1
+            and isinstance(failures[0], smtplib.SMTPRecipientsRefused)
+            and len(FakeSMTP.failures) == 1
+            and sender.failed == 1,
+            "data": sender.get_stats(),
+        }
+
+    def test_worker_restart(self):
+        sender = self._sender()
+        sender.enqueue(self._message())
+        sender.flush(timeout=10)
+        first_worker = sender._worker
+
+        deadline = time.monotonic() + 10
+        while sender._worker is not None and time.monotonic() < deadline:
+            time.sleep(0.1)
+        stopped = sender._worker is None
+
+        sender.enqueue(self._message(1))
+        flushed = sender.flush(timeout=10)
+        return {
+            "success": stopped
+            and flushed
+            and sender._worker is not first_worker
+            and self._delivered() == 2,
+            "data": sender.get_stats(),
+        }
+
+    def test_xp_after_delivery(self):
+        handler = EmailHandler.__new__(EmailHandler)
+        handler.smtp_sender = self._sender()
+        handler._outbox_sends = deque(maxlen=5)
+        handler._outbox_lock = threading.Lock()
+        FakeSMTP.failures = [
+            smtplib.SMTPRecipientsRefused({"human@example.com": (550, b"no such user")})
+        ]
+
+        previous = settings.SMTP_OUTBOX_ENABLED
+        settings.SMTP_OUTBOX_ENABLED = True
+        try:
+            handler._dispatch_message(self._message(0), xp_action="email_send")
+            handler._dispatch_message(self._message(1), xp_action="email_send")
+            handler._dispatch_message(self._message(2))
+            handler.smtp_sender.flush(timeout=10)
+        finally:
+            settings.SMTP_OUTBOX_ENABLED = previous
+
+        claimed = handler.claim_delivered_sends()
+        claimed_again = handler.claim_delivered_sends()
+        statuses = {send["subject"]: send["status"] for send in handler.get_outbox_sends()}
+        return {
+            "success": [send["subject"] for send in claimed] == ["Report 1"]
+            and not claimed_again
+            and statuses == {"Report 0": "failed", "Report 1": "sent", "Report 2": "sent"},
+            "data": statuses,
+        }
+
+    def run_all_tests(self):
+        log.info("🚀 Starting SMTP Sender Test Suite...")
+        print("=" * 80)
+
+        results = {}
+        retry_delay = settings.SMTP_OUTBOX_RETRY_DELAY
+        settings.SMTP_OUTBOX_RETRY_DELAY = 0
+
+        with mock.patch.object(smtplib, "SMTP", FakeSMTP):
+            for step_name, test in self.steps.items():
+                log.info(f"--- 🧪 TESTING SMTP SENDER STEP: {step_name} ---")
+                try:
+                    result = test()
+                except Exception as e:
+                    log.error(f"Failed {step_name}: {str(e)}")
+                    result = {"success": False, "error": str(e)}
+
+                if result["success"]:
+                    log.success(f"Result for {step_name}: {result.get('data')}")
+                else:
+                    log.error(f"Result for {step_name}: {result}")
+                results[step_name] = result
+                print("\n" + "=" * 50 + "\n")
+
+        settings.SMTP_OUTBOX_RETRY_DELAY = retry_delay
+        log.success("🏁 SMTP sender testing complete.")
+
+        successes = sum(1 for r in results.values() if r and r.get("success"))
+        total = len(results)
+        log.info(f"📊 Results: {successes}/{total} tests passed")
+
+        return results
@@ -0,0 +1,213 @@
+import atexit
+import functools
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+from src.settings import settings
+from src.utils import log
+
+
+class Database:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._shared = db_path == ":memory:"
+        self.commits = 0
+        self.deferred_commits = 0
+        self.rollbacks = 0
+        self._rollback_listeners: List[Callable[[], None]] = []
+
+        self._main_conn = self._open()
+        self.journal_mode = self._main_conn.execute("PRAGMA journal_mode").fetchone()[0]
+        log.debug(f"🗄️ SQLite ready: {self.db_path} (journal_mode={self.journal_mode})")
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=settings.DB_BUSY_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=settings.DB_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+
+        with self._lock:
+            live = []
+            for thread, other in self._connections:
+                if thread.is_alive():
+                    live.append((thread, other))
+                else:
+                    other.close()
+            live.append((threading.current_thread(), conn))
+            self._connections = live
+
+        self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA cache_size=-{int(settings.DB_CACHE_SIZE_KB)}")
+        conn.execute(f"PRAGMA mmap_size={int(settings.DB_MMAP_SIZE)}")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._shared:
+            conn = self._main_conn
+        else:
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._open()
+        self._flush_deferred()
+        return conn
+
+    # Any statement on this thread's connection must see the writes deferred
+    # before it, so they run first and stay uncommitted until the action's
+    # unit_of_work commits them.
+    def _flush_deferred(self):
+        pending = getattr(self._local, "deferred", None)
+        if not pending:
+            return
+        self._local.deferred = None
+        self._depth += 1
+        try:
+            self.run_deferred(pending)
+        finally:
+            self._depth -= 1
+            self._local.deferred = pending
+
+    @property
+    def in_transaction(self) -> bool:
+        conn = self._main_conn if self._shared else getattr(self._local, "conn", None)
+        return conn is not None and conn.in_transaction
+
+    @property
+    def _depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    @_depth.setter
+    def _depth(self, value: int):
+        self._local.depth = value
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        return self._depth > 0
+
+    @contextmanager
+    def unit_of_work(self):
+        conn = self.conn
+        self._depth += 1
+
+        failed = False
+        try:
+            yield conn
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                if failed:
+                    conn.rollback()
+                    with self._lock:
+                        self.rollbacks += 1
+                    self._notify_rollback()
+                else:
+                    conn.commit()
+                    with self._lock:
+                        self.commits += 1
+
+    @contextmanager
+    def deferring_writes(self):
+        pending: List[Tuple[Callable, tuple, dict]] = []
+        self._local.deferred = pending
+        try:
+            yield pending
+        finally:
+            self._local.deferred = None
+
+    def defer(self, write: Callable, *args, **kwargs) -> bool:
+        pending = getattr(self._local, "deferred", None)
+        if pending is None:
+            return False
+        pending.append((write, args, kwargs))
+        return True
+
+    def run_deferred(self, pending: List[Tuple[Callable, tuple, dict]]):
+        while pending:
+            write, args, kwargs = pending.pop(0)
+            write(*args, **kwargs)
+
+    def add_rollback_listener(self, callback: Callable[[], None]):
+        self._rollback_listeners.append(callback)
+
+    def _notify_rollback(self):
+        for callback in list(self._rollback_listeners):
+            try:
+                callback()
+            except Exception as e:
+                log.warning(f"⚠️ Rollback listener failed: {e}")
+
+    def commit(self):
+        if self._depth > 0:
+            with self._lock:
+                self.deferred_commits += 1
+            return
+        self.conn.commit()
+        with self._lock:
+            self.commits += 1
+
+    def get_stats(self) -> Dict:
+        return {
+            "journal_mode": self.journal_mode,
+            "commits": self.commits,
+            "deferred_commits": self.deferred_commits,
+            "rollbacks": self.rollbacks,
+        }
+
+    def close(self):
+        with self._lock:
+            connections = [conn for _, conn in self._connections]
+            self._connections = []
+
+        for conn in connections:
+            try:
+                conn.commit()
+                if conn is self._main_conn:
+                    conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def deferred_write(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.db.defer(method, self, *args, **kwargs):
+            return True
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+_databases: Dict[str, Database] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(db_path: str = None) -> Database:
+    db_path = db_path or settings.DB_PATH
+    key = db_path if db_path == ":memory:" else os.path.abspath(db_path)
+
+    with _databases_lock:
+        database = _databases.get(key)
+        if database is None:
+            database = Database(db_path)
+            _databases[key] = database
+            atexit.register(database.close)
+        return database
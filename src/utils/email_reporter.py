@@ -1,9 +1,9 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from src.settings import settings
 from src.utils import log
+from src.utils.smtp_sender import get_smtp_sender
 
 
 class EmailReporter:
@@ -96,8 +96,16 @@ class EmailReporter:
         msg["To"] = settings.EMAIL_TO
         msg.attach(MIMEText(html_body, "html"))
 
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.send_message(msg)
+        sender = get_smtp_sender(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            settings.SMTP_USER,
+            settings.SMTP_PASSWORD,
+        )
+        if settings.SMTP_OUTBOX_ENABLED:
+            sender.enqueue(msg)
+            log.success(f"📧 Report queued for {settings.EMAIL_TO}")
+            return
+
+        sender.send(msg)
         log.success(f"📧 Report sent to {settings.EMAIL_TO}")
@@ -0,0 +1,297 @@
+import base64
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+from src.settings import settings
+from src.utils import log
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+MIME_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+}
+
+
+def decode_data_uri(data_uri: str) -> Tuple[str, bytes]:
+    header, encoded = data_uri.split(",", 1)
+    mime_type = header[len("data:") :].split(";", 1)[0] or "image/png"
+    return mime_type, base64.b64decode(encoded)
+
+
+class ImageCache:
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.lock_path = os.path.join(cache_dir, "index.lock")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._index: Dict[str, Dict] = {}
+        self._total_bytes = 0
+        with self._lock, self._file_lock():
+            self._scan_blobs()
+
+    @staticmethod
+    def normalize_prompt(prompt: Optional[str]) -> str:
+        if not prompt:
+            return ""
+        cleaned = re.sub(r"[^\w\s]", " ", prompt.lower())
+        return " ".join(cleaned.split())
+
+    @classmethod
+    def make_key(cls, prompt: str, size: str, steps: int, seed: Optional[int], **extra) -> str:
+        parts = {
+            "prompt": cls.normalize_prompt(prompt),
+            "size": size,
+            "steps": steps,
+            "seed": seed,
+            **{k: cls.normalize_prompt(v) if isinstance(v, str) else v for k, v in extra.items()},
+        }
+        encoded = json.dumps(parts, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _file_lock(self):
+        with open(self.lock_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _save_index(self):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _blob_path(self, blob: str) -> str:
+        return os.path.join(self.blob_dir, blob)
+
+    def _scan_blobs(self):
+        self._index = self._load_index()
+        referenced = {entry["blob"] for entry in self._index.values()}
+        total = 0
+        for name in os.listdir(self.blob_dir):
+            path = self._blob_path(name)
+            if name not in referenced:
+                os.remove(path)
+                continue
+            total += os.path.getsize(path)
+
+        missing = [
+            key
+            for key, entry in self._index.items()
+            if not os.path.exists(self._blob_path(entry["blob"]))
+        ]
+        for key in missing:
+            del self._index[key]
+        if missing:
+            self._save_index()
+        self._total_bytes = total
+
+    @staticmethod
+    def _encode_data_uri(mime_type: str, image_bytes: bytes) -> str:
+        return f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+
+    def get_bytes(self, key: str) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self._index = self._load_index()
+                entry = self._index.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            path = self._blob_path(entry["blob"])
+            try:
+                with open(path, "rb") as f:
+                    image_bytes = f.read()
+            except OSError:
+                del self._index[key]
+                self.misses += 1
+                return None
+
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            self.hits += 1
+            return entry["mime_type"], image_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        cached = self.get_bytes(key)
+        if cached is None:
+            return None
+        log.success(f"🖼️ Image cache hit ({key[:12]})")
+        return self._encode_data_uri(*cached)
+
+    def put(self, key: str, data_uri: str):
+        try:
+            mime_type, image_bytes = decode_data_uri(data_uri)
+        except (ValueError, TypeError) as e:
+            log.warning(f"⚠️ Not caching malformed image data: {e}")
+            return
+
+        blob = f"{hashlib.sha256(image_bytes).hexdigest()}.{MIME_EXTENSIONS.get(mime_type, 'img')}"
+        path = self._blob_path(blob)
+
+        with self._lock, self._file_lock():
+            self._index = self._load_index()
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                with open(path, "wb") as f:
+                    f.write(image_bytes)
+
+            self._index[key] = {
+                "blob": blob,
+                "mime_type": mime_type,
+                "bytes": len(image_bytes),
+            }
+            self._evict(keep=blob)
+            self._save_index()
+
+    def _evict(self, keep: str):
+        blobs: Dict[str, Tuple[float, int]] = {}
+        for name in os.listdir(self.blob_dir):
+            try:
+                stat = os.stat(self._blob_path(name))
+            except OSError:
+                continue
+            blobs[name] = (stat.st_mtime, stat.st_size)
+        self._total_bytes = sum(size for _, size in blobs.values())
+
+        for blob, (_, size) in sorted(blobs.items(), key=lambda item: item[1][0]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if blob == keep:
+                continue
+            try:
+                os.remove(self._blob_path(blob))
+            except OSError:
+                continue
+            self._total_bytes -= size
+            for key in [k for k, e in self._index.items() if e["blob"] == blob]:
+                del self._index[key]
+            self.evictions += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+_image_cache: Optional[ImageCache] = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> Optional[ImageCache]:
+    global _image_cache
+    if not settings.IMAGE_CACHE_ENABLED:
+        return None
+
+    with _image_cache_lock:
+        if _image_cache is None:
+            _image_cache = ImageCache(
+                settings.IMAGE_CACHE_DIR, settings.IMAGE_CACHE_MAX_MB * 1024 * 1024
+            )
+        return _image_cache
+
+
+def cached_image(size: Optional[str] = None, steps: Optional[int] = None):
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = get_image_cache()
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop("self")
+
+            prompt = params.pop("prompt")
+            if size is None:
+                key_size = f"{params.pop('width')}x{params.pop('height')}"
+            else:
+                key_size = size
+            if steps is None:
+                key_steps = params.pop("num_inference_steps")
+            else:
+                key_steps = steps
+            seed = params.pop("seed", None)
+
+            key = ImageCache.make_key(prompt, key_size, key_steps, seed, **params)
+            cached = cache.get(key)
+            if cached:
+                if hasattr(self, "last_timings"):
+                    self.last_timings = {
+                        "load_seconds": 0.0,
+                        "inference_seconds": 0.0,
+                        "cache_hit": True,
+                    }
+                return cached
+
+            data_uri = func(self, *args, **kwargs)
+            if data_uri:
+                cache.put(key, data_uri)
+                stats = cache.get_stats()
+                log.debug(
+                    f"🖼️ Image cache: {stats['entries']} entries, "
+                    f"{stats['bytes'] // 1024}KB, hit rate {stats['hit_rate']:.0%}"
+                )
+            return data_uri
+
+        return wrapper
+
+    return decorator
@@ -1,7 +1,8 @@
 import socket
 import json
+import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from src.utils import log
 
 
@@ -12,6 +13,7 @@ class LiveBroadcaster:
         self.port = port
         self.socket = None
         self.connected = False
+        self._send_lock = threading.Lock()
         self._connect()
 
     def _connect(self):
@@ -30,7 +32,8 @@ class LiveBroadcaster:
 
         try:
             event_json = json.dumps(event, ensure_ascii=False) + "\n"
-            self.socket.sendall(event_json.encode("utf-8"))
+            with self._send_lock:
+                self.socket.sendall(event_json.encode("utf-8"))
         except Exception as e:
             log.warning(f"⚠️ Failed to broadcast event: {e}")
             self.connected = False
@@ -102,6 +105,20 @@ class LiveBroadcaster:
         }
         self._send_event(event)
 
+    def broadcast_new_mail(self, messages: List[Dict], unread: int):
+        event = {
+            "type": "new_mail",
+            "timestamp": datetime.now().isoformat(),
+            "data": {
+                "messages": [
+                    {"uid": m["uid"], "from": m["from"], "subject": m["subject"]}
+                    for m in messages
+                ],
+                "unread": unread,
+            },
+        }
+        self._send_event(event)
+
     def broadcast_session_end(self, summary: Dict):
         event = {
             "type": "session_end",
@@ -0,0 +1,182 @@
+import atexit
+import queue
+import smtplib
+import threading
+import time
+from email.message import Message
+from typing import Callable, Dict, Optional, Tuple
+from src.settings import settings
+from src.utils import log
+
+
+class SmtpSender:
+    def __init__(self, host: str, port: int, user: str, password: str):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self._outbox: "queue.Queue[Tuple[Message, Optional[Callable], Optional[Callable]]]" = (
+            queue.Queue()
+        )
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.connections = 0
+        self.sent = 0
+        self.failed = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=settings.SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.connections += 1
+        log.debug(f"📮 SMTP session opened: {self.user}@{self.host}:{self.port}")
+        return server
+
+    def _reset(self):
+        if self._server is not None:
+            try:
+                self._server.close()
+            except Exception:
+                pass
+        self._server = None
+
+    def _get_server(self) -> smtplib.SMTP:
+        if self._server is not None:
+            if time.monotonic() - self._last_used < settings.SMTP_NOOP_INTERVAL:
+                return self._server
+            try:
+                code, _ = self._server.noop()
+                if code == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._reset()
+
+        self._server = self._connect()
+        return self._server
+
+    def send(self, msg: Message):
+        with self._lock:
+            try:
+                try:
+                    self._get_server().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    log.debug("📮 SMTP session dropped, reconnecting")
+                    self._reset()
+                    self._get_server().send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                self._reset()
+                raise
+            self._last_used = time.monotonic()
+            self.sent += 1
+
+    def enqueue(
+        self,
+        msg: Message,
+        on_failure: Optional[Callable] = None,
+        on_success: Optional[Callable] = None,
+    ):
+        with self._worker_lock:
+            self._outbox.put((msg, on_failure, on_success))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain_outbox, name="smtp-outbox", daemon=True
+                )
+                self._worker.start()
+
+    @staticmethod
+    def _is_permanent(error: Exception) -> bool:
+        if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPAuthenticationError)):
+            return True
+        return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+    def _deliver(self, msg: Message) -> Optional[Exception]:
+        retries = max(0, settings.SMTP_OUTBOX_RETRIES)
+        for attempt in range(retries + 1):
+            try:
+                self.send(msg)
+                return None
+            except Exception as e:
+                if self._is_permanent(e) or attempt == retries:
+                    return e
+                delay = settings.SMTP_OUTBOX_RETRY_DELAY * 2**attempt
+                log.warning(f"⚠️ Outbox send to {msg['To']} failed ({e}), retrying in {delay}s")
+                time.sleep(delay)
+
+    def _drain_outbox(self):
+        while True:
+            try:
+                msg, on_failure, on_success = self._outbox.get(timeout=1)
+            except queue.Empty:
+                with self._worker_lock:
+                    if self._outbox.empty():
+                        self._worker = None
+                        return
+                continue
+
+            try:
+                error = self._deliver(msg)
+                if error is None:
+                    log.success(f"📤 Outbox delivered '{msg['Subject']}' to {msg['To']}")
+                    if on_success:
+                        on_success(msg)
+                else:
+                    self.failed += 1
+                    log.error(f"❌ Outbox gave up on '{msg['Subject']}' to {msg['To']}: {error}")
+                    if on_failure:
+                        on_failure(msg, error)
+            except Exception as e:
+                log.warning(f"⚠️ Outbox delivery handler raised: {e}")
+            finally:
+                self._outbox.task_done()
+
+    @property
+    def pending(self) -> int:
+        return self._outbox.unfinished_tasks
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        deadline = time.monotonic() + (timeout or settings.SMTP_OUTBOX_FLUSH_TIMEOUT)
+        while self.pending and time.monotonic() < deadline:
+            time.sleep(0.1)
+        return not self.pending
+
+    def close(self):
+        if self.pending and not self.flush():
+            log.warning(f"⚠️ {self.pending} queued email(s) not delivered before shutdown")
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    pass
+                self._server = None
+
+    def get_stats(self) -> Dict:
+        return {
+            "connections": self.connections,
+            "sent": self.sent,
+            "failed": self.failed,
+            "pending": self.pending,
+        }
+
+
+_senders: Dict[Tuple[str, int, str], SmtpSender] = {}
+_senders_lock = threading.Lock()
+
+
+def get_smtp_sender(host: str, port: int, user: str, password: str) -> SmtpSender:
+    key = (host, port, user)
+    with _senders_lock:
+        sender = _senders.get(key)
+        if sender is None:
+            sender = SmtpSender(host, port, user, password)
+            _senders[key] = sender
+            atexit.register(sender.close)
+        return sender